@@ -27,8 +27,10 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from powerapi.actor.socket_interface import SocketInterface, NotConnectedException
+from powerapi.actor.socket_interface import SocketInterface, NotConnectedException, UnknownTransportException
+from powerapi.actor.queue_interface import QueueInterface
 from powerapi.actor.supervisor import Supervisor, ActorInitError, ActorAlreadySupervisedException
 from powerapi.actor.supervisor import CrashConfigureError, FailConfigureError
 from powerapi.actor.state import State
-from powerapi.actor.actor import Actor, InitializationException
+from powerapi.actor.actor import Actor, InitializationException, UnknownExecutionModeException, \
+    UnsupportedTransportException
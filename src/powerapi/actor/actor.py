@@ -31,16 +31,24 @@ import logging
 import signal
 import multiprocessing
 import sys
+import threading
 import traceback
+from itertools import groupby
+
 import setproctitle
 
-from powerapi.exception import PowerAPIExceptionWithMessage, UnknownMessageTypeException
+from powerapi.exception import PowerAPIException, PowerAPIExceptionWithMessage, UnknownMessageTypeException
 from powerapi.message import PoisonPillMessage, Message
 from powerapi.handler import HandlerException, Handler
 
+from .queue_interface import QueueInterface
 from .socket_interface import SocketInterface
 from .state import State
 
+#: (tuple): Modes in which an actor can be executed, in its own process or in a
+#:          thread of the process that launched it
+EXECUTION_MODES = ('process', 'thread')
+
 
 class InitializationException(PowerAPIExceptionWithMessage):
     """
@@ -48,6 +56,29 @@ class InitializationException(PowerAPIExceptionWithMessage):
     """
 
 
+class UnknownExecutionModeException(PowerAPIException):
+    """
+    Exception raised when an actor is created with an execution mode that is
+    not in :data:`EXECUTION_MODES`
+    """
+
+    def __init__(self, execution_mode: str):
+        PowerAPIException.__init__(self)
+        self.execution_mode = execution_mode
+
+
+class UnsupportedTransportException(PowerAPIException):
+    """
+    Exception raised when an actor executed in its own process is created with
+    the `inproc` transport, whose endpoints can only be reached from the
+    process that bind them
+    """
+
+    def __init__(self, transport: str):
+        PowerAPIException.__init__(self)
+        self.transport = transport
+
+
 class Actor(multiprocessing.Process):
     """
     Abstract class that exposes an interface to create, setup and handle actors
@@ -66,6 +97,8 @@ class Actor(multiprocessing.Process):
     |                                 | :meth:`send_control <powerapi.actor.actor.Actor.send_control>`                             |
     |                                 +--------------------------------------------------------------------------------------------+
     |                                 | :meth:`send_data <powerapi.actor.actor.Actor.send_data>`                                   |
+    |                                 +--------------------------------------------------------------------------------------------+
+    |                                 | :meth:`flush_data <powerapi.actor.actor.Actor.flush_data>`                                 |
     +---------------------------------+--------------------------------------------------------------------------------------------+
     | Server interface                | :meth:`setup <powerapi.actor.actor.Actor.setup>`                                           |
     |                                 +--------------------------------------------------------------------------------------------+
@@ -83,7 +116,8 @@ class Actor(multiprocessing.Process):
     +---------------------------------+--------------------------------------------------------------------------------------------+
     """
 
-    def __init__(self, name, level_logger=logging.WARNING, timeout=None):
+    def __init__(self, name, level_logger=logging.WARNING, timeout=None, batch_size=1, batch_delay=10,
+                 serializer='pickle', transport='tcp', runtime_dir=None, execution_mode='process'):
         """
         Initialization and start of the process.
 
@@ -92,7 +126,29 @@ class Actor(multiprocessing.Process):
         :param int level_logger: Define the level of the logger
         :param int timeout: if defined, do something if no msg is recv every
                             timeout (in ms)
-        """
+        :param int batch_size: maximum number of data messages sent to this
+                               actor in one batch (1 disable batching)
+        :param int batch_delay: maximum time (in ms) a data message sent to
+                                this actor can wait in a batch
+        :param str serializer: name of the serializer used to encode the
+                               messages sent to this actor
+        :param str transport: transport used by the sockets of this actor
+                              (`tcp` or `ipc`), the actors executed in a
+                              thread don't use sockets
+        :param str runtime_dir: directory where the `ipc` endpoints of this
+                                actor are created
+        :param str execution_mode: `process` to execute the actor in its own
+                                   process or `thread` to execute it in a
+                                   thread of the process that launch it. A
+                                   thread actor exchange messages through
+                                   in-memory queues and can only be reached
+                                   from this process
+        """
+        if execution_mode not in EXECUTION_MODES:
+            raise UnknownExecutionModeException(execution_mode)
+        if execution_mode == 'process' and transport == 'inproc':
+            raise UnsupportedTransportException(transport)
+
         multiprocessing.Process.__init__(self, name=name)
 
         #: (logging.Logger): Logger
@@ -108,8 +164,18 @@ class Actor(multiprocessing.Process):
         #: (powerapi.State): Actor context
         self.state = State(self)
 
+        #: (str): Mode in which the actor is executed
+        self.execution_mode = execution_mode
+
+        #: (threading.Thread): Thread executing the actor in thread mode
+        self._thread = None
+
         #: (powerapi.SocketInterface): Actor's SocketInterface
-        self.socket_interface = SocketInterface(name, timeout)
+        if execution_mode == 'thread':
+            self.socket_interface = QueueInterface(name, timeout)
+        else:
+            self.socket_interface = SocketInterface(name, timeout, batch_size, batch_delay, serializer, transport,
+                                                    runtime_dir)
 
         #: (func): Actor behaviour
         self.behaviour = Actor._initial_behaviour
@@ -117,6 +183,48 @@ class Actor(multiprocessing.Process):
         #: (List): list of exception that restart the actor it they are raised
         self.low_exception = []
 
+    def start(self):
+        """
+        Start the execution of the actor, in a new process or in a new thread
+        of the current process
+        """
+        if self.execution_mode == 'process':
+            multiprocessing.Process.start(self)
+            return
+
+        self._thread = threading.Thread(target=self.run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def is_alive(self):
+        """
+        :return: True if the process or the thread executing the actor is alive
+        """
+        if self.execution_mode == 'process':
+            return multiprocessing.Process.is_alive(self)
+
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout=None):
+        """
+        Wait until the process or the thread executing the actor terminates
+
+        :param float timeout: maximum time to wait (in seconds)
+        """
+        if self.execution_mode == 'process':
+            multiprocessing.Process.join(self, timeout)
+        elif self._thread is not None:
+            self._thread.join(timeout)
+
+    def terminate(self):
+        """
+        Terminate the actor, a thread actor is hard killed as a thread can't be
+        terminated
+        """
+        if self.execution_mode == 'process':
+            multiprocessing.Process.terminate(self)
+        else:
+            self.hard_kill()
+
     def run(self):
         """
         Main code executed by the actor
@@ -161,16 +269,20 @@ class Actor(multiprocessing.Process):
          - setup the socket interface
          - setup the signal handler
 
-        This method is called before entering on the behaviour loop
+        This method is called before entering on the behaviour loop, the
+        process name and the signal handler are left to the process that
+        execute a thread actor
         """
-        # Name process
-        setproctitle.setproctitle(self.name)
+        if self.execution_mode == 'process':
+            # Name process
+            setproctitle.setproctitle(self.name)
 
         self.socket_interface.setup()
 
-        self.logger.debug('Actor "%s" process created', self.name)
+        self.logger.debug('Actor "%s" %s created', self.name, self.execution_mode)
 
-        self._signal_handler_setup()
+        if self.execution_mode == 'process':
+            self._signal_handler_setup()
 
         self.setup()
 
@@ -192,6 +304,16 @@ class Actor(multiprocessing.Process):
         """
         self.state.add_handler(message_type, handler)
 
+    def set_timeout_handler(self, handler: Handler):
+        """
+        Define the handler called when no message is received during the
+        actor timeout
+
+        :param handler: handler whose `handle_timeout` method is called
+        :type handler: powerapi.handler.Handler
+        """
+        self.state.timeout_handler = handler
+
     def set_behaviour(self, new_behaviour):
         """
         Set a new behaviour
@@ -207,11 +329,19 @@ class Actor(multiprocessing.Process):
 
         If the message is None, call the timout_handler otherwise find the
         handler correponding to the message type and call it on the message.
+        A batch of messages is given to the handlers in one call for each run
+        of messages of the same type.
         """
 
         msg = self.receive()
         if msg is None:
-            return  # Timeout
+            if self.state.timeout_handler is not None:
+                self.state.timeout_handler.handle_timeout()
+            return
+
+        if isinstance(msg, list):
+            self._handle_batch(msg)
+            return
 
         try:
             handler = self.state.get_corresponding_handler(msg)
@@ -221,6 +351,23 @@ class Actor(multiprocessing.Process):
         except HandlerException:
             self.logger.warning("Failed to handle message: %s", msg)
 
+    def _handle_batch(self, msgs):
+        """
+        Handle a batch of messages, consecutive messages of the same type are
+        given together to their handler
+
+        :param list msgs: the messages received by the actor
+        """
+        for _, group in groupby(msgs, key=lambda msg: msg.__class__.__name__):
+            group = list(group)
+            try:
+                handler = self.state.get_corresponding_handler(group[0])
+                handler.handle_batch(group)
+            except UnknownMessageTypeException:
+                self.logger.warning("Unknown message type: %s", group[0])
+            except HandlerException:
+                self.logger.warning("Failed to handle messages: %s", group)
+
     def _kill_process(self):
         """
         Kill the actor (close sockets)
@@ -269,6 +416,21 @@ class Actor(multiprocessing.Process):
         self.socket_interface.send_data(msg)
         self.logger.debug('Send data to actor "%s" : %s ', self.name, msg)
 
+    def send_data_many(self, msgs: list):
+        """
+        Send several msgs to this actor using the data canal, in one batch
+
+        :param list msgs: the messages to send to this actor
+        """
+        self.socket_interface.send_data_many(msgs)
+        self.logger.debug('Send %d data to actor "%s"', len(msgs), self.name)
+
+    def flush_data(self):
+        """
+        Send the data messages waiting in the batch of this actor data canal
+        """
+        self.socket_interface.flush_data()
+
     def receive(self):
         """
         Block until a message was received (or until timeout) an return the
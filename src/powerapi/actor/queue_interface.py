@@ -0,0 +1,178 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import queue
+import threading
+import time
+
+from .socket_interface import NotConnectedException, receive_delay
+
+
+class QueueInterface:
+    """
+    Interface to handle comunication to/from an actor executed in a thread of
+    the process that launched it
+
+    The messages are exchanged through in-memory queues, they are neither
+    serialized nor copied: a message must not be modified once it has been
+    sent. The actor can only be reached from the process that launched it.
+
+    It exposes the same methods as :class:`SocketInterface
+    <powerapi.actor.socket_interface.SocketInterface>`
+    """
+
+    def __init__(self, name, timeout):
+        """
+        :param str name: name of the actor using this interface
+        :param int timeout: time in millisecond to wait for a message
+        """
+        self.logger = logging.getLogger(name)
+
+        #: (int): Time in millisecond to wait for a message before execute
+        #:        timeout_handler
+        self.timeout = timeout
+
+        #: (queue.SimpleQueue): Data and control messages sent to the actor
+        self.mailbox = queue.SimpleQueue()
+
+        #: (queue.SimpleQueue): Control messages sent by the actor
+        self.control_replies = queue.SimpleQueue()
+
+        #: (bool): True if the data canal was opened
+        self.data_connected = False
+
+        #: (bool): True if the control canal was opened
+        self.control_connected = False
+
+        # Identifier of the thread executing the actor, the control messages
+        # it sends are answers to its controller
+        self._actor_thread_id = None
+
+    def setup(self):
+        """
+        Initialize the interface on the thread executing the actor
+        """
+        self._actor_thread_id = threading.get_ident()
+
+    def connect_data(self):
+        """
+        Open the data canal of this actor
+        """
+        self.data_connected = True
+
+    def connect_control(self):
+        """
+        Open the control canal of this actor
+        """
+        self.control_connected = True
+
+    def receive(self):
+        """
+        Block until a message was received (or until timeout) an return the
+        received message
+
+        The pending data batches of the thread are sent when their delay
+        expire while waiting.
+
+        :return: the received message or None if timeout
+        :rtype: Object or None
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout / 1000
+        while True:
+            timeout = receive_delay(deadline)
+            try:
+                return self.mailbox.get(timeout=None if timeout is None else timeout / 1000)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None
+
+    def receive_control(self, timeout):
+        """
+        Block until a message was sent by the actor on the control canal (or
+        until timeout) an return the received message
+
+        :return: the received message or None if timeout
+        :rtype: Object or None
+        """
+        if not self.control_connected:
+            raise NotConnectedException
+
+        try:
+            return self.control_replies.get(timeout=None if timeout is None else timeout / 1000)
+        except queue.Empty:
+            return None
+
+    def send_control(self, msg):
+        """
+        Send a message on the control canal, from the actor to its controller
+        or from the controller to the actor
+
+        :param Object msg: message to send
+        """
+        if threading.get_ident() == self._actor_thread_id:
+            self.control_replies.put(msg)
+            return
+
+        if not self.control_connected:
+            raise NotConnectedException()
+        self.mailbox.put(msg)
+
+    def send_data(self, msg):
+        """
+        Send a message on data canal
+
+        :param Object msg: message to send
+        """
+        if not self.data_connected:
+            raise NotConnectedException()
+        self.mailbox.put(msg)
+
+    def send_data_many(self, msgs: list):
+        """
+        Send several messages on data canal, in one batch
+
+        :param list msgs: messages to send
+        """
+        if not self.data_connected:
+            raise NotConnectedException()
+        if len(msgs) == 1:
+            self.mailbox.put(msgs[0])
+        elif msgs:
+            self.mailbox.put(list(msgs))
+
+    def flush_data(self):
+        """
+        The data messages are never kept in a batch, nothing to do
+        """
+
+    def close(self):
+        """
+        Nothing to release, the queues are garbage collected with the actor
+        """
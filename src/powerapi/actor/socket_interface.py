@@ -30,13 +30,73 @@
 import ctypes
 import logging
 import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
 
 import zmq
 
 from powerapi.exception import PowerAPIException
+from powerapi.serializer import get_serializer
 
 LOCAL_ADDR = 'tcp://127.0.0.1'
 
+#: (tuple): Transports that can be used by the actor sockets
+TRANSPORTS = ('tcp', 'ipc', 'inproc')
+
+#: (str): Directory where the ipc endpoints are created if no runtime directory is given
+DEFAULT_RUNTIME_DIR = os.path.join(tempfile.gettempdir(), 'powerapi')
+
+
+class _PendingBatches(threading.local):
+    """
+    Interfaces that have data messages waiting to be sent, each thread sends
+    its own batches
+    """
+
+    def __init__(self):
+        threading.local.__init__(self)
+        self.interfaces = set()
+
+
+_pending_batches = _PendingBatches()
+
+
+def flush_expired_batches():
+    """
+    Send the pending data batches of the current thread that have waited longer than their batch delay
+
+    :return: the time in millisecond before the next pending batch expires, or None if no batch is pending
+    :rtype: int or None
+    """
+    next_expiration = None
+    now = time.monotonic()
+    for socket_interface in list(_pending_batches.interfaces):
+        remaining = socket_interface.batch_delay - (now - socket_interface.batch_start_time) * 1000
+        if remaining <= 0:
+            socket_interface.flush_data()
+        elif next_expiration is None or remaining < next_expiration:
+            next_expiration = remaining
+
+    return None if next_expiration is None else int(next_expiration) + 1
+
+
+def receive_delay(deadline):
+    """
+    Send the expired pending data batches of the current thread and compute how long a receive can wait
+
+    :param deadline: monotonic time at which the receive times out, or None if it never times out
+    :return: the time in millisecond to wait before the next check, or None to wait indefinitely
+    :rtype: float or None
+    """
+    timeout = None if deadline is None else max(0, (deadline - time.monotonic()) * 1000)
+    next_flush = flush_expired_batches()
+    if next_flush is not None and (timeout is None or next_flush < timeout):
+        return next_flush
+    return timeout
+
 
 class NotConnectedException(PowerAPIException):
     """
@@ -45,6 +105,37 @@ class NotConnectedException(PowerAPIException):
     """
 
 
+class UnknownTransportException(PowerAPIException):
+    """
+    Exception raised when a socket interface is created with a transport that
+    is not in :data:`TRANSPORTS`
+    """
+
+    def __init__(self, transport: str):
+        PowerAPIException.__init__(self)
+        self.transport = transport
+
+
+class _DataCanal:
+    """
+    Client side of the data canal of an actor, used by a single thread
+    """
+
+    def __init__(self):
+        #: (zmq.Socket): ZMQ Push socket for sending message to the actor
+        self.push_socket = None
+
+        #: (list): Data messages waiting to be sent
+        self.batch = []
+
+        #: (float): Time at which the first message of the batch was queued
+        self.batch_start_time = 0
+
+
+#: (_DataCanal): Data canal of the threads that are not connected to an actor
+_UNCONNECTED_DATA_CANAL = _DataCanal()
+
+
 class SocketInterface:
     """
     Interface to handle comunication to/from the actor
@@ -58,6 +149,7 @@ class SocketInterface:
     - :meth:`connect_data <powerapi.actor.socket_interface.SocketInterface.connect_data>`
     - :meth:`connect_control <powerapi.actor.socket_interface.SocketInterface.connect_control>`
     - :meth:`send_data <powerapi.actor.socket_interface.SocketInterface.send_data>`
+    - :meth:`flush_data <powerapi.actor.socket_interface.SocketInterface.flush_data>`
     - :meth:`close <powerapi.actor.socket_interface.SocketInterface.close>`
 
     server interface methods :
@@ -67,17 +159,47 @@ class SocketInterface:
     - :meth:`close <powerapi.actor.socket_interface.SocketInterface.close>`
     """
 
-    def __init__(self, name, timeout):
+    def __init__(self, name, timeout, batch_size=1, batch_delay=10, serializer='pickle', transport='tcp',
+                 runtime_dir=None):
         """
         :param str name: name of the actor using this interface
         :param int timeout: time in millisecond to wait for a message
+        :param int batch_size: maximum number of data messages sent together
+                               in one multipart message (1 disable batching)
+        :param int batch_delay: maximum time in millisecond a data message can
+                                wait in a batch before being sent
+        :param str serializer: name of the serializer used to encode the
+                               messages (see :mod:`powerapi.serializer`)
+        :param str transport: transport used by the sockets of the actor,
+                              `tcp` (loopback), `ipc` (unix domain socket) or
+                              `inproc` (actors running in the same process)
+        :param str runtime_dir: directory where the `ipc` endpoints are created
         """
+        if transport not in TRANSPORTS:
+            raise UnknownTransportException(transport)
+
         self.logger = logging.getLogger(name)
 
         #: (int): Time in millisecond to wait for a message before execute
         #:        timeout_handler
         self.timeout = timeout
 
+        #: (int): Maximum number of data messages sent in one multipart message
+        self.batch_size = batch_size
+
+        #: (int): Maximum time in millisecond a data message can wait before
+        #:        being sent
+        self.batch_delay = batch_delay
+
+        #: (powerapi.serializer.Serializer): Serializer used to encode the messages
+        self.serializer = get_serializer(serializer)
+
+        #: (str): Transport used by the sockets of the actor
+        self.transport = transport
+
+        #: (str): Directory where the ipc endpoints are created
+        self.runtime_dir = DEFAULT_RUNTIME_DIR if runtime_dir is None else runtime_dir
+
         #: (str): Address of the pull socket
         self.pull_socket_address = None
 
@@ -93,11 +215,17 @@ class SocketInterface:
         #: (zmq.Socket): ZMQ Pair socket for receiving control message
         self.control_socket = None
 
-        # This socket is used to connect to the pull socket of this actor. It
+        #: (list): Paths of the ipc endpoints bound by this interface, libzmq
+        #:         doesn't remove them when the sockets are closed
+        self.bound_ipc_paths = []
+
+        # The push sockets used to connect to the pull socket of this actor
         # won't be created on the actor's process but on the process that want
-        # to connect to the pull socket of this actor
-        #: (zmq.Socket): ZMQ Push socket for sending message to this actor
-        self.push_socket = None
+        # to connect to the pull socket of this actor. Each thread of this
+        # process (actors executed in threads) has its own push socket, the
+        # canals inherited from a parent process are never used
+        #: (dict): Data canals of the (process, thread) connected to this actor
+        self._data_canals = {}
 
         # Shared memory used to communicate the port used to bind sockets
         self._pull_port = multiprocessing.Value(ctypes.c_int)
@@ -107,43 +235,118 @@ class SocketInterface:
         self._pull_port.value = -1
         self._ctrl_port.value = -1
 
+        # ipc and inproc endpoints are named before the actor process is
+        # started, the handshake only tells the other processes that they are
+        # bound
+        endpoint_prefix = self._endpoint_prefix()
+        self._pull_endpoint = None if endpoint_prefix is None else endpoint_prefix + '-pull'
+        self._ctrl_endpoint = None if endpoint_prefix is None else endpoint_prefix + '-ctrl'
+
+    @property
+    def _data_canal(self):
+        """
+        (_DataCanal): Data canal of the current thread, an unconnected canal
+        if the current thread is not connected to this actor
+        """
+        return self._data_canals.get((os.getpid(), threading.get_ident()), _UNCONNECTED_DATA_CANAL)
+
+    @property
+    def push_socket(self):
+        """
+        (zmq.Socket): ZMQ Push socket used by the current thread for sending
+        message to this actor
+        """
+        return self._data_canal.push_socket
+
+    @property
+    def batch(self):
+        """
+        (list): Data messages of the current thread waiting to be sent
+        """
+        return self._data_canal.batch
+
+    @property
+    def batch_start_time(self):
+        """
+        (float): Time at which the first message of the current thread batch
+        was queued
+        """
+        return self._data_canal.batch_start_time
+
+    def _endpoint_prefix(self):
+        """
+        Generate the unique prefix of the endpoints of this interface
+
+        :return: the prefix of the endpoints or None if the sockets are bound
+                 to random tcp ports
+        :rtype: str or None
+        """
+        if self.transport == 'ipc':
+            return 'ipc://' + os.path.join(self.runtime_dir, uuid.uuid4().hex)
+
+        if self.transport == 'inproc':
+            return 'inproc://' + uuid.uuid4().hex
+
+        return None
+
+    def _endpoint_address(self, endpoint, port):
+        """
+        :return: the address of an endpoint of this interface, from its name or
+                 from the port where it was bound
+        :rtype: str
+        """
+        if endpoint is not None:
+            return endpoint
+        return LOCAL_ADDR + ':' + str(port)
+
     def setup(self):
         """
         Initialize sockets and send the selected port number to the father
         process with a Pipe
         """
+        if self.transport == 'ipc':
+            os.makedirs(self.runtime_dir, exist_ok=True)
+
         # create the pull socket (to communicate with this actor, others
         # process have to connect a push socket to this socket)
-        self.pull_socket, pull_port = self._create_socket(zmq.PULL, -1)
+        self.pull_socket, pull_port = self._create_socket(zmq.PULL, -1, self._pull_endpoint)
 
         # create the control socket (to control this actor, a process have to
         # connect a pair socket to this socket with the `control` method)
-        self.control_socket, ctrl_port = self._create_socket(zmq.PAIR, 0)
+        self.control_socket, ctrl_port = self._create_socket(zmq.PAIR, 0, self._ctrl_endpoint)
 
-        self.pull_socket_address = LOCAL_ADDR + ':' + str(pull_port)
-        self.control_socket_address = LOCAL_ADDR + ':' + str(ctrl_port)
+        self.pull_socket_address = self._endpoint_address(self._pull_endpoint, pull_port)
+        self.control_socket_address = self._endpoint_address(self._ctrl_endpoint, ctrl_port)
 
         self._pull_port.value = pull_port
         self._ctrl_port.value = ctrl_port
         self._values_available.set()
 
-    def _create_socket(self, socket_type, linger_value):
+    def _create_socket(self, socket_type, linger_value, endpoint=None):
         """
-        Create a socket of the given type, bind it to a random port and
-        register it to the poller
+        Create a socket of the given type, bind it to the given endpoint (or to
+        a random port if no endpoint is given) and register it to the poller
 
         :param int socket_type: type of the socket to open
         :param int linger_value: -1 mean wait for receive all msg and block
                                  closing 0 mean hardkill the socket even if msg
                                  are still here.
+        :param str endpoint: ipc or inproc endpoint where the socket is bound
         :return (zmq.Socket, int): the initialized socket and the port where the
-                                   socket is bound
+                                   socket is bound (0 if bound to an endpoint)
         """
         socket = zmq.Context.instance().socket(socket_type)
         socket.setsockopt(zmq.LINGER, linger_value)
-        port_number = socket.bind_to_random_port(LOCAL_ADDR)
+        if endpoint is None:
+            port_number = socket.bind_to_random_port(LOCAL_ADDR)
+            self.logger.debug('Bind socket to %s:%d', LOCAL_ADDR, port_number)
+        else:
+            port_number = 0
+            socket.bind(endpoint)
+            self.logger.debug('Bind socket to %s', endpoint)
+            if endpoint.startswith('ipc://'):
+                self.bound_ipc_paths.append(endpoint[len('ipc://'):])
         self.poller.register(socket, zmq.POLLIN)
-        self.logger.debug('Bind socket to %s:%d', LOCAL_ADDR, port_number)
         return (socket, port_number)
 
     def receive(self):
@@ -151,15 +354,21 @@ class SocketInterface:
         Block until a message was received (or until timeout) an return the
         received messages
 
-        :return: the list of received messages or None if timeout
-        :rtype: a list of Object or None
-        """
-        events = dict(self.poller.poll(self.timeout))
+        The pending data batches of the process are sent when their delay
+        expire while waiting.
 
-        if len(events) == 0:
-            return None
+        :return: the received message, the list of received messages if they
+                 were sent as a batch or None if timeout
+        :rtype: Object, a list of Object or None
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout / 1000
+        while True:
+            events = dict(self.poller.poll(receive_delay(deadline)))
+            if len(events) != 0:
+                return self._recv_serialized(next(iter(events)))
 
-        return self._recv_serialized(next(iter(events)))
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
 
     def receive_control(self, timeout):
         """
@@ -183,8 +392,12 @@ class SocketInterface:
     def close(self):
         """
         Close all socket handle by this interface
+
+        The pending data batch is sent before closing the push socket, the
+        files of the bound ipc endpoints are removed.
         """
         if self.push_socket is not None:
+            self.flush_data()
             self.push_socket.close()
 
         if self.pull_socket is not None:
@@ -193,43 +406,65 @@ class SocketInterface:
         if self.control_socket is not None:
             self.control_socket.close()
 
-    @staticmethod
-    def _send_serialized(socket: zmq.Socket, msg):
+        for path in self.bound_ipc_paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self.bound_ipc_paths.clear()
+
+    def _send_serialized(self, socket: zmq.Socket, msg):
         """
         Send a message to the given socket.
         :param socket: Socket to use
         :param msg: Message to send
         """
-        socket.send_pyobj(msg)
+        socket.send(self.serializer.dumps(msg))
+
+    def _send_serialized_batch(self, socket: zmq.Socket, msgs: list):
+        """
+        Send a list of messages to the given socket, each message is sent in
+        its own frame of a single multipart message.
+        :param socket: Socket to use
+        :param msgs: Messages to send
+        """
+        socket.send_multipart(list(map(self.serializer.dumps, msgs)))
 
-    @staticmethod
-    def _recv_serialized(socket: zmq.Socket):
+    def _recv_serialized(self, socket: zmq.Socket):
         """
         Receive and returns a message from the given socket.
         :param socket: Socket to use
-        :return: Message received
+        :return: Message received, or the list of messages if a batch was received
         """
-        return socket.recv_pyobj()
+        frames = socket.recv_multipart()
+        if len(frames) == 1:
+            return self.serializer.loads(frames[0])
+
+        return list(map(self.serializer.loads, frames))
 
     def connect_data(self):
         """
         Connect to the pull socket of this actor
 
         Open a push socket on the process that want to communicate with this
-        actor
+        actor, the push socket already opened by the current thread is reused
 
         this method shouldn't be called if socket interface was not initialized
         with the setup method
         """
+        if self.push_socket is not None and not self.push_socket.closed:
+            return
 
         if self.pull_socket_address is None:
             self._values_available.wait()
-            self.pull_socket_address = LOCAL_ADDR + ':' + str(self._pull_port.value)
-            self.control_socket_address = LOCAL_ADDR + ':' + str(self._ctrl_port.value)
-
-        self.push_socket = zmq.Context.instance().socket(zmq.PUSH)
-        self.push_socket.setsockopt(zmq.LINGER, -1)
-        self.push_socket.connect(self.pull_socket_address)
+            self.pull_socket_address = self._endpoint_address(self._pull_endpoint, self._pull_port.value)
+            self.control_socket_address = self._endpoint_address(self._ctrl_endpoint, self._ctrl_port.value)
+
+        data_canal = _DataCanal()
+        data_canal.push_socket = zmq.Context.instance().socket(zmq.PUSH)
+        data_canal.push_socket.setsockopt(zmq.LINGER, -1)
+        data_canal.push_socket.connect(self.pull_socket_address)
+        self._data_canals[(os.getpid(), threading.get_ident())] = data_canal
         self.logger.debug('Connected data socket to %s', self.pull_socket_address)
 
     def connect_control(self):
@@ -242,8 +477,8 @@ class SocketInterface:
         """
         if self.pull_socket_address is None:
             self._values_available.wait()
-            self.pull_socket_address = LOCAL_ADDR + ':' + str(self._pull_port.value)
-            self.control_socket_address = LOCAL_ADDR + ':' + str(self._ctrl_port.value)
+            self.pull_socket_address = self._endpoint_address(self._pull_endpoint, self._pull_port.value)
+            self.control_socket_address = self._endpoint_address(self._ctrl_endpoint, self._ctrl_port.value)
 
         self.control_socket = zmq.Context.instance().socket(zmq.PAIR)
         self.control_socket.setsockopt(zmq.LINGER, 0)
@@ -259,14 +494,71 @@ class SocketInterface:
 
         if self.control_socket is None:
             raise NotConnectedException()
+
+        # Control messages must not overtake the data messages already sent
+        self.flush_data()
         self._send_serialized(self.control_socket, msg)
 
     def send_data(self, msg):
         """
         Send a message on data canal
 
+        If batching is enabled, the message is queued and the batch is sent
+        when it reach *batch_size* messages or when *batch_delay* expire.
+
         :param Object msg: message to send
         """
-        if self.push_socket is None:
+        data_canal = self._data_canal
+        if data_canal.push_socket is None:
             raise NotConnectedException()
-        self._send_serialized(self.push_socket, msg)
+
+        if self.batch_size <= 1:
+            self._send_serialized(data_canal.push_socket, msg)
+            return
+
+        if not data_canal.batch:
+            data_canal.batch_start_time = time.monotonic()
+            _pending_batches.interfaces.add(self)
+
+        data_canal.batch.append(msg)
+        if len(data_canal.batch) >= self.batch_size or \
+                (time.monotonic() - data_canal.batch_start_time) * 1000 >= self.batch_delay:
+            self.flush_data()
+
+    def send_data_many(self, msgs: list):
+        """
+        Send several messages on data canal
+
+        If batching is enabled, the messages are added to the batch, else they
+        are sent in one batch.
+
+        :param list msgs: messages to send
+        """
+        if self.batch_size > 1:
+            for msg in msgs:
+                self.send_data(msg)
+            return
+
+        data_canal = self._data_canal
+        if data_canal.push_socket is None:
+            raise NotConnectedException()
+
+        if len(msgs) == 1:
+            self._send_serialized(data_canal.push_socket, msgs[0])
+        elif msgs:
+            self._send_serialized_batch(data_canal.push_socket, msgs)
+
+    def flush_data(self):
+        """
+        Send the pending batch of data messages
+        """
+        _pending_batches.interfaces.discard(self)
+        data_canal = self._data_canal
+        if not data_canal.batch or data_canal.push_socket is None:
+            return
+
+        batch, data_canal.batch = data_canal.batch, []
+        if len(batch) == 1:
+            self._send_serialized(data_canal.push_socket, batch[0])
+        else:
+            self._send_serialized_batch(data_canal.push_socket, batch)
@@ -49,6 +49,7 @@ class State:
         self.alive = True
 
         self.handlers = {}
+        self.timeout_handler = None
         self.supervisor = Supervisor()
 
     def get_corresponding_handler(self, msg: Message) -> Handler:
@@ -124,8 +124,13 @@ class Supervisor:
         """
         wait until all actor are terminated
         """
-        actor_sentinels = [actor.sentinel for actor in self.supervised_actors]
-        multiprocessing.connection.wait(actor_sentinels)
+        actor_sentinels = [actor.sentinel for actor in self.supervised_actors if actor.execution_mode == 'process']
+        if actor_sentinels:
+            multiprocessing.connection.wait(actor_sentinels)
+
+        for actor in self.supervised_actors:
+            if actor.execution_mode == 'thread':
+                actor.join()
 
     def kill_actors(self, soft=False):
         """
@@ -139,6 +144,20 @@ class Supervisor:
                     actor.hard_kill()
                 actor.join()
 
+    def kill_actor(self, actor, soft=False):
+        """
+        Kill one of the supervised actors and stop supervising it, the actor
+        is not joined
+        """
+        if actor.is_alive():
+            if soft:
+                actor.soft_kill()
+            else:
+                actor.hard_kill()
+
+        if actor in self.supervised_actors:
+            self.supervised_actors.remove(actor)
+
     def are_all_actors_alive(self) -> bool:
         """
         Identify if one of the actors is dead
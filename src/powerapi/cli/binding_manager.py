@@ -139,11 +139,9 @@ class PreProcessorBindingManager(ProcessorBindingManager):
                 for index in range(number_of_filters):
                     # The filters define the relationship with the dispatcher
                     # The relationship has to be updated
-                    current_filter = list(puller_actor.state.report_filter.filters[index])
-                    current_filter_dispatcher = current_filter[1]
+                    current_filter_rule, current_filter_dispatcher = puller_actor.state.report_filter.filters[index]
                     processor.add_target_actor(actor=current_filter_dispatcher)
-                    current_filter[1] = processor
-                    puller_actor.state.report_filter.filters[index] = tuple(current_filter)
+                    puller_actor.state.report_filter.set_filter(index, current_filter_rule, processor)
 
     def check_processor_targets(self, processor: ProcessorActor):
         """
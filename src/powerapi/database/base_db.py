@@ -27,8 +27,12 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import logging
+import time
+from collections.abc import Iterator
+
 from powerapi.exception import PowerAPIExceptionWithMessage
-from powerapi.report import Report
+from powerapi.report import Report, BadInputData
 
 
 class DBError(PowerAPIExceptionWithMessage):
@@ -67,6 +71,66 @@ class IterDB:
         """
         raise NotImplementedError()
 
+    def next_batch(self, max_n: int, timeout: int) -> list[Report]:
+        """
+        Return and consume up to max_n database results, waiting for the first one to be available.
+        The default implementation reads the results with __next__ and waits timeout ms before a second attempt if
+        none is available, the iterators able to wait for new results should override it.
+        :param max_n: Maximum number of results returned
+        :param timeout: Maximum time (in ms) waited for a result
+        :return: The available results, empty if none was available before the timeout
+        """
+        return next_reports(self, max_n, timeout)
+
+    def iter_batches(self, size: int) -> Iterator[list[Report]]:
+        """
+        Iterate on the available database results by batch of at most size results, until no result is available.
+        The default implementation reads the results with __next__, the iterators able to read several results at
+        once should override it.
+        :param size: Maximum number of results of a batch
+        """
+        return iter_report_batches(self, size)
+
+
+def read_available_reports(iterator: Iterator[Report], max_n: int) -> list[Report]:
+    """
+    Read up to max_n reports from the iterator until it raises StopIteration, the malformed reports are skipped
+    """
+    reports = []
+    while len(reports) < max_n:
+        try:
+            reports.append(next(iterator))
+        except StopIteration:
+            break
+        except BadInputData as exn:
+            logging.error('Received malformed report from database: %s', exn.msg)
+            logging.debug('Raw report value: %s', exn.input_data)
+    return reports
+
+
+def iter_report_batches(iterator: Iterator[Report], size: int) -> Iterator[list[Report]]:
+    """
+    Iterate on the reports of any iterator of reports by batch of at most size reports, until it raises StopIteration
+    """
+    while True:
+        reports = read_available_reports(iterator, size)
+        if not reports:
+            return
+        yield reports
+
+
+def next_reports(iterator: Iterator[Report], max_n: int, timeout: int) -> list[Report]:
+    """
+    Read up to max_n reports from any iterator of reports, waiting timeout ms before a second attempt if none is
+    available
+    :return: The available reports, empty if none was available before the timeout
+    """
+    reports = read_available_reports(iterator, max_n)
+    if not reports and timeout > 0:
+        time.sleep(timeout / 1000)
+        reports = read_available_reports(iterator, max_n)
+    return reports
+
 
 class BaseDB:
     """
@@ -28,11 +28,20 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import csv
+import heapq
+import io
+import itertools
+import logging
+import mmap
+import multiprocessing
 import os
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
 
 from powerapi.database.base_db import BaseDB, IterDB
 from powerapi.exception import PowerAPIException
-from powerapi.report.report import Report, CSV_HEADER_COMMON
+from powerapi.report.report import Report, BadInputData, CSV_HEADER_COMMON, CsvLines
 from powerapi.utils import utils
 
 # Array of field that will not be considered as a group
@@ -57,11 +66,46 @@ class HeaderAreNotTheSameError(PowerAPIException):
     """
 
 
+def merge_csv_rows(basenames: list[str], readers: list) -> Iterator[CsvLines]:
+    """
+    Merge the rows of csv files sorted by timestamp with a heap on their timestamp, the timestamp of each row is
+    parsed once
+
+    :param basenames: Name of each file
+    :param readers: Iterator on the rows (as dict) of each file
+    :return: an iterator on the pre-parsed lines of each report, the lines with the same timestamp and target are
+             grouped in file order then in row order and the targets of a timestamp are given in their order of
+             appearance
+    """
+    heap = []
+    row_count = itertools.count()
+
+    def push_next_row(index):
+        row = next(readers[index], None)
+        if row is not None:
+            heapq.heappush(heap, (int(row['timestamp']), index, next(row_count), row))
+
+    for index in range(len(readers)):
+        push_next_row(index)
+
+    while heap:
+        timestamp = heap[0][0]
+        targets_lines = {}
+        while heap and heap[0][0] == timestamp:
+            _, index, _, row = heapq.heappop(heap)
+            targets_lines.setdefault(row['target'], []).append((basenames[index], row))
+            push_next_row(index)
+        yield from targets_lines.values()
+
+
 class CsvIterDB(IterDB):
     """
     IterDB class
 
     This class allows to browse a database as an iterable
+
+    The rows of the files are merged with :func:`merge_csv_rows`, the rows with
+    the same timestamp and target are grouped in one report
     """
 
     def __init__(self, db, filenames, report_type, stream_mode):
@@ -70,111 +114,374 @@ class CsvIterDB(IterDB):
         super().__init__(db, report_type, stream_mode)
 
         self.filenames = filenames
-        self.tmp_read = {}
 
-        # Add it in the tmp
-        for filename in filenames:
-            self.tmp_read[filename] = {
-                'next_line': [],
-                'reader': None,
-                'file': None
-            }
+        #: (list): Name of each file, given to the report with the rows read from this file
+        self.basenames = [filename.split('/')[-1] for filename in filenames]
+        self.files = []
+        self.readers = []
 
         # Open all files with csv and read first line
-        for filename in self.filenames:
+        for index, filename in enumerate(self.filenames):
             try:
-                self.tmp_read[filename]['file'] = open(filename, encoding='utf-8')
-                self.tmp_read[filename]['reader'] = csv.DictReader(self.tmp_read[filename]['file'])
+                self.files.append(open(filename, encoding='utf-8'))
             except FileNotFoundError as error:
+                self._close_file()
                 raise CsvBadFilePathError(error) from error
-            self.tmp_read[filename]['next_line'] = self._next(filename)
+            self.readers.append(csv.DictReader(self.files[index]))
 
             # Check common key
-            for key in CSV_HEADER_COMMON:
-                if key not in self.tmp_read[filename]['next_line']:
-                    raise CsvBadCommonKeysError("Wrong columns keys")
+            if self.readers[index].fieldnames is None or \
+                    any(key not in self.readers[index].fieldnames for key in CSV_HEADER_COMMON):
+                self._close_file()
+                raise CsvBadCommonKeysError("Wrong columns keys")
 
-        # Save the first timestamp
-        if self.filenames:
-            self.saved_timestamp = utils.timestamp_to_datetime(
-                int(self.tmp_read[self.filenames[0]]['next_line']['timestamp']))
+        self.lines = merge_csv_rows(self.basenames, self.readers)
 
     def __iter__(self):
         """
         """
         return self
 
-    def _next(self, filename):
+    def _close_file(self):
+        for csvfile in self.files:
+            csvfile.close()
+
+    def __next__(self) -> Report:
+        """
+        Allow to get the next data
         """
-        Get next row, None otherwise
+        raw_data = next(self.lines, None)
+        if raw_data is None:
+            self._close_file()
+            raise StopIteration()
+
+        return self.report_type.from_csv_lines(raw_data)
 
-        :param str filename: file name we want to read
+    def iter_batches(self, size: int) -> Iterator[list[Report]]:
         """
+        Iterate on the reports by batch of at most size reports, the malformed reports are skipped
+        """
+        from_csv_lines = self.report_type.from_csv_lines
+        while True:
+            raw_batch = list(itertools.islice(self.lines, size))
+            if not raw_batch:
+                self._close_file()
+                return
+
+            reports = []
+            for raw_data in raw_batch:
+                try:
+                    reports.append(from_csv_lines(raw_data))
+                except BadInputData as exn:
+                    logging.error('Received malformed report from csv files: %s', exn.msg)
+                    logging.debug('Raw report value: %s', exn.input_data)
+            if reports:
+                yield reports
+
+
+def _line_start(data: mmap.mmap, position: int, data_start: int) -> int:
+    """
+    :return: the offset of the first line beginning at or after the given position
+    """
+    if position <= data_start:
+        return data_start
+    newline = data.find(b'\n', position - 1)
+    return len(data) if newline == -1 else newline + 1
+
+
+def _line_timestamp(data: mmap.mmap, line_start: int, timestamp_index: int) -> int:
+    """
+    :return: the timestamp of the line beginning at the given offset
+    """
+    line_end = data.find(b'\n', line_start)
+    line = data[line_start:len(data) if line_end == -1 else line_end]
+    return int(line.split(b',')[timestamp_index])
+
+
+def _find_timestamp_offset(data: mmap.mmap, data_start: int, timestamp: int, timestamp_index: int) -> int:
+    """
+    Binary search in a file sorted by timestamp
+    :return: the offset of the first line whose timestamp is greater or equal to the given timestamp
+    """
+    low, high = data_start, len(data)
+    while low < high:
+        middle = (low + high) // 2
+        line_start = _line_start(data, middle, data_start)
+        if line_start == len(data) or _line_timestamp(data, line_start, timestamp_index) >= timestamp:
+            high = middle
+        else:
+            low = middle + 1
+    return _line_start(data, low, data_start)
+
+
+def _parse_csv_chunk(chunk) -> tuple[list[Report], list[tuple]]:
+    """
+    Parse the rows of a chunk of each file and create their reports, executed by the workers of a ParallelCsvIterDB
+
+    :param chunk: tuple containing the report type and, for each file, its name, header, path and the offsets of the
+                  rows of the chunk
+    :return: the reports of the chunk, sorted by timestamp, and the message and input data of each malformed report
+    """
+    report_type, files = chunk
+    basenames = []
+    readers = []
+    for basename, header, path, start, end in files:
+        with open(path, 'rb') as csvfile:
+            csvfile.seek(start)
+            rows = csvfile.read(end - start).decode('utf-8')
+        basenames.append(basename)
+        readers.append(csv.DictReader(io.StringIO(rows), fieldnames=header))
+
+    reports = []
+    malformed_reports = []
+    for raw_data in merge_csv_rows(basenames, readers):
         try:
-            return next(self.tmp_read[filename]['reader'])
-        except StopIteration:
-            return None
+            reports.append(report_type.from_csv_lines(raw_data))
+        except BadInputData as exn:
+            malformed_reports.append((exn.msg, exn.input_data))
+    return reports, malformed_reports
 
-    def _close_file(self):
+
+class ParallelCsvIterDB(IterDB):
+    """
+    IterDB class
+
+    This class allows to browse a database as an iterable, the files are
+    parsed in parallel
+
+    The files are memory-mapped and split in chunks covering the same range of
+    timestamps in each file. The chunks are parsed in a pool of processes that
+    create the reports of each chunk, the reports are returned in timestamp
+    order. The pool is started when the first report is read and stopped once
+    all the chunks are parsed or when the database is disconnected.
+    """
+
+    def __init__(self, db, filenames, report_type, stream_mode, workers, chunk_size):
+        """
+        :param int workers: number of processes parsing the chunks
+        :param int chunk_size: approximate size (in bytes) of the chunks of the largest file
+        """
+        super().__init__(db, report_type, stream_mode)
+
+        self.filenames = filenames
+
+        #: (deque): Reports of the last parsed chunk that were not returned
+        self.reports = deque()
+
+        self.workers = workers
+        self.chunks = self._split_files(chunk_size)
+        self.pool = None
+        self.parsed_chunks = None
+
+    def _split_files(self, chunk_size):
+        """
+        Split the files in chunks beginning at the same timestamps
+        :return: the chunks given to the workers
+        """
+        files = []
         for filename in self.filenames:
-            if self.tmp_read[filename]['file'] is not None:
-                self.tmp_read[filename]['file'].close()
+            try:
+                with open(filename, 'rb') as csvfile:
+                    header_line = csvfile.readline()
+                    size = os.fstat(csvfile.fileno()).st_size
+                    data = mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else b''
+            except FileNotFoundError as error:
+                raise CsvBadFilePathError(error) from error
+
+            header = next(csv.reader([header_line.decode('utf-8')]), [])
+            if any(key not in header for key in CSV_HEADER_COMMON):
+                raise CsvBadCommonKeysError("Wrong columns keys")
+            files.append((filename.split('/')[-1], header, filename, data, len(header_line)))
+
+        if not files:
+            return []
+
+        # The chunks begin at the timestamps found every chunk_size bytes in the largest file
+        _, header, _, largest, data_start = max(files, key=lambda file: len(file[3]))
+        timestamp_index = header.index('timestamp')
+        boundaries = set()
+        for position in range(data_start + chunk_size, len(largest), chunk_size):
+            line_start = _line_start(largest, position, data_start)
+            if line_start < len(largest):
+                boundaries.add(_line_timestamp(largest, line_start, timestamp_index))
+        boundaries = sorted(boundaries)
+
+        offsets = []
+        for _, header, _, data, data_start in files:
+            timestamp_index = header.index('timestamp')
+            offsets.append([data_start] +
+                           [_find_timestamp_offset(data, data_start, boundary, timestamp_index)
+                            for boundary in boundaries] +
+                           [len(data)])
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+        return [(self.report_type, [(basename, header, path, file_offsets[index], file_offsets[index + 1])
+                                    for (basename, header, path, _, _), file_offsets in zip(files, offsets)])
+                for index in range(len(boundaries) + 1)]
+
+    def __iter__(self):
+        """
+        """
+        return self
+
+    def _read_next_chunk(self) -> bool:
+        """
+        Add the reports of the next parsed chunk to the reports to return, the malformed reports are skipped
+        The workers are started to parse the first chunk
+        :return: False if all the chunks were parsed
+        """
+        if self.parsed_chunks is None:
+            if not self.chunks:
+                return False
+            self.pool = multiprocessing.Pool(min(self.workers, len(self.chunks)))
+            self.parsed_chunks = self.pool.imap(_parse_csv_chunk, self.chunks)
+
+        parsed_chunk = next(self.parsed_chunks, None)
+        if parsed_chunk is None:
+            self.close()
+            return False
+
+        reports, malformed_reports = parsed_chunk
+        for msg, input_data in malformed_reports:
+            logging.error('Received malformed report from csv files: %s', msg)
+            logging.debug('Raw report value: %s', input_data)
+        self.reports.extend(reports)
+        return True
 
     def __next__(self) -> Report:
         """
         Allow to get the next data
         """
-        raw_data = []
-        # Get the current timestamp
-        current_timestamp = self.saved_timestamp
-        previous_target = None
-        # For all files
-
-        for path_file in self.filenames:
-            # While timestamp is lower or equal
-            while True:
-                # Get the next line
-                row = self.tmp_read[path_file]['next_line']
-
-                # If nothing more, break
-                if row is None:
-                    # If the first file a no next file, just stop the iteration
-                    if not raw_data and path_file == self.filenames[0]:
-                        self._close_file()
-                        raise StopIteration()
-                    break
-
-                # Get the timestamp as datetime
-                row_timestamp = utils.timestamp_to_datetime(
-                    int(row['timestamp']))
-                # If timestamp is higher, we stop here
-                if row_timestamp > current_timestamp:
-                    if path_file == self.filenames[-1]:
-                        self.saved_timestamp = row_timestamp
-                    break  # move to next file
-
-                if row_timestamp < current_timestamp:
-                    self.tmp_read[path_file]['next_line'] = self._next(path_file)
-                    continue
-
-                if previous_target is not None:
-                    if row['target'] != previous_target:
-                        break  # move to next file
-                else:
-                    previous_target = row['target']
-
-                # Else if it's the same, we merge
-                raw_data.append((path_file.split('/')[-1], row))
-                # Next line
-                self.tmp_read[path_file]['next_line'] = self._next(path_file)
-
-        if not raw_data:
-            self._close_file()
-            raise StopIteration()
+        while not self.reports:
+            if not self._read_next_chunk():
+                raise StopIteration()
+
+        return self.reports.popleft()
+
+    def iter_batches(self, size: int) -> Iterator[list[Report]]:
+        """
+        Iterate on the reports of the parsed chunks by batch of at most size reports
+        """
+        while True:
+            while not self.reports:
+                if not self._read_next_chunk():
+                    return
+
+            yield [self.reports.popleft() for _ in range(min(size, len(self.reports)))]
+
+    def close(self):
+        """
+        Stop the workers, the remaining chunks are not parsed
+        """
+        self.chunks = []
+        self.parsed_chunks = iter([])
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+
+class CsvWriterPool:
+    """
+    Pool of the csv files written by a CsvDB
+
+    The rows are buffered by file and written, grouped by file, when the pool
+    is flushed. The files are kept open in a LRU of at most *max_open_files*
+    handles and the header of each file is validated only the first time the
+    file is opened.
+    """
+
+    def __init__(self, max_open_files: int = 64):
+        """
+        :param max_open_files: Maximum number of files kept open
+        """
+        self.max_open_files = max_open_files
+
+        #: (OrderedDict): Open file and csv writer of each path, from the least to the most recently used
+        self.handles = OrderedDict()
 
-        report = self.report_type.from_csv_lines(raw_data)
+        #: (dict): Validated header of each path
+        self.headers = {}
 
-        return report
+        #: (dict): Rows waiting to be written in each path
+        self.rows = {}
+
+        #: (set): Directories known to exist
+        self.directories = set()
+
+    def add(self, path: str, header: list[str], rows: list[dict]):
+        """
+        Buffer rows to write in a file
+        :param path: Path of the file
+        :param header: Header of the rows
+        :param rows: Rows to write
+        :raise HeaderAreNotTheSameError: if the header of the file is not the header of the rows
+        """
+        known_header = self.headers.get(path)
+        if known_header is None:
+            self._get_writer(path, header)
+        elif known_header != header:
+            raise HeaderAreNotTheSameError(f"Header are not the same in {path}")
+
+        self.rows.setdefault(path, []).extend(rows)
+
+    def _get_writer(self, path: str, header: list[str]) -> csv.DictWriter:
+        """
+        Return the csv writer of a file, the file is opened, and its header validated or written, if it is not open
+        :param path: Path of the file
+        :param header: Header of the file
+        """
+        handle = self.handles.get(path)
+        if handle is not None:
+            self.handles.move_to_end(path)
+            return handle[1]
+
+        directory = os.path.dirname(path)
+        if directory not in self.directories:
+            os.makedirs(directory, exist_ok=True)
+            self.directories.add(directory)
+
+        csvfile = open(path, 'a+', encoding='utf-8')
+        writer = csv.DictWriter(csvfile, fieldnames=header)
+        if path not in self.headers:
+            csvfile.seek(0)  # Go to beginning of file before reading
+            reader = csv.DictReader(csvfile)
+            if reader.fieldnames is None:
+                writer.writeheader()
+            elif reader.fieldnames != header:
+                csvfile.close()
+                raise HeaderAreNotTheSameError(f"Header are not the same in {path}")
+            self.headers[path] = header
+
+        if len(self.handles) >= self.max_open_files:
+            _, (evicted_file, _) = self.handles.popitem(last=False)
+            evicted_file.close()
+        self.handles[path] = (csvfile, writer)
+        return writer
+
+    def flush(self):
+        """
+        Write the buffered rows, grouped by file, the rows of the open files are written first
+        """
+        open_paths = [path for path in self.rows if path in self.handles]
+        closed_paths = [path for path in self.rows if path not in self.handles]
+        for path in open_paths + closed_paths:
+            writer = self._get_writer(path, self.headers[path])
+            writer.writerows(self.rows[path])
+
+        for csvfile, _ in self.handles.values():
+            csvfile.flush()
+        self.rows.clear()
+
+    def close(self):
+        """
+        Write the buffered rows and close the files
+        """
+        self.flush()
+        for csvfile, _ in self.handles.values():
+            csvfile.close()
+        self.handles.clear()
 
 
 class CsvDB(BaseDB):
@@ -185,9 +492,15 @@ class CsvDB(BaseDB):
     a CsvDB instance can be define by its current path
     """
 
-    def __init__(self, report_type: type[Report], tags: list[str], current_path="/tmp/csvdbtest", files=[]):
+    def __init__(self, report_type: type[Report], tags: list[str], current_path="/tmp/csvdbtest", files=[],
+                 max_open_files=64, flush_interval=0, parallel_workers=0, chunk_size=4 * 1024 * 1024):
         """
         :param current_path: Current path where read/write files
+        :param max_open_files: Maximum number of output files kept open
+        :param flush_interval: Minimum time (in ms) between two writes of the buffered rows in the output files,
+                               0 write the rows at the end of each save
+        :param parallel_workers: Number of processes parsing the input files, 0 parse them in the reading process
+        :param chunk_size: Approximate size (in bytes) of the chunks of input file parsed by each process
         """
         BaseDB.__init__(self, report_type)
 
@@ -202,6 +515,20 @@ class CsvDB(BaseDB):
         self.saved_timestamp = utils.timestamp_to_datetime(0)
         self.tags = tags
 
+        #: (CsvWriterPool): Pool of the output files
+        self.writer_pool = CsvWriterPool(max_open_files)
+
+        #: (float): Minimum time (in seconds) between two writes of the buffered rows
+        self.flush_interval = flush_interval / 1000
+        self.last_flush_time = time.monotonic()
+
+        #: (int): Number of processes parsing the input files
+        self.parallel_workers = parallel_workers
+        self.chunk_size = chunk_size
+
+        #: (list): Parallel iterators whose workers are stopped when the database is disconnected
+        self.parallel_iter_dbs = []
+
         self.add_files(files)
 
     ##################
@@ -242,6 +569,11 @@ class CsvDB(BaseDB):
         """
         Create the iterator for get the data
         """
+        if self.parallel_workers > 0:
+            iter_db = ParallelCsvIterDB(self, self.filenames, self.report_type, stream_mode, self.parallel_workers,
+                                        self.chunk_size)
+            self.parallel_iter_dbs.append(iter_db)
+            return iter_db
         return CsvIterDB(self, self.filenames, self.report_type, stream_mode)
 
     def connect(self):
@@ -251,8 +583,13 @@ class CsvDB(BaseDB):
 
     def disconnect(self):
         """
-        Disconnect from the csv database.
+        Disconnect from the csv database, the buffered rows are written and the output files closed.
+        The workers parsing the input files are stopped.
         """
+        self.writer_pool.close()
+        for iter_db in self.parallel_iter_dbs:
+            iter_db.close()
+        self.parallel_iter_dbs.clear()
 
     def save(self, report: Report):
         """
@@ -260,38 +597,22 @@ class CsvDB(BaseDB):
 
         :param report: Report
         """
-        fixed_header, data = self.report_type.to_csv_lines(report, self.tags)
-
-        # If the repository doesn't exist, create it
-        rep_path = self.current_path + report.sensor + "-" + report.target
-        os.makedirs(rep_path, exist_ok=True)
-
-        for filename, values in data.items():
-            output_filename = f'{rep_path}/{filename}.csv'
-
-            with open(output_filename, 'a+', encoding='utf-8') as csvfile:
-                expected_header = fixed_header + sorted(set(values[0].keys()) - set(fixed_header))
-                header_exist = False
-
-                csvfile.seek(0)  # Go to beginning of file before reading
-                reader = csv.DictReader(csvfile)
-                if reader.fieldnames:
-                    header_exist = True
-                    if reader.fieldnames != expected_header:
-                        raise HeaderAreNotTheSameError(f"Header are not the same in {output_filename}")
-
-                writer = csv.DictWriter(csvfile, fieldnames=expected_header)
-                if not header_exist:
-                    writer.writeheader()
-
-                for row in values:
-                    writer.writerow(row)
+        self.save_many([report])
 
     def save_many(self, reports: list[Report]):
         """
-        Allow to save a batch of report
+        Allow to save a batch of report, the rows of the reports are written grouped by file
 
         :param reports: Batch of report.
         """
         for report in reports:
-            self.save(report)
+            fixed_header, data = self.report_type.to_csv_lines(report, self.tags)
+            rep_path = self.current_path + report.sensor + "-" + report.target
+
+            for filename, values in data.items():
+                expected_header = fixed_header + sorted(set(values[0].keys()) - set(fixed_header))
+                self.writer_pool.add(f'{rep_path}/{filename}.csv', expected_header, values)
+
+        if time.monotonic() - self.last_flush_time >= self.flush_interval:
+            self.writer_pool.flush()
+            self.last_flush_time = time.monotonic()
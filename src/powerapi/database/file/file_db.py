@@ -30,10 +30,12 @@
 import json
 import logging
 import os
+from collections import deque
+from collections.abc import Iterator
 from datetime import datetime
 
 from powerapi.database.base_db import BaseDB, DBError, IterDB
-from powerapi.report import Report
+from powerapi.report import Report, BadInputData
 
 
 class FileBadDBError(DBError):
@@ -86,6 +88,182 @@ class FileIterDB(IterDB):
             return self.report_type.from_json(json.loads(json_str))
 
 
+class FileTailIterDB(IterDB):
+    """
+    FileTailIterDB class
+
+    Class for following an append-only file containing one json report per line, like ``tail -F``
+
+    The file is read from the offset reached by the last read, each line is parsed once. When no complete line is
+    available, the file is checked with :func:`os.stat` to detect its rotation (the path is linked to a new file) or
+    its truncation (the size is lower than the offset), the new content is then read from its beginning
+
+    The file is closed when all its lines are read if the iterator is not in stream mode, or when the database is
+    disconnected
+    """
+
+    def __init__(self, db, report_type, stream_mode, filename, read_size=65536):
+        """
+        :param filename: Name of the followed file
+        :param read_size: Maximum number of bytes read from the file at once
+        """
+        IterDB.__init__(self, db, report_type, stream_mode)
+        self.filename = filename
+        self.read_size = read_size
+
+        #: (deque): Complete lines read from the file and not yet parsed
+        self.lines = deque()
+        #: (bytes): Last line read from the file, not yet ended by a newline
+        self.partial_line = b''
+
+        self.file_object = None
+        self.file_id = None
+        self.offset = 0
+        self._open_file()
+
+    def __iter__(self):
+        """
+        Create the iterator for get the data
+        """
+        return self
+
+    def _open_file(self):
+        """
+        Open the file linked to the path and read it from its beginning
+        """
+        try:
+            file_object = open(self.filename, 'rb')
+        except FileNotFoundError:
+            return False
+
+        self.close()
+        self.file_object = file_object
+        stat = os.fstat(file_object.fileno())
+        self.file_id = (stat.st_dev, stat.st_ino)
+        self.offset = 0
+        return True
+
+    def _read_lines(self):
+        """
+        Read the data appended to the file since the last read and store its complete lines
+        :return: True if at least one complete line was read
+        """
+        if self.file_object is None:
+            return False
+
+        data = self.file_object.read(self.read_size)
+        while data:
+            self.offset += len(data)
+            lines = (self.partial_line + data).split(b'\n')
+            self.partial_line = lines.pop()
+            self.lines.extend(line for line in lines if line.strip())
+            if self.lines:
+                return True
+            data = self.file_object.read(self.read_size)
+        return False
+
+    def _check_rotation(self):
+        """
+        Check if the file was rotated or truncated since the last read
+        :return: True if the file must be read again from its beginning
+        """
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            # The file was moved and the new one is not created yet
+            return False
+
+        if (stat.st_dev, stat.st_ino) != self.file_id:
+            # The content of the rotated file was fully read, its last line is complete even without a newline
+            self._end_partial_line()
+            return self._open_file()
+
+        if stat.st_size < self.offset:
+            logging.warning('File %s was truncated, reading it from its beginning', self.filename)
+            self.partial_line = b''
+            self.file_object.seek(0)
+            self.offset = 0
+            return True
+
+        return False
+
+    def _end_partial_line(self):
+        """
+        Store the last line read from the file even if it is not ended by a newline
+        """
+        if self.partial_line.strip():
+            self.lines.append(self.partial_line)
+        self.partial_line = b''
+
+    def __next__(self) -> Report:
+        """
+        Allow to get the next report appended to the file
+        :raise: StopIteration when no complete line was appended to the file since the last read
+        """
+        while True:
+            if not self._has_lines():
+                raise StopIteration()
+
+            line = self.lines.popleft()
+            try:
+                return self.report_type.from_json(json.loads(line))
+            except json.JSONDecodeError as exn:
+                logging.error('Malformed json line in file %s: %s', self.filename, exn)
+
+    def _has_lines(self) -> bool:
+        """
+        Read the file if no complete line is available
+        :return: True if a complete line is available
+        """
+        if not self.lines and not self._read_lines() and self._check_rotation():
+            self._read_lines()
+
+        if not self.lines and not self.stream_mode:
+            self.close()
+        return bool(self.lines)
+
+    def iter_batches(self, size: int) -> Iterator[list[Report]]:
+        """
+        Iterate on the reports appended to the file by batch of at most size reports, until no complete line is
+        available
+        """
+        while self._has_lines():
+            lines = [self.lines.popleft() for _ in range(min(size, len(self.lines)))]
+            reports = []
+            for document in self._decode_lines(lines):
+                try:
+                    reports.append(self.report_type.from_json(document))
+                except BadInputData as exn:
+                    logging.error('Received malformed report from file %s: %s', self.filename, exn.msg)
+                    logging.debug('Raw report value: %s', exn.input_data)
+            if reports:
+                yield reports
+
+    def _decode_lines(self, lines: list[bytes]) -> list[dict]:
+        """
+        Decode the lines at once as the elements of a json array, the lines are decoded one by one only if one of
+        them is malformed
+        """
+        try:
+            return json.loads(b'[' + b','.join(lines) + b']')
+        except ValueError:
+            documents = []
+            for line in lines:
+                try:
+                    documents.append(json.loads(line))
+                except ValueError as exn:
+                    logging.error('Malformed json line in file %s: %s', self.filename, exn)
+            return documents
+
+    def close(self):
+        """
+        Close the followed file
+        """
+        if self.file_object is not None:
+            self.file_object.close()
+            self.file_object = None
+
+
 class FileDB(BaseDB):
     """
     FileDB class herited from BaseDB
@@ -93,15 +271,20 @@ class FileDB(BaseDB):
     Allow to handle a FileDB database in reading or writing.
     """
 
-    def __init__(self, report_type: type[Report], filename: str):
+    def __init__(self, report_type: type[Report], filename: str, follow: bool = False):
         """
         :param report_type:        Type of the report handled by this database
         :param filename:        Name of the file containing the report
+        :param follow:          Read the file as an append-only file containing one json report per line
         """
 
         BaseDB.__init__(self, report_type)
 
         self.filename = filename
+        self.follow = follow
+
+        #: (list): Iterators following the file, closed when the database is disconnected
+        self.tail_iter_dbs = []
 
     def connect(self):
         """
@@ -114,13 +297,20 @@ class FileDB(BaseDB):
 
     def disconnect(self):
         """
-        Disconnect from the file database.
+        Disconnect from the file database, the followed files are closed.
         """
+        for iter_db in self.tail_iter_dbs:
+            iter_db.close()
+        self.tail_iter_dbs.clear()
 
-    def iter(self, stream_mode: bool = False) -> FileIterDB:
+    def iter(self, stream_mode: bool = False) -> FileIterDB | FileTailIterDB:
         """
         Create the iterator for get the data
         """
+        if self.follow:
+            iter_db = FileTailIterDB(self, self.report_type, stream_mode, self.filename)
+            self.tail_iter_dbs.append(iter_db)
+            return iter_db
         return FileIterDB(self, self.report_type, stream_mode, self.filename)
 
     def save(self, report: Report):
@@ -28,14 +28,17 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import math
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from urllib.parse import urlparse
 try:
     from influxdb_client import InfluxDBClient, WriteOptions
-    from influxdb_client.client.write_api import SYNCHRONOUS
+    from influxdb_client.client.write_api import SYNCHRONOUS, WriteType
 except ImportError:
     logging.getLogger().info("influx-client2 is not installed.")
 
-from powerapi.report import Report
+from powerapi.report import Report, PowerReport
 from powerapi.exception import MissingArgumentException
 from powerapi.database.base_db import BaseDB, DBError
 
@@ -46,15 +49,87 @@ class CantConnectToInfluxDBException(DBError):
     """
 
 
+class LineProtocolEncoder:
+    """
+    Encode power reports in the InfluxDB line protocol
+
+    The tags of a report are built from its flattened metadata, the sanitized
+    names of the tags are taken from the cache of
+    :meth:`PowerReport.select_tags_name <powerapi.report.power_report.PowerReport.select_tags_name>`.
+
+    The line protocol has no representation of the non finite floats (nan and
+    infinity), the reports having such a power are not encoded.
+    """
+
+    EPOCH = datetime(1970, 1, 1)
+    EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    MEASUREMENT_TRANSLATION_TABLE = str.maketrans({',': '\\,', ' ': '\\ ', '\n': '\\n'})
+    TAG_TRANSLATION_TABLE = str.maketrans({',': '\\,', '=': '\\=', ' ': '\\ ', '\n': '\\n'})
+
+    def __init__(self, tags: list[str] | None, measurement: str = 'power_consumption'):
+        """
+        :param tags: Sanitized name of the metadata used as tags, None to use all the metadata
+        :param measurement: Name of the measurement of the reports
+        """
+        self.tags = tuple(tags) if tags else None
+        self.measurement = measurement.translate(self.MEASUREMENT_TRANSLATION_TABLE)
+
+    def _encode_timestamp(self, timestamp: datetime) -> int:
+        """
+        :return: The given timestamp in nanoseconds since epoch, a naive timestamp is considered to be in UTC
+        """
+        epoch = self.EPOCH if timestamp.tzinfo is None else self.EPOCH_UTC
+        return (timestamp - epoch) // timedelta(microseconds=1) * 1000
+
+    @staticmethod
+    def _encode_field(value) -> str:
+        """
+        :return: The given field value in line protocol, an integer value is suffixed by `i`
+        """
+        if isinstance(value, int) and not isinstance(value, bool):
+            return f'{value}i'
+        return repr(value)
+
+    def encode(self, report: PowerReport) -> str | None:
+        """
+        :param report: Report to encode
+        :return: The line protocol line of the given report, None if its power is not a finite number
+        """
+        if isinstance(report.power, float) and not math.isfinite(report.power):
+            return None
+
+        metadata = Report.flatten_tags(report.metadata)
+        tags = {'sensor': str(report.sensor), 'target': str(report.target)}
+        for key, tag_name in sorted(PowerReport.select_tags_name(tuple(metadata), self.tags), key=itemgetter(1)):
+            value = str(metadata[key])
+            if value:
+                tags[tag_name] = value
+
+        escape = self.TAG_TRANSLATION_TABLE
+        encoded_tags = ','.join(f'{key.translate(escape)}={value.translate(escape)}' for key, value in tags.items())
+        return (f'{self.measurement},{encoded_tags} power={self._encode_field(report.power)} '
+                f'{self._encode_timestamp(report.timestamp)}')
+
+
 class InfluxDB2(BaseDB):
     """
         InfluxDB2 class is a subclass of BaseDB
 
         Allow to handle a InfluxDB database in reading or writing.
+
+        By default, each batch of reports is written synchronously. In batching
+        mode, the reports are given to the batching write API of the client that
+        write them from a background thread by batches of *batch_size* reports
+        at least every *flush_interval* ms, retrying the failed writes. With
+        *line_protocol*, the reports are directly encoded in the line protocol
+        instead of being converted in points.
     """
 
     def __init__(self, report_type: type[Report], url: str, org: str, bucket_name: str, token: str, tags: list[str],
-                 port=None):
+                 port=None, batching: bool = False, batch_size: int = 1000, flush_interval: int = 1000,
+                 jitter_interval: int = 0, retry_interval: int = 5000, max_retries: int = 5,
+                 line_protocol: bool = False):
         """
             :param report_type:     Type of the report handled by this database
             :param url:             URL of the InfluxDB2 server
@@ -64,6 +139,13 @@ class InfluxDB2(BaseDB):
             :param token:           Access token for readings and writings on database
             :param tags:            metadata used to tag metric
             :param port:            port of the InfluxDB2 server (if not specified in the url)
+            :param batching:        write the reports with the batching write API of the client
+            :param batch_size:      number of reports written in one request in batching mode
+            :param flush_interval:  maximum time (in ms) before a batch is written in batching mode
+            :param jitter_interval: maximum random delay (in ms) added to the writes in batching mode
+            :param retry_interval:  time (in ms) before the first retry of a failed write in batching mode
+            :param max_retries:     maximum number of retries of a failed write in batching mode
+            :param line_protocol:   encode the reports in line protocol instead of converting them in points
         """
         BaseDB.__init__(self, report_type)
         self.uri = url
@@ -80,6 +162,15 @@ class InfluxDB2(BaseDB):
         self.bucket_name = bucket_name
         self.tags = tags
 
+        if batching:
+            self.write_options = WriteOptions(write_type=WriteType.batching, batch_size=batch_size,
+                                              flush_interval=flush_interval, jitter_interval=jitter_interval,
+                                              retry_interval=retry_interval, max_retries=max_retries)
+        else:
+            self.write_options = WriteOptions(write_type=SYNCHRONOUS)
+
+        self.encoder = LineProtocolEncoder(tags) if line_protocol else None
+
         self.client = None
         self.buckets_api = None
         self.write_api = None
@@ -108,7 +199,7 @@ class InfluxDB2(BaseDB):
 
         # get apis to working with the database
         self.buckets_api = self.client.buckets_api()
-        self.write_api = self.client.write_api(WriteOptions(write_type=SYNCHRONOUS))
+        self.write_api = self.client.write_api(self.write_options)
         self.query_api = self.client.query_api()
 
         # A bucket is created only if it does not exist
@@ -119,8 +210,11 @@ class InfluxDB2(BaseDB):
 
     def disconnect(self):
         """
-        Disconnect from the influxdb2 database.
+        Disconnect from the influxdb2 database, the reports waiting in the batches are written.
         """
+        if self.write_api is not None:
+            self.write_api.close()
+            self.write_api = None
 
     def get_db_by_name(self, db_name: str):
         """
@@ -145,5 +239,8 @@ class InfluxDB2(BaseDB):
 
             :param reports: Batch of data.
         """
-        data_list = list(map(lambda r: self.report_type.to_influxdb(r, self.tags), reports))
+        if self.encoder is not None:
+            data_list = [line for line in map(self.encoder.encode, reports) if line is not None]
+        else:
+            data_list = [self.report_type.to_influxdb(report, self.tags) for report in reports]
         self.write_api.write(bucket=self.bucket_name, record=data_list)
@@ -28,14 +28,23 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import time
+from collections import deque
+from collections.abc import Iterator
+from datetime import timedelta, timezone
+
 try:
+    import bson
     import pymongo
     import pymongo.errors
+    from bson.codec_options import CodecOptions
+    from bson.raw_bson import RawBSONDocument
 except ImportError:
     logging.getLogger().info("PyMongo is not installed.")
 
 from powerapi.database.base_db import BaseDB, DBError, IterDB
-from powerapi.report import Report
+from powerapi.exception import PowerAPIException
+from powerapi.report import Report, BadInputData, RawReport
 
 
 class MongoBadDBError(DBError):
@@ -46,11 +55,43 @@ class MongoBadDBError(DBError):
         DBError.__init__(self, 'Mongo DB error : can\'t connect to ' + hostname)
 
 
+#: (tuple): Readers used to read a MongoDB in stream mode
+STREAM_READERS = ('claim', 'change-stream', 'tailable')
+
+#: (int): Time (in ms) between two reads of the stream reader while waiting for new documents
+STREAM_POLL_INTERVAL = 10
+
+
+class UnknownStreamReaderException(PowerAPIException):
+    """
+    Exception raised when a MongoDB is created with a stream reader that is
+    not in :data:`STREAM_READERS`
+    """
+
+    def __init__(self, stream_reader: str):
+        PowerAPIException.__init__(self)
+        self.stream_reader = stream_reader
+
+
 class MongoIterDB(IterDB):
     """
     MongoIterDB class
 
     Class for iterating in a MongoDB class
+
+    In stream mode, the documents are read with the stream reader of the
+    database:
+
+    - `claim`: the documents are consumed, *stream_batch_size* documents sorted
+      on *stream_sort_key* are fetched and then deleted with one request
+      (with a batch size of 1, each document is atomically fetched and deleted)
+    - `change-stream`: the documents inserted in the collection are read from
+      a change stream, the collection must belong to a replica set
+    - `tailable`: the documents are read from a tailable cursor, the
+      collection must be a capped collection
+
+    In pass-through mode, the documents are returned as raw reports keeping
+    the BSON bytes read from the database.
     """
 
     def __init__(self, db, report_type, stream_mode):
@@ -61,6 +102,15 @@ class MongoIterDB(IterDB):
         #: (pymongo.Cursor): Cursor which return data
         self.cursor = None
 
+        #: (pymongo.change_stream.CollectionChangeStream): Change stream returning the inserted documents
+        self.change_stream = None
+
+        #: (ObjectId): Identifier of the last document read from the tailable cursor
+        self.last_id = None
+
+        #: (deque): Documents fetched from the database and not yet returned
+        self.pending_documents = deque()
+
         self.__iter__()
 
     def __iter__(self):
@@ -68,7 +118,7 @@ class MongoIterDB(IterDB):
         Create the iterator for get the data
         """
         if not self.stream_mode:
-            self.cursor = self.db.collection.find({})
+            self.cursor = self.db.collection.find({}, {'_id': False}, batch_size=self.db.batch_size)
         return self
 
     def __next__(self) -> Report:
@@ -76,14 +126,129 @@ class MongoIterDB(IterDB):
         Allow to get the next data
         :raise: StopIteration in stream mode when no report was found. In non stream mode, raise StopIteration if the database is empty
         """
+        while not self.pending_documents:
+            self.pending_documents.extend(self._fetch_documents())
+
+        return self._to_report(self.pending_documents.popleft())
+
+    def _to_report(self, document) -> Report:
+        """
+        Create the report of a document, a raw report in pass-through mode
+        :raise: BadInputData if the document is malformed
+        """
+        if not self.db.pass_through:
+            return self.report_type.from_mongodb(document)
+
+        # The documents unpacked from a bucket are not read as raw documents, they are encoded again
+        if not isinstance(document, RawBSONDocument):
+            document = RawBSONDocument(bson.encode(document))
+        return RawReport.from_document(self.report_type, document)
+
+    def next_batch(self, max_n: int, timeout: int) -> list[Report]:
+        """
+        Return up to max_n reports, in stream mode the stream reader is polled every :data:`STREAM_POLL_INTERVAL` ms
+        until a document is available or the timeout expires
+        """
+        deadline = time.monotonic() + timeout / 1000
+        while len(self.pending_documents) < max_n:
+            try:
+                self.pending_documents.extend(self._fetch_documents())
+            except StopIteration:
+                remaining_time = deadline - time.monotonic()
+                if self.pending_documents or not self.stream_mode or remaining_time <= 0:
+                    break
+                time.sleep(min(STREAM_POLL_INTERVAL / 1000, remaining_time))
+
+        reports = []
+        while self.pending_documents and len(reports) < max_n:
+            try:
+                reports.append(self._to_report(self.pending_documents.popleft()))
+            except BadInputData as exn:
+                logging.error('Received malformed report from MongoDB: %s', exn.msg)
+                logging.debug('Raw report value: %s', exn.input_data)
+        return reports
+
+    def iter_batches(self, size: int) -> Iterator[list[Report]]:
+        """
+        Iterate on the available reports by batch of at most size reports, the documents are fetched with the
+        cursor or the stream reader until none is available
+        """
+        while True:
+            reports = self.next_batch(size, 0)
+            if not reports:
+                return
+            yield reports
+
+    def _fetch_documents(self) -> list[dict]:
+        """
+        Fetch the next documents from the database, the buckets are unpacked
+        :raise: StopIteration if no document is available
+        """
         if not self.stream_mode:
-            json = self.cursor.next()
+            documents = [self.cursor.next()]
+        elif self.db.stream_reader == 'change-stream':
+            documents = self._read_change_stream()
+        elif self.db.stream_reader == 'tailable':
+            documents = [self._read_tailable_cursor()]
         else:
-            json = self.db.collection.find_one_and_delete({})
-            if json is None:
+            documents = self._claim_documents()
+
+        if self.db.bucket_size is not None:
+            return [document for bucket in documents for document in MongoDB.unpack_bucket(bucket)]
+        return documents
+
+    def _claim_documents(self) -> list[dict]:
+        """
+        Fetch and delete the oldest documents of the collection
+        :raise: StopIteration if the collection is empty
+        """
+        if self.db.stream_batch_size == 1:
+            document = self.db.collection.find_one_and_delete({})
+            if document is None:
                 raise StopIteration()
+            return [document]
+
+        documents = list(self.db.collection.find({}, sort=[(self.db.stream_sort_key, pymongo.ASCENDING)],
+                                                 limit=self.db.stream_batch_size))
+        if not documents:
+            raise StopIteration()
 
-        return self.report_type.from_mongodb(json)
+        self.db.collection.delete_many({'_id': {'$in': [document['_id'] for document in documents]}})
+        return documents
+
+    def _read_change_stream(self) -> list[dict]:
+        """
+        Read the documents inserted in the collection, at most *stream_batch_size* documents are returned
+        :raise: StopIteration if no document was inserted
+        """
+        if self.change_stream is None:
+            self.change_stream = self.db.collection.watch([{'$match': {'operationType': 'insert'}}])
+
+        documents = []
+        while len(documents) < self.db.stream_batch_size:
+            change = self.change_stream.try_next()
+            if change is None:
+                break
+            documents.append(change['fullDocument'])
+
+        if not documents:
+            raise StopIteration()
+        return documents
+
+    def _read_tailable_cursor(self) -> dict:
+        """
+        Read the next document of the capped collection, the tailable cursor is recreated after the last read
+        document if it is dead
+        :raise: StopIteration if no document is available
+        """
+        if self.cursor is None or not self.cursor.alive:
+            query = {} if self.last_id is None else {'_id': {'$gt': self.last_id}}
+            self.cursor = self.db.collection.find(query, cursor_type=pymongo.CursorType.TAILABLE,
+                                                  batch_size=self.db.batch_size)
+
+        document = self.cursor.next()
+        self.last_id = document['_id']
+        return document
 
 
 class MongoDB(BaseDB):
@@ -91,9 +256,29 @@ class MongoDB(BaseDB):
     MongoDB class herited from BaseDB
 
     Allow to handle a MongoDB database in reading or writing.
+
+    The reports can be stored one per document or, if *bucket_size* is
+    defined, packed in bucket documents. A bucket contains at most
+    *bucket_size* reports of the same sensor and target produced during the
+    same time window of *bucket_window* ms and having the same fields, so
+    that all the columns of a bucket have one value per report::
+
+        {'sensor': ..., 'target': ..., 'timestamp': <beginning of the window>, 'fields': [<field>],
+         'count': <number of reports>, 'reports': {<field>: [<value of each report>]}}
+
+    The time windows are aligned on the UTC time of the report timestamps and
+    the collection is indexed on the sensor, target, timestamp and fields of
+    the buckets when connecting.
+
+    In pass-through mode, the documents are read as raw BSON documents and
+    returned as raw reports: only their top level fields are decoded by the
+    puller and the dispatcher, the formulas parse the whole documents.
     """
 
-    def __init__(self, report_type: type[Report], uri: str, db_name: str, collection_name: str):
+    def __init__(self, report_type: type[Report], uri: str, db_name: str, collection_name: str,
+                 ordered: bool = True, write_concern: dict | None = None, bucket_size: int | None = None,
+                 bucket_window: int = 60000, batch_size: int = 0, stream_reader: str = 'claim',
+                 stream_batch_size: int = 1, stream_sort_key: str = '_id', pass_through: bool = False):
         """
         :param report_type:        Type of the report handled by this database
         :param uri:             URI of the MongoDB server
@@ -103,7 +288,30 @@ class MongoDB(BaseDB):
 
         :param collection_name: collection name in the mongodb
                                     (ex: "sensor")
+
+        :param ordered:         if False, the writes of a batch are sent as an unordered bulk write that the server
+                                can apply in parallel and that is not stopped by the first error
+
+        :param write_concern:   options of the write concern used to save the reports (ex: {'w': 1, 'j': False}),
+                                the write concern of the server is used if None
+
+        :param bucket_size:     maximum number of reports packed in one document, None store one report per document
+
+        :param bucket_window:   duration (in ms) of the time window covered by a bucket
+
+        :param batch_size:      number of documents returned by each batch of the cursors, 0 use the server default
+
+        :param stream_reader:   reader used in stream mode (claim, change-stream or tailable)
+
+        :param stream_batch_size: maximum number of documents fetched by one request in stream mode
+
+        :param stream_sort_key: field on which the documents are sorted when claimed by batches (ex: "timestamp")
+
+        :param pass_through:    if True, the documents are read as raw reports parsed by the formulas
         """
+        if stream_reader not in STREAM_READERS:
+            raise UnknownStreamReaderException(stream_reader)
+
         BaseDB.__init__(self, report_type, [pymongo.errors.PyMongoError])
 
         #: (str): URI of the mongodb server
@@ -122,6 +330,33 @@ class MongoDB(BaseDB):
         #: targeted collection
         self.collection = None
 
+        #: (bool): True if the writes of a batch are ordered
+        self.ordered = ordered
+
+        #: (dict): Options of the write concern used to save the reports
+        self.write_concern = write_concern
+
+        #: (int): Maximum number of reports packed in one document
+        self.bucket_size = bucket_size
+
+        #: (timedelta): Time window covered by a bucket
+        self.bucket_window = timedelta(milliseconds=bucket_window)
+
+        #: (int): Number of documents returned by each batch of the cursors
+        self.batch_size = batch_size
+
+        #: (str): Reader used in stream mode
+        self.stream_reader = stream_reader
+
+        #: (int): Maximum number of documents fetched by one request in stream mode
+        self.stream_batch_size = stream_batch_size
+
+        #: (str): Field on which the documents are sorted when claimed by batches
+        self.stream_sort_key = stream_sort_key
+
+        #: (bool): True if the documents are read as raw reports
+        self.pass_through = pass_through
+
     def connect(self):
         """
         Override from BaseDB.
@@ -144,6 +379,16 @@ class MongoDB(BaseDB):
             raise MongoBadDBError(self.uri) from exn
 
         self.collection = self.mongo_client[self.db_name][self.collection_name]
+        if self.write_concern is not None:
+            self.collection = self.collection.with_options(
+                write_concern=pymongo.write_concern.WriteConcern(**self.write_concern))
+        if self.pass_through:
+            self.collection = self.collection.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+
+        if self.bucket_size is not None:
+            # The buckets are upserted on their sensor, target, time window and fields
+            self.collection.create_index([('sensor', pymongo.ASCENDING), ('target', pymongo.ASCENDING),
+                                          ('timestamp', pymongo.ASCENDING), ('fields', pymongo.ASCENDING)])
 
     def disconnect(self):
         """
@@ -162,6 +407,10 @@ class MongoDB(BaseDB):
 
         :param report: Report to save
         """
+        if self.bucket_size is not None:
+            self.save_many([report])
+            return
+
         self.collection.insert_one(self.report_type.to_mongodb(report))
 
     def save_many(self, reports: list[Report]):
@@ -170,5 +419,57 @@ class MongoDB(BaseDB):
 
         :param reports: Batch of data.
         """
+        if not reports:
+            return
+
+        if self.bucket_size is not None:
+            self.collection.bulk_write(self._create_bucket_updates(reports), ordered=self.ordered)
+            return
+
         serialized_reports = list(map(self.report_type.to_mongodb, reports))
-        self.collection.insert_many(serialized_reports)
+        self.collection.insert_many(serialized_reports, ordered=self.ordered)
+
+    def _bucket_start(self, report: Report):
+        """
+        :return: The beginning of the time window of the bucket containing the given report
+        """
+        window = self.bucket_window // timedelta(microseconds=1)
+        offset = int(report.timestamp.replace(tzinfo=timezone.utc).timestamp() * 1000000) % window
+        return report.timestamp - timedelta(microseconds=offset)
+
+    def _create_bucket_updates(self, reports: list[Report]) -> list:
+        """
+        Pack the reports in columns of the buckets of their sensor, target, time window and fields
+        :return: The upserts appending the columns to the buckets that are not full
+        """
+        buckets = {}
+        for report in reports:
+            document = self.report_type.to_mongodb(report)
+            fields = tuple(sorted(field for field in document if field not in ('sensor', 'target', '_id')))
+            key = (report.sensor, report.target, self._bucket_start(report), fields)
+            bucket = buckets.setdefault(key, [])
+            if not bucket or len(bucket[-1]) == self.bucket_size:
+                bucket.append([])
+            bucket[-1].append(document)
+
+        updates = []
+        for (sensor, target, start, fields), chunks in buckets.items():
+            for documents in chunks:
+                updates.append(pymongo.UpdateOne(
+                    {'sensor': sensor, 'target': target, 'timestamp': start, 'fields': list(fields),
+                     'count': {'$lte': self.bucket_size - len(documents)}},
+                    {'$push': {'reports.' + field: {'$each': [document[field] for document in documents]}
+                               for field in fields},
+                     '$inc': {'count': len(documents)}},
+                    upsert=True))
+        return updates
+
+    @staticmethod
+    def unpack_bucket(bucket: dict) -> list[dict]:
+        """
+        :return: The documents of the reports packed in the given bucket
+        """
+        columns = bucket['reports']
+        return [dict({field: column[index] for field, column in columns.items()},
+                     sensor=bucket['sensor'], target=bucket['target'])
+                for index in range(bucket['count'])]
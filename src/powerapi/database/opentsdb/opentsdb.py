@@ -27,8 +27,15 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
 import logging
-from datetime import timezone
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 try:
     from opentsdb import TSDBClient
 except ImportError:
@@ -44,14 +51,35 @@ class CantConnectToOpenTSDBException(DBError):
     """
 
 
+#: (datetime): Origin of the timestamps sent to OpenTSDB, the timestamps of the reports are in UTC
+EPOCH = datetime(1970, 1, 1)
+ONE_SECOND = timedelta(seconds=1)
+
+
+def to_epoch_seconds(timestamp: datetime) -> int:
+    """
+    Convert the timestamp of a report (in UTC) into a number of seconds since the epoch
+    """
+    return (timestamp.replace(tzinfo=None) - EPOCH) // ONE_SECOND
+
+
 class OpenTSDB(BaseDB):
     """
     OpenTSDB class herited from BaseDB
 
     Allow to handle an OpenTSDB database to save PowerReport.
+
+    By default, each report is given to the client of opentsdb-py. In batching
+    mode, the data points are buffered and sent as one json payload to the
+    ``/api/put`` endpoint of the HTTP API every *batch_size* data points or
+    *flush_interval* ms, a timer sends the buffered data points when no report
+    is saved before the flush interval expires. Up to *concurrency* payloads are sent at the same
+    time, a failed payload is sent again up to *max_retries* times.
     """
 
-    def __init__(self, report_type: type[Report], host: str, port, metric_name: str):
+    def __init__(self, report_type: type[Report], host: str, port, metric_name: str, batching: bool = False,
+                 batch_size: int = 1000, flush_interval: int = 1000, concurrency: int = 2,
+                 retry_interval: int = 1000, max_retries: int = 3, request_timeout: int = 5000):
         """
         :param host:             host of the OpenTSDB server
         :param port:            port of the OpenTSDB server
@@ -61,6 +89,13 @@ class OpenTSDB(BaseDB):
 
         :param report_type:        type of report handled by this database
 
+        :param batching:        send the data points in batches with the HTTP API
+        :param batch_size:      number of data points sent in one request in batching mode
+        :param flush_interval:  maximum time (in ms) before the buffered data points are sent in batching mode
+        :param concurrency:     maximum number of requests sent at the same time in batching mode
+        :param retry_interval:  time (in ms) before the first retry of a failed request, doubled at each retry
+        :param max_retries:     maximum number of retries of a failed request in batching mode
+        :param request_timeout: timeout (in ms) of a request in batching mode
         """
         BaseDB.__init__(self, report_type)
         self.host = host
@@ -69,6 +104,33 @@ class OpenTSDB(BaseDB):
 
         self.client = None
 
+        self.batching = batching
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.concurrency = concurrency
+        self.retry_interval = retry_interval
+        self.max_retries = max_retries
+        self.request_timeout = request_timeout
+
+        #: (list): Data points waiting to be sent in batching mode
+        self.data_points = []
+        self.last_flush_time = time.monotonic()
+        #: (threading.Timer): Timer sending the buffered data points when the flush interval expires
+        self.flush_timer = None
+        #: (threading.Lock): Lock protecting the buffer and the requests from the flush timer
+        self.lock = threading.Lock()
+        self.executor = None
+        #: (deque): Futures of the requests being sent, from the oldest to the newest
+        self.pending_requests = deque()
+        self.dropped_data_points_count = 0
+
+    @property
+    def url(self) -> str:
+        """
+        URL of the HTTP API of the OpenTSDB server
+        """
+        return f'http://{self.host}:{self.port}/api'
+
     def __iter__(self):
         raise NotImplementedError()
 
@@ -81,6 +143,10 @@ class OpenTSDB(BaseDB):
         been created without failure.
 
         """
+        if self.batching:
+            self._connect_http_api()
+            return
+
         # close connection if reload
         if self.client is not None:
             self.client.close()
@@ -91,10 +157,106 @@ class OpenTSDB(BaseDB):
         if not self.client.is_connected() and not self.client.is_alive():
             raise CantConnectToOpenTSDBException('connexion error')
 
+    def _connect_http_api(self):
+        """
+        Check that the HTTP API of the OpenTSDB server answers and start the threads sending the requests
+        """
+        try:
+            with urllib.request.urlopen(self.url + '/version', timeout=self.request_timeout / 1000):
+                pass
+        except (urllib.error.URLError, OSError) as exn:
+            raise CantConnectToOpenTSDBException('connexion error') from exn
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='opentsdb')
+        self.last_flush_time = time.monotonic()
+
     def disconnect(self):
         """
         Disconnect from the OpenTSDB database.
+
+        In batching mode, the buffered data points are sent and the pending requests are waited.
+        """
+        if self.executor is not None:
+            with self.lock:
+                self.flush()
+                while self.pending_requests:
+                    self._wait_oldest_request()
+                self.executor.shutdown()
+                self.executor = None
+
+    def _to_data_point(self, report: PowerReport) -> dict:
         """
+        Convert a report into a data point of the HTTP API
+        """
+        return {'metric': self.metric_name, 'timestamp': to_epoch_seconds(report.timestamp), 'value': report.power,
+                'tags': {'host': report.target}}
+
+    def _send_payload(self, payload: bytes, data_points_count: int) -> bool:
+        """
+        Send a json payload to the HTTP API, retrying if the request failed
+        :return: True if the payload was stored by the server
+        """
+        request = urllib.request.Request(self.url + '/put', data=payload, method='POST',
+                                         headers={'Content-Type': 'application/json'})
+        for retry in range(self.max_retries + 1):
+            if retry > 0:
+                time.sleep(self.retry_interval * 2 ** (retry - 1) / 1000)
+            try:
+                with urllib.request.urlopen(request, timeout=self.request_timeout / 1000):
+                    return True
+            except (urllib.error.URLError, OSError) as exn:
+                logging.warning('Failed to send %d data points to OpenTSDB (attempt %d): %s', data_points_count,
+                                retry + 1, exn)
+        return False
+
+    def _wait_oldest_request(self):
+        """
+        Wait the end of the oldest pending request and count its data points if they were dropped
+        """
+        future, data_points_count = self.pending_requests.popleft()
+        if not future.result():
+            logging.error('Dropped %d data points after %d retries', data_points_count, self.max_retries)
+            self.dropped_data_points_count += data_points_count
+
+    def flush(self, full_batches_only: bool = False):
+        """
+        Send the buffered data points in batches, waiting the oldest requests when *concurrency* requests are pending
+        :param full_batches_only: keep the last data points in the buffer if they don't fill a batch
+        """
+        min_batch_size = self.batch_size if full_batches_only else 1
+        while len(self.data_points) >= min_batch_size:
+            batch = self.data_points[:self.batch_size]
+            del self.data_points[:self.batch_size]
+
+            while len(self.pending_requests) >= self.concurrency or \
+                    (self.pending_requests and self.pending_requests[0][0].done()):
+                self._wait_oldest_request()
+
+            future = self.executor.submit(self._send_payload, json.dumps(batch).encode(), len(batch))
+            self.pending_requests.append((future, len(batch)))
+
+        if not self.data_points:
+            self.last_flush_time = time.monotonic()
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+
+    def _start_flush_timer(self):
+        """
+        Start the timer sending the buffered data points once the flush interval expired
+        """
+        self.flush_timer = threading.Timer(self.flush_interval / 1000, self._flush_on_timer)
+        self.flush_timer.daemon = True
+        self.flush_timer.start()
+
+    def _flush_on_timer(self):
+        """
+        Send the buffered data points if the database is still connected
+        """
+        with self.lock:
+            if self.executor is not None and self.data_points:
+                self.flush()
 
     def save(self, report: PowerReport):
         """
@@ -102,8 +264,12 @@ class OpenTSDB(BaseDB):
 
         :param report: Report to save
         """
-        self.client.send(self.metric_name, report.power,
-                         timestamp=int(report.timestamp.replace(tzinfo=timezone.utc).timestamp()), host=report.target)
+        if self.batching:
+            self.save_many([report])
+            return
+
+        self.client.send(self.metric_name, report.power, timestamp=to_epoch_seconds(report.timestamp),
+                         host=report.target)
 
     def save_many(self, reports: list[Report]):
         """
@@ -111,6 +277,17 @@ class OpenTSDB(BaseDB):
 
         :param reports: Batch of data.
         """
+        if not self.batching:
+            for report in reports:
+                self.save(report)
+            return
 
-        for report in reports:
-            self.save(report)
+        with self.lock:
+            if not self.data_points:
+                self.last_flush_time = time.monotonic()
+                self._start_flush_timer()
+            self.data_points.extend(self._to_data_point(report) for report in reports)
+            if time.monotonic() - self.last_flush_time >= self.flush_interval / 1000:
+                self.flush()
+            elif len(self.data_points) >= self.batch_size:
+                self.flush(full_batches_only=True)
@@ -28,9 +28,11 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import time
 
 try:
-    from prometheus_client import start_http_server, Gauge
+    from prometheus_client import start_http_server, Gauge, REGISTRY
+    from prometheus_client.core import GaugeMetricFamily
 except ImportError:
     logging.getLogger().info("prometheus-client is not installed.")
 
@@ -41,6 +43,7 @@ DEFAULT_ADDRESS = '127.0.0.1'
 DEFAULT_METRIC_DESCRIPTION = 'energy consumption'
 DEFAULT_MODEL_VALUE = 'PowerReport'
 DEFAULT_PUSHER_NAME = 'pusher_prometheus'
+DEFAULT_SCRAPE_INTERVAL = 15000
 TAGS_KEY = 'tags'
 VALUE_KEY = 'value'
 TIME_KEY = 'time'
@@ -55,13 +58,15 @@ class BasePrometheusDB(BaseDB):
     """
 
     def __init__(self, report_type: type[Report], port: int, metric_name: str,
-                 tags: list[str], metric_description: str = DEFAULT_METRIC_DESCRIPTION, address: str = DEFAULT_ADDRESS):
+                 tags: list[str], metric_description: str = DEFAULT_METRIC_DESCRIPTION, address: str = DEFAULT_ADDRESS,
+                 registry=None):
         BaseDB.__init__(self, report_type)
         self.address = address
         self.port = port
         self.metric_name = metric_name
         self.metric_description = metric_description
         self.tags = tags
+        self.registry = registry if registry is not None else REGISTRY
 
     def _init_metrics(self):
         raise NotImplementedError()
@@ -70,7 +75,7 @@ class BasePrometheusDB(BaseDB):
         """
         Start an HTTP server exposing metrics
         """
-        start_http_server(port=self.port, addr=self.address)
+        start_http_server(port=self.port, addr=self.address, registry=self.registry)
 
     def disconnect(self):
         """
@@ -78,20 +83,96 @@ class BasePrometheusDB(BaseDB):
         """
 
 
+class SnapshotCollector:
+    """
+    Prometheus collector rendering the last value of each series of a metric
+    in one pass when the metric is scraped
+
+    If *stale_delay* is defined, the series that were not updated during this
+    delay are removed when the metric is scraped.
+    """
+
+    def __init__(self, metric_name: str, metric_description: str, labels_names: list[str],
+                 stale_delay: float | None = None):
+        """
+        :param metric_name: the name of the metric
+        :param metric_description: short sentence that describe the metric
+        :param labels_names: name of the labels of the metric
+        :param stale_delay: time (in s) after which a series that is not updated is removed, None keep all the series
+        """
+        self.metric_name = metric_name
+        self.metric_description = metric_description
+        self.labels_names = labels_names
+        self.stale_delay = stale_delay
+
+        #: (dict): Last value of each series, by labels values
+        self.values = {}
+
+        #: (dict): Last update time of each series, by labels values
+        self.series_last_update = {}
+
+    def set(self, labels_values: tuple, value):
+        """
+        Set the value of the series with the given labels values
+        """
+        self.values[labels_values] = value
+        if self.stale_delay is not None:
+            self.series_last_update[labels_values] = time.monotonic()
+
+    def describe(self):
+        """
+        Describe the metric without collecting its series
+        """
+        return [GaugeMetricFamily(self.metric_name, self.metric_description, labels=self.labels_names)]
+
+    def collect(self):
+        """
+        Remove the stale series and render the current snapshot of the series
+        """
+        if self.stale_delay is not None:
+            now = time.monotonic()
+            for labels_values, last_update in list(self.series_last_update.items()):
+                if now - last_update > self.stale_delay:
+                    self.series_last_update.pop(labels_values, None)
+                    self.values.pop(labels_values, None)
+
+        metric = GaugeMetricFamily(self.metric_name, self.metric_description, labels=self.labels_names)
+        for labels_values, value in list(self.values.items()):
+            metric.add_metric(labels_values, value)
+        yield metric
+
+
 class PrometheusDB(BasePrometheusDB):
     """
     Database that expose received raw power estimations as metrics in order to be scrapped by a prometheus instance
     It can only be used with a pusher actor
+
+    The series of the metric are exposed with a Gauge whose children are kept
+    in a cache by labels values, or with a :class:`SnapshotCollector` if
+    *collector* is True. The labels values of the reports are kept in a cache
+    by sensor, target and values of the metadata used as labels, so that the
+    tags of a report are only generated for the first report of its series.
+
+    If *stale_scrape_count* is defined, the series that were not updated
+    during this number of scrape intervals are removed. The collector removes
+    them when the metric is scraped, the series of the Gauge are checked once
+    per scrape interval when reports are saved.
     """
 
     def __init__(self, report_type: type[Report], port: int, address: str, metric_name: str, metric_description: str,
-                 tags: list[str]):
+                 tags: list[str], collector: bool = False, stale_scrape_count: int | None = None,
+                 scrape_interval: int = DEFAULT_SCRAPE_INTERVAL, registry=None):
         """
         :param address: address that exposes the metric
         :param port: port used to expose the metric
         :param metric_name: the name of the metric
         :param metric_description:  short sentence that describe the metric
         :param tags: metadata used to tag metric
+        :param collector: expose the metric with a collector rendering the last value of each series at scrape time
+        :param stale_scrape_count: number of scrape intervals after which a series that is not updated is removed,
+                                   None keep all the series
+        :param scrape_interval: interval (in ms) between two scrapes of the metric
+        :param registry: prometheus registry of the metric, the default registry if None
         """
         BasePrometheusDB.__init__(self,
                                   report_type=report_type,
@@ -99,7 +180,8 @@ class PrometheusDB(BasePrometheusDB):
                                   address=address,
                                   metric_name=metric_name,
                                   metric_description=metric_description,
-                                  tags=tags)
+                                  tags=tags,
+                                  registry=registry)
 
         self.energy_metric = None
         self.energy_metric_labels_names = None
@@ -107,14 +189,44 @@ class PrometheusDB(BasePrometheusDB):
         self.metrics_initialized = False
         self.are_config_tags = True
 
+        self.collector = collector
+        self.stale_delay = None if stale_scrape_count is None else stale_scrape_count * scrape_interval / 1000
+        self.scrape_interval = scrape_interval / 1000
+
+        #: (dict): Labels values of the reports, by sensor, target, metadata keys and values of the labels metadata
+        self.reports_labels_values = {}
+
+        #: (dict): Metadata keys used as labels, by metadata keys of the reports
+        self.labels_metadata_keys = {}
+
+        #: (dict): Gauge child of each series, by labels values
+        self.metric_children = {}
+
+        #: (dict): Last update time of each series, by labels values
+        self.series_last_update = {}
+        self.last_stale_series_check = time.monotonic()
+
     def __iter__(self):
         raise NotImplementedError()
 
     def _init_metrics(self):
 
         if not self.metrics_initialized:
+            if self.energy_metric is not None:
+                self.registry.unregister(self.energy_metric)
+            self.reports_labels_values.clear()
+            self.labels_metadata_keys.clear()
+            self.metric_children.clear()
+            self.series_last_update.clear()
+
             self.energy_metric_labels_names = [SENSOR_TAG, TARGET_TAG, *self.tags]
-            self.energy_metric = Gauge(self.metric_name, self.metric_description, self.energy_metric_labels_names)
+            if self.collector:
+                self.energy_metric = SnapshotCollector(self.metric_name, self.metric_description,
+                                                       self.energy_metric_labels_names, self.stale_delay)
+                self.registry.register(self.energy_metric)
+            else:
+                self.energy_metric = Gauge(self.metric_name, self.metric_description, self.energy_metric_labels_names,
+                                           registry=self.registry)
             self.metrics_initialized = True
 
     def _init_tags(self, metadata_keys):
@@ -139,27 +251,72 @@ class PrometheusDB(BasePrometheusDB):
                     tag_added = True
             self.metrics_initialized = not tag_added
 
-    def _expose_data(self, _, measure):
-        kwargs = {label: measure[TAGS_KEY][label] for label in measure[TAGS_KEY]}
+    def _expose_data(self, labels_values, value):
+        """
+        Set the value of the series with the given labels values
+        """
+        if self.collector:
+            self.energy_metric.set(labels_values, value)
+            return
+
+        child = self.metric_children.get(labels_values)
+        if child is None:
+            child = self.energy_metric.labels(*labels_values)
+            self.metric_children[labels_values] = child
+        child.set(value)
 
-        try:
-            self.energy_metric.labels(**kwargs).set(measure[VALUE_KEY])
-        except TypeError:
-            self.energy_metric.labels(kwargs).set(measure[VALUE_KEY])
+        if self.stale_delay is not None:
+            self.series_last_update[labels_values] = time.monotonic()
 
-    def _add_default_values_missing_tags(self, tags_values):
+    def _remove_stale_series(self):
         """
-        Add "" as default value for tags that are not defined in tags_values
-        :param tags_values: A dictionary with the tags values
+        Remove the series of the Gauge that were not updated during the stale delay, the series are checked once per
+        scrape interval
         """
-        for current_tag in self.energy_metric_labels_names:
-            if current_tag not in tags_values.keys():
-                tags_values[current_tag] = ""
+        now = time.monotonic()
+        if self.collector or self.stale_delay is None or now - self.last_stale_series_check < self.scrape_interval:
+            return
+        self.last_stale_series_check = now
 
-    def _report_to_measure_and_key(self, report):
-        value = self.report_type.to_prometheus(report, self.tags)
-        key = ''.join([str(value[TAGS_KEY][tag]) for tag in value[TAGS_KEY]])
-        return key, value
+        stale_series = {labels_values for labels_values, last_update in self.series_last_update.items()
+                        if now - last_update > self.stale_delay}
+        if not stale_series:
+            return
+
+        for labels_values in stale_series:
+            del self.series_last_update[labels_values]
+            if self.metric_children.pop(labels_values, None) is not None:
+                self.energy_metric.remove(*labels_values)
+        self.reports_labels_values = {key: labels_values for key, labels_values in self.reports_labels_values.items()
+                                      if labels_values not in stale_series}
+
+    def _report_to_labels_values(self, report):
+        """
+        :return: the labels values of the series of the given report and the report value
+        """
+        measure = self.report_type.to_prometheus(report, self.tags)
+        tags = measure[TAGS_KEY]
+        labels_values = tuple(str(tags.get(label, '')) for label in self.energy_metric_labels_names)
+        return labels_values, measure[VALUE_KEY]
+
+    def _get_labels_values_key(self, report):
+        """
+        :return: the key of the labels values of the given report in the cache, only the values of the metadata used
+                 as labels are part of the key so that the other metadata values don't add entries to the cache
+        :raise: TypeError if a metadata used as label is not hashable
+        """
+        metadata_keys = tuple(report.metadata)
+        labels_keys = self.labels_metadata_keys.get(metadata_keys)
+        if labels_keys is None:
+            sanitized_keys = Report.sanitize_tags_name(metadata_keys)
+            labels_keys = frozenset(key for key in metadata_keys
+                                    if not (self.are_config_tags and self.tags) or sanitized_keys[key] in self.tags)
+            self.labels_metadata_keys[metadata_keys] = labels_keys
+
+        # The nested metadata are flattened into labels whose name don't match their key, they are always kept
+        labels_metadata_values = tuple(value for key, value in report.metadata.items()
+                                       if key in labels_keys or isinstance(value, dict))
+        return report.sensor, report.target, metadata_keys, labels_metadata_values
 
     def save(self, report: Report):
         """
@@ -167,13 +324,26 @@ class PrometheusDB(BasePrometheusDB):
 
         :param report: Report to save
         """
-        self._init_tags([*report.metadata.keys()])
-        self._init_metrics()
+        try:
+            key = self._get_labels_values_key(report)
+            labels_values = self.reports_labels_values.get(key)
+        except TypeError:
+            # Metadata with nested values are not cached
+            key = labels_values = None
+
+        if labels_values is not None and self.metrics_initialized:
+            # The value of a power report is its power
+            self._expose_data(labels_values, report.power)
+        else:
+            self._init_tags([*report.metadata.keys()])
+            self._init_metrics()
 
-        key, measure = self._report_to_measure_and_key(report)
-        self._add_default_values_missing_tags(measure[TAGS_KEY])
+            labels_values, value = self._report_to_labels_values(report)
+            if key is not None:
+                self.reports_labels_values[key] = labels_values
+            self._expose_data(labels_values, value)
 
-        self._expose_data(key, measure)
+        self._remove_stale_series()
 
     def save_many(self, reports: list[Report]):
         """
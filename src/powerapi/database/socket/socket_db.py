@@ -27,15 +27,229 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
+import json
 import logging
+import threading
+from collections import deque
 from collections.abc import Iterator
 from json import JSONDecoder, JSONDecodeError
-from queue import SimpleQueue, Empty
+from queue import Empty
 from socketserver import ThreadingMixIn, TCPServer, StreamRequestHandler
 from threading import Thread
 
-from powerapi.database.base_db import IterDB, BaseDB
-from powerapi.report import Report
+from powerapi.database.base_db import IterDB, BaseDB, DBError
+from powerapi.exception import PowerAPIException
+from powerapi.report import Report, BadInputData
+
+#: (tuple): Servers that can be used to receive the documents
+SOCKET_SERVER_MODES = ('threaded', 'asyncio')
+
+#: (tuple): Framings of the documents sent by the clients
+SOCKET_FRAMINGS = ('newline', 'length-prefixed')
+
+#: (int): Maximum number of bytes read from a connection at once
+READ_SIZE = 65536
+
+#: (int): Size (in bytes) of the big-endian length preceding each document with the length-prefixed framing
+FRAME_LENGTH_SIZE = 4
+
+
+class UnknownSocketServerModeException(PowerAPIException):
+    """
+    Exception raised when a SocketDB is created with a server mode that is not in :data:`SOCKET_SERVER_MODES`
+    """
+
+    def __init__(self, server_mode: str):
+        PowerAPIException.__init__(self)
+        self.server_mode = server_mode
+
+
+class UnknownSocketFramingException(PowerAPIException):
+    """
+    Exception raised when a SocketDB is created with a framing that is not in :data:`SOCKET_FRAMINGS`
+    """
+
+    def __init__(self, framing: str):
+        PowerAPIException.__init__(self)
+        self.framing = framing
+
+
+class BufferOverflowException(PowerAPIException):
+    """
+    Exception raised when the data received on a connection exceed the size of its buffer without completing a
+    document
+    """
+
+
+class DocumentQueue:
+    """
+    Thread-safe queue of the documents received by the server.
+    The documents can be retrieved one by one or by batch, waiting for them to be received.
+    """
+
+    def __init__(self):
+        self.documents = deque()
+        self.not_empty = threading.Condition()
+
+    def put(self, document: dict):
+        """
+        Add a document to the queue
+        """
+        with self.not_empty:
+            self.documents.append(document)
+            self.not_empty.notify()
+
+    def put_many(self, documents: list[dict]):
+        """
+        Add several documents to the queue
+        """
+        if not documents:
+            return
+        with self.not_empty:
+            self.documents.extend(documents)
+            self.not_empty.notify_all()
+
+    def get(self, block: bool = True, timeout: float = None) -> dict:
+        """
+        Remove and return the first document of the queue
+        :param block: Wait for a document if the queue is empty
+        :param timeout: Maximum time (in seconds) waited for a document, wait without limit if None
+        :raise: Empty if no document was received
+        """
+        documents = self.get_many(1, timeout if block else 0)
+        if not documents:
+            raise Empty()
+        return documents[0]
+
+    def get_many(self, max_n: int, timeout: float = None) -> list[dict]:
+        """
+        Remove and return up to max_n documents from the queue, waiting for at least one document to be received
+        :param max_n: Maximum number of documents returned
+        :param timeout: Maximum time (in seconds) waited for a document, wait without limit if None
+        :return: The first documents of the queue, empty if no document was received before the timeout
+        """
+        with self.not_empty:
+            if not self.documents and timeout != 0:
+                self.not_empty.wait_for(lambda: self.documents, timeout)
+            count = min(max_n, len(self.documents))
+            return [self.documents.popleft() for _ in range(count)]
+
+    def qsize(self) -> int:
+        """
+        Return the number of documents in the queue
+        """
+        return len(self.documents)
+
+    def empty(self) -> bool:
+        """
+        Return True if the queue is empty
+        """
+        return not self.documents
+
+
+def parse_json_documents(data: str) -> Iterator[dict]:
+    """
+    Try to parse json document(s) from the given string.
+    This function tolerates truncated and malformed json documents.
+    :param data: The raw data to decode
+    :return: Iterator over parsed json documents
+    """
+    decoder = JSONDecoder()
+    idx = 0
+    while idx < len(data):
+        try:
+            obj, end_idx = decoder.raw_decode(data, idx)
+            yield obj
+            idx = end_idx
+
+        # Search and try to parse the remaining document(s)
+        except JSONDecodeError as e:
+            idx = data.find('{', e.pos)
+            if idx == -1:
+                break
+
+
+def decode_documents(payloads: list[bytes]) -> list[dict]:
+    """
+    Decode the json documents contained in the given payloads.
+    The payloads are decoded at once as the elements of a json array, the payloads are decoded one by one with
+    :func:`parse_json_documents` only if one of them is malformed or contains several documents.
+    :param payloads: Payloads (utf-8 charset) received from a client
+    :return: The decoded documents
+    """
+    payloads = [payload for payload in payloads if payload.strip()]
+    if not payloads:
+        return []
+
+    try:
+        return json.loads(b'[' + b','.join(payloads) + b']')
+    except ValueError:
+        return [document for payload in payloads
+                for document in parse_json_documents(payload.decode('utf-8', errors='replace'))]
+
+
+class FramedDocumentReader:
+    """
+    Split the data received on a connection in frames and decode their documents.
+    With the newline framing, each frame is a line. With the length-prefixed framing, each frame is preceded by its
+    size (in bytes) encoded as a 4 bytes big-endian integer.
+    """
+
+    def __init__(self, framing: str, max_buffer_size: int):
+        """
+        :param framing: Framing of the documents, in :data:`SOCKET_FRAMINGS`
+        :param max_buffer_size: Maximum size (in bytes) of the incomplete frame kept between two reads
+        """
+        self.framing = framing
+        self.max_buffer_size = max_buffer_size
+        self.buffer = bytearray()
+
+    def _split_lines(self) -> list[bytes]:
+        end = self.buffer.rfind(b'\n')
+        if end == -1:
+            return []
+        lines = bytes(self.buffer[:end]).split(b'\n')
+        del self.buffer[:end + 1]
+        return lines
+
+    def _split_length_prefixed_frames(self) -> list[bytes]:
+        frames = []
+        offset = 0
+        while len(self.buffer) - offset >= FRAME_LENGTH_SIZE:
+            start = offset + FRAME_LENGTH_SIZE
+            size = int.from_bytes(self.buffer[offset:start], 'big')
+            if size > self.max_buffer_size:
+                raise BufferOverflowException(size)
+            if len(self.buffer) - start < size:
+                break
+            frames.append(bytes(self.buffer[start:start + size]))
+            offset = start + size
+        del self.buffer[:offset]
+        return frames
+
+    def feed(self, data: bytes) -> list[dict]:
+        """
+        Add the received data to the buffer and decode the documents of the complete frames
+        :raise: BufferOverflowException if the incomplete frame exceeds the size of the buffer
+        """
+        self.buffer += data
+        if self.framing == 'newline':
+            frames = self._split_lines()
+        else:
+            frames = self._split_length_prefixed_frames()
+
+        if len(self.buffer) > self.max_buffer_size:
+            raise BufferOverflowException(len(self.buffer))
+        return decode_documents(frames)
+
+    def close(self) -> list[dict]:
+        """
+        Decode the documents of the last line when the connection is closed
+        """
+        if self.framing == 'newline' and self.buffer:
+            return decode_documents([bytes(self.buffer)])
+        return []
 
 
 class ThreadedTCPServer(ThreadingMixIn, TCPServer):
@@ -46,14 +260,19 @@ class ThreadedTCPServer(ThreadingMixIn, TCPServer):
     daemon_threads = True
     allow_reuse_address = True
 
-    def __init__(self, server_address, request_handler_class, received_data_queue: SimpleQueue):
+    def __init__(self, server_address, request_handler_class, received_data_queue: DocumentQueue,
+                 framing: str = 'newline', max_buffer_size: int = 1048576):
         """
         :param server_address: The address to listen on
         :param request_handler_class: The request handler class to use when receiving requests
         :param received_data_queue: The data queue to store the received data
+        :param framing: Framing of the documents sent by the clients
+        :param max_buffer_size: Maximum size (in bytes) of the incomplete document kept for each connection
         """
         super().__init__(server_address, request_handler_class)
         self.received_data_queue = received_data_queue
+        self.framing = framing
+        self.max_buffer_size = max_buffer_size
 
 
 class JsonRequestHandler(StreamRequestHandler):
@@ -70,41 +289,30 @@ class JsonRequestHandler(StreamRequestHandler):
         :param data: The raw data to decode
         :return: Iterator over parsed json documents
         """
-        decoder = JSONDecoder()
-        idx = 0
-        while idx < len(data):
-            try:
-                obj, end_idx = decoder.raw_decode(data, idx)
-                yield obj
-                idx += end_idx
-
-            # Search and try to parse the remaining document(s)
-            except JSONDecodeError as e:
-                idx = data.find('{', e.pos)
-                if idx == -1:
-                    break
+        return parse_json_documents(data)
 
     def handle(self):
         """
         Handle incoming connections.
         The received data is parsed and the result(s) stored in the data queue for further processing.
-        It is expected for the data to be in json format (utf-8 charset) and newline terminated.
+        It is expected for the data to be in json format (utf-8 charset) and framed as configured in the server.
         """
         caddr = '{}:{}'.format(*self.client_address)
         logging.info('New incoming connection from %s', caddr)
 
+        reader = FramedDocumentReader(self.server.framing, self.server.max_buffer_size)
         while True:
             try:
-                data = self.rfile.readline()
+                data = self.rfile.read1(READ_SIZE)
                 if not data:
+                    self.server.received_data_queue.put_many(reader.close())
                     break
 
-                for obj in self.parse_json_documents(data.decode('utf-8')):
-                    self.server.received_data_queue.put(obj)
+                self.server.received_data_queue.put_many(reader.feed(data))
 
-            except ValueError as e:
-                logging.warning('[%s] Received malformed data: %s', caddr, e)
-                continue
+            except BufferOverflowException:
+                logging.warning('[%s] Received a document larger than the buffer, closing the connection', caddr)
+                break
             except OSError as e:
                 logging.error('[%s] Caught OSError while handling request: %s', caddr, e)
                 break
@@ -114,6 +322,88 @@ class JsonRequestHandler(StreamRequestHandler):
         logging.info('Connection from %s closed', caddr)
 
 
+class AsyncioTCPServer:
+    """
+    TCP Server implementation based on asyncio.
+    All the clients are served by the event loop of a single thread.
+    """
+
+    def __init__(self, server_address, received_data_queue: DocumentQueue, framing: str, max_buffer_size: int):
+        """
+        :param server_address: The address to listen on
+        :param received_data_queue: The data queue to store the received data
+        :param framing: Framing of the documents sent by the clients
+        :param max_buffer_size: Maximum size (in bytes) of the incomplete document kept for each connection
+        """
+        self.server_address = server_address
+        self.received_data_queue = received_data_queue
+        self.framing = framing
+        self.max_buffer_size = max_buffer_size
+
+        self.loop = None
+        self.stop_event = None
+        self.started = threading.Event()
+        self.start_error = None
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Handle incoming connections.
+        Each read is split in frames whose documents are decoded at once and stored in the data queue.
+        """
+        caddr = '{}:{}'.format(*writer.get_extra_info('peername')[:2])
+        logging.info('New incoming connection from %s', caddr)
+
+        document_reader = FramedDocumentReader(self.framing, self.max_buffer_size)
+        try:
+            while True:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    self.received_data_queue.put_many(document_reader.close())
+                    break
+
+                self.received_data_queue.put_many(document_reader.feed(data))
+
+        except BufferOverflowException:
+            logging.warning('[%s] Received a document larger than the buffer, closing the connection', caddr)
+        except OSError as e:
+            logging.error('[%s] Caught OSError while handling request: %s', caddr, e)
+        finally:
+            writer.close()
+
+        logging.info('Connection from %s closed', caddr)
+
+    async def serve(self):
+        """
+        Serve the clients until the server is stopped
+        """
+        self.loop = asyncio.get_running_loop()
+        self.stop_event = asyncio.Event()
+        server = await asyncio.start_server(self.handle_connection, *self.server_address, reuse_address=True)
+        async with server:
+            logging.info('TCP socket is listening on %s:%s', *self.server_address)
+            self.started.set()
+            await self.stop_event.wait()
+
+    def serve_forever(self):
+        """
+        Run the event loop serving the clients
+        """
+        try:
+            asyncio.run(self.serve())
+        except OSError as exn:
+            logging.error('Failed to listen on %s:%s: %s', *self.server_address, exn)
+            self.start_error = exn
+        finally:
+            self.started.set()
+
+    def shutdown(self):
+        """
+        Stop the server from another thread
+        """
+        if self.loop is not None and self.stop_event is not None:
+            self.loop.call_soon_threadsafe(self.stop_event.set)
+
+
 class IterSocketDB(IterDB):
     """
     SocketDB iterator that returns the received data.
@@ -129,30 +419,79 @@ class IterSocketDB(IterDB):
         except Empty as e:
             raise StopIteration from e
 
+    def _to_reports(self, documents: list[dict]) -> list[Report]:
+        """
+        Create the reports of the received documents, the malformed documents are skipped
+        """
+        reports = []
+        for document in documents:
+            try:
+                reports.append(self.report_type.from_json(document))
+            except BadInputData as exn:
+                logging.error('Received malformed report from socket: %s', exn.msg)
+                logging.debug('Raw report value: %s', exn.input_data)
+        return reports
+
+    def next_batch(self, max_n: int, timeout: int) -> list[Report]:
+        """
+        Return up to max_n reports, waiting at most timeout ms for a document to be received
+        """
+        return self._to_reports(self.db.received_data_queue.get_many(max_n, timeout / 1000))
+
+    def iter_batches(self, size: int) -> Iterator[list[Report]]:
+        """
+        Iterate on the received documents by batch of at most size reports, until the queue is empty
+        """
+        while True:
+            documents = self.db.received_data_queue.get_many(size, 0)
+            if not documents:
+                return
+            reports = self._to_reports(documents)
+            if reports:
+                yield reports
+
 
 class SocketDB(BaseDB):
     """
     Database implementation that exposes a TCP socket the clients can connect to.
+
+    By default, each client is served by a separate thread. With the asyncio
+    server mode, all the clients are served by the event loop of a single
+    thread.
     """
 
-    def __init__(self, report_type: type[Report], host: str, port: int):
+    def __init__(self, report_type: type[Report], host: str, port: int, server_mode: str = 'threaded',
+                 framing: str = 'newline', max_buffer_size: int = 1048576):
         """
         :param report_type: The type of report to create
         :param host: The host address to listen on
         :param port: The port number to listen on
+        :param server_mode: The server receiving the documents, in :data:`SOCKET_SERVER_MODES`
+        :param framing: The framing of the documents sent by the clients, in :data:`SOCKET_FRAMINGS`
+        :param max_buffer_size: The maximum size (in bytes) of the incomplete document kept for each connection
         """
+        if server_mode not in SOCKET_SERVER_MODES:
+            raise UnknownSocketServerModeException(server_mode)
+        if framing not in SOCKET_FRAMINGS:
+            raise UnknownSocketFramingException(framing)
+
         super().__init__(report_type)
 
         self.server_address = (host, port)
+        self.server_mode = server_mode
+        self.framing = framing
+        self.max_buffer_size = max_buffer_size
 
         self.received_data_queue = None
         self.background_thread = None
+        self.server = None
 
     def _tcpserver_background_thread_target(self):
         """
         Target function of the thread that will run the TCP server in background.
         """
-        with ThreadedTCPServer(self.server_address, JsonRequestHandler, self.received_data_queue) as server:
+        with ThreadedTCPServer(self.server_address, JsonRequestHandler, self.received_data_queue, self.framing,
+                               self.max_buffer_size) as server:
             logging.info('TCP socket is listening on %s:%s', *self.server_address)
             server.serve_forever()
 
@@ -160,7 +499,17 @@ class SocketDB(BaseDB):
         """
         Connect to the socket database.
         """
-        self.received_data_queue = SimpleQueue()
+        self.received_data_queue = DocumentQueue()
+        if self.server_mode == 'asyncio':
+            self.server = AsyncioTCPServer(self.server_address, self.received_data_queue, self.framing,
+                                           self.max_buffer_size)
+            self.background_thread = Thread(target=self.server.serve_forever, daemon=True)
+            self.background_thread.start()
+            self.server.started.wait()
+            if self.server.start_error is not None:
+                raise DBError(f'Cannot listen on {self.server_address[0]}:{self.server_address[1]}')
+            return
+
         self.background_thread = Thread(target=self._tcpserver_background_thread_target, daemon=True)
         self.background_thread.start()
 
@@ -168,6 +517,10 @@ class SocketDB(BaseDB):
         """
         Disconnect from the socket database.
         """
+        if self.server is not None:
+            self.server.shutdown()
+            self.background_thread.join()
+            self.server = None
 
     def iter(self, stream_mode: bool = False) -> IterSocketDB:
         """
@@ -45,3 +45,16 @@ class DispatchRule:
         :rtype: ([tuple]) a list formula identifier
         """
         raise NotImplementedError()
+
+    def get_signature(self, _report):
+        """
+        return a signature of the report such that the reports with the same
+        signature are sent to the same formulas, it is used to cache the
+        formulas of the reports
+
+        :param _report:
+        :type _report: powerapi.report.report.Report
+        :rtype: (hashable) the signature of the report or None if the formula
+                identifiers of the report must not be cached
+        """
+        return None
@@ -55,6 +55,9 @@ class HWPCDispatchRule(DispatchRule):
         DispatchRule.__init__(self, primary, self._get_fields_by_depth(depth))
         self.depth = depth
 
+        # Name of the non shared group of the reports, keyed by sensor and group names
+        self._non_shared_group_names = {}
+
     @staticmethod
     def _get_fields_by_depth(depth: HWPCDepthLevel) -> list[str]:
         if depth == HWPCDepthLevel.TARGET:
@@ -72,7 +75,7 @@ class HWPCDispatchRule(DispatchRule):
         if self.depth == HWPCDepthLevel.ROOT:
             return [(report.sensor,)]
 
-        non_shared_group = _extract_non_shared_group(report)
+        non_shared_group = self._get_non_shared_group(report)
 
         if self.depth == HWPCDepthLevel.SOCKET:
             id_list = []
@@ -90,6 +93,38 @@ class HWPCDispatchRule(DispatchRule):
 
         return []
 
+    def get_signature(self, report):
+        """
+        The formula identifiers of a report at SOCKET or CORE depth only
+        depend on the sensor and on the sockets and cores of its non shared
+        group
+
+        See :meth:`DispatchRule.get_signature <powerapi.dispatch_rule.dispatch_rule.DispatchRule.get_signature>`
+        """
+        if self.depth == HWPCDepthLevel.SOCKET:
+            return report.sensor, tuple(self._get_non_shared_group(report))
+
+        if self.depth == HWPCDepthLevel.CORE:
+            non_shared_group = self._get_non_shared_group(report)
+            return report.sensor, tuple(non_shared_group), tuple(map(tuple, non_shared_group.values()))
+
+        return None
+
+    def _get_non_shared_group(self, report):
+        """
+        Get the non shared group of the given report.
+        The events of a group are shared or not according to the sensor configuration, so the name of the non shared
+        group is only searched for the first report of a sensor having a given set of groups
+
+        :rtype:{str:HWPCReportSocket}: a group containing ReportSocket
+        """
+        key = report.sensor, tuple(report.groups)
+        group_name = self._non_shared_group_names.get(key)
+        if group_name is None:
+            group_name = _extract_non_shared_group_name(report)
+            self._non_shared_group_names[key] = group_name
+        return report.groups[group_name]
+
 
 def _number_of_core_per_socket(group):
     """
@@ -98,22 +133,22 @@ def _number_of_core_per_socket(group):
     :type group: Dict
     :rtype: int : the number of core per socket in this group
     """
-    return len(list(group.values())[0])
+    return len(next(iter(group.values())))
 
 
-def _extract_non_shared_group(report):
+def _extract_non_shared_group_name(report):
     """
-    extract a non shared group form the given report.
+    extract the name of a non shared group form the given report.
     A shared group is a group that contains events that are shared between
     multiple cores (like RAPL or PCU)
 
-    :rtype:{str:HWPCReportSocket}: a group containing ReportSocket
+    :rtype: str: the name of the group
     """
-    biggest_group = None
+    biggest_group_name = None
     maximum_number_of_core = -1
-    for _, group in report.groups.items():
+    for group_name, group in report.groups.items():
         number_of_core = _number_of_core_per_socket(group)
         if number_of_core > maximum_number_of_core:
             maximum_number_of_core = number_of_core
-            biggest_group = group
-    return biggest_group
+            biggest_group_name = group_name
+    return biggest_group_name
@@ -28,3 +28,5 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from powerapi.dispatcher.dispatcher_actor import DispatcherActor, RouteTable
+from powerapi.dispatcher.formula_worker import FormulaWorkerActor, PooledFormula
+from powerapi.dispatcher.hash_ring import FormulaHashRing
@@ -28,17 +28,23 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
+import os
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Literal
 
 from powerapi.actor import Actor, State
+from powerapi.dispatch_rule import DispatchRule
+from powerapi.dispatcher.formula_worker import FormulaWorkerActor, PooledFormula
 from powerapi.dispatcher.handlers import FormulaDispatcherReportHandler, DispatcherPoisonPillMessageHandler
+from powerapi.dispatcher.hash_ring import FormulaHashRing
 from powerapi.dispatcher.route_table import RouteTable
 from powerapi.formula import FormulaActor
 from powerapi.handler import StartHandler
 from powerapi.message import PoisonPillMessage, StartMessage
 from powerapi.pusher import PusherActor
-from powerapi.report import Report
+from powerapi.report import Report, get_report_type
 
 
 class DispatcherState(State):
@@ -46,31 +52,147 @@ class DispatcherState(State):
     Dispatcher actor state.
     """
 
-    def __init__(self, actor, pushers: dict[str, PusherActor], route_table: RouteTable):
+    def __init__(self, actor, pushers: dict[str, PusherActor], route_table: RouteTable, formula_pool_size: int = 0,
+                 formula_idle_timeout: int | None = None, max_formulas: int | None = None):
         """
         :param actor: Dispatcher actor instance
         :param pushers: List of pushers
         :param route_table: Route table to use for reports
+        :param formula_pool_size: Number of formula workers hosting the formulas, 0 to launch an actor per formula
+        :param formula_idle_timeout: Time in millisecond without report after which a formula is evicted
+        :param max_formulas: Maximum number of live formulas, the least recently used formula is evicted beyond
         """
         super().__init__(actor)
 
-        self.formula_dict = {}
+        # Formulas ordered from the least to the most recently used
+        self.formula_dict = OrderedDict()
+        self.formula_last_use = {}
+
+        self.formula_idle_timeout = formula_idle_timeout
+        self.max_formulas = max_formulas
+
+        self.created_formulas_count = 0
+        self.evicted_formulas_count = 0
+
+        # Formulas of the reports, keyed by report type and dispatch rule signature
+        self.formula_cache = {}
 
         self.pushers = pushers
         self.route_table = route_table
 
-    def add_formula(self, formula_id: tuple) -> FormulaActor:
+        self.formula_workers = {}
+        self.formula_hash_ring = FormulaHashRing(formula_pool_size) if formula_pool_size > 0 else None
+
+    def add_formula(self, formula_id: tuple) -> FormulaActor | PooledFormula:
         """
         Create a new formula corresponding to the given ID.
+        In pooled mode, the formula is hosted by the formula worker the formula id is mapped onto.
         :param formula_id: The formula ID
         :return: The new formula actor
         """
-        formula = self.actor.formula_init_function(name=str((self.actor.name, *formula_id)), pushers=self.pushers)
-        self.supervisor.launch_actor(formula, False)
+        if self.max_formulas is not None:
+            while len(self.formula_dict) >= self.max_formulas:
+                self.remove_formula(next(iter(self.formula_dict)))
+
+        if self.formula_hash_ring is not None:
+            worker = self.get_formula_worker(self.formula_hash_ring.get_worker(formula_id))
+            formula = PooledFormula(worker, formula_id, self.actor.name)
+        else:
+            formula = self.actor.formula_init_function(name=str((self.actor.name, *formula_id)), pushers=self.pushers)
+            self.supervisor.launch_actor(formula, False)
+
         self.formula_dict[formula_id] = formula
+        self.created_formulas_count += 1
         return formula
 
-    def get_formula(self, formula_id: tuple) -> FormulaActor:
+    def remove_formula(self, formula_id: tuple):
+        """
+        Evict the formula corresponding to the given ID, the formula is soft-killed.
+        It will be created again if a report is dispatched to it.
+        :param formula_id: The formula ID
+        """
+        formula = self.formula_dict.pop(formula_id)
+        self.formula_last_use.pop(formula_id, None)
+        self.formula_cache.clear()
+        self.supervisor.kill_actor(formula, soft=True)
+        self.evicted_formulas_count += 1
+        self.actor.logger.debug('Evicted formula %s (%s)', formula_id, self.get_formula_counters())
+
+    def evict_idle_formulas(self):
+        """
+        Evict the formulas that did not receive any report for the formula idle timeout.
+        """
+        if self.formula_idle_timeout is None:
+            return
+
+        idle_deadline = time.monotonic() - self.formula_idle_timeout / 1000
+        while self.formula_dict:
+            formula_id = next(iter(self.formula_dict))
+            if self.formula_last_use[formula_id] > idle_deadline:
+                return
+            self.remove_formula(formula_id)
+
+    def get_report_formulas(self, dispatch_rule: DispatchRule, report: Report) -> list[FormulaActor | PooledFormula]:
+        """
+        Get the formulas the given report must be sent to, according to the dispatch rule.
+        The formulas of the reports having the same dispatch rule signature are cached.
+        :param dispatch_rule: The dispatch rule of the report
+        :param report: The report to dispatch
+        :return: The formula actors
+        """
+        signature = dispatch_rule.get_signature(report)
+        if signature is None:
+            return [self.get_formula(formula_id) for formula_id in dispatch_rule.get_formula_id(report)]
+
+        cache_key = (get_report_type(report).__name__, signature)
+        cached_formulas = self.formula_cache.get(cache_key)
+        if cached_formulas is None:
+            cached_formulas = [(formula_id, self.get_formula(formula_id))
+                               for formula_id in dispatch_rule.get_formula_id(report)]
+            # A formula evicted to create the next ones must not be cached
+            if all(formula_id in self.formula_dict for formula_id, _ in cached_formulas):
+                self.formula_cache[cache_key] = cached_formulas
+        elif self.formula_idle_timeout is not None or self.max_formulas is not None:
+            self.touch_formulas(formula_id for formula_id, _ in cached_formulas)
+
+        return [formula for _, formula in cached_formulas]
+
+    def touch_formulas(self, formula_ids):
+        """
+        Mark the given formulas as used now.
+        :param formula_ids: The formula ids
+        """
+        now = time.monotonic()
+        for formula_id in formula_ids:
+            self.formula_dict.move_to_end(formula_id)
+            self.formula_last_use[formula_id] = now
+
+    def get_formula_counters(self) -> dict[str, int]:
+        """
+        :return: The number of live, created and evicted formulas
+        """
+        return {
+            'live': len(self.formula_dict),
+            'created': self.created_formulas_count,
+            'evicted': self.evicted_formulas_count
+        }
+
+    def get_formula_worker(self, index: int) -> FormulaWorkerActor:
+        """
+        Get the formula worker with the given index.
+        The worker will be launched if it does not exist.
+        :param index: The worker index
+        :return: The formula worker actor
+        """
+        if index not in self.formula_workers:
+            worker = FormulaWorkerActor(f'{self.actor.name}_formula_worker_{index}', self.actor.formula_init_function,
+                                        self.pushers, self.actor.name, self.actor.logger.level)
+            self.supervisor.launch_actor(worker, False)
+            self.formula_workers[index] = worker
+
+        return self.formula_workers[index]
+
+    def get_formula(self, formula_id: tuple) -> FormulaActor | PooledFormula:
         """
         Get the formula corresponding to the given formula id.
         The formula will be created if it does not exist.
@@ -78,9 +200,13 @@ class DispatcherState(State):
         :return: The formula actor
         """
         if formula_id not in self.formula_dict:
-            return self.add_formula(formula_id)
+            formula = self.add_formula(formula_id)
+        else:
+            formula = self.formula_dict[formula_id]
+            self.formula_dict.move_to_end(formula_id)
 
-        return self.formula_dict[formula_id]
+        self.formula_last_use[formula_id] = time.monotonic()
+        return formula
 
 
 class DispatcherActor(Actor):
@@ -91,21 +217,42 @@ class DispatcherActor(Actor):
     """
 
     def __init__(self, name: str, formula_init_function: Callable, pushers: [], route_table: RouteTable,
-                 level_logger: Literal = logging.WARNING, timeout=None):
+                 level_logger: Literal = logging.WARNING, timeout=None, batch_size: int = 1, batch_delay: int = 10,
+                 serializer: str = 'pickle', transport: str = 'tcp', formula_pool_size: int | None = 0,
+                 formula_idle_timeout: int | None = None, max_formulas: int | None = None):
         """
         :param name: Actor name
         :param formula_init_function: Factory function for creating Formula
         :param route_table: Routing table to use for dispatching the reports
         :param level_logger: Logging level
-        :param timeout: Time in millisecond to wait for a message before running the timeout handler
+        :param timeout: Time in millisecond to wait for a message before running the timeout handler, bounded by the
+                        formula idle timeout
+        :param batch_size: Maximum number of reports sent to the dispatcher in one batch (1 disable batching)
+        :param batch_delay: Maximum time in millisecond a report sent to the dispatcher can wait in a batch
+        :param serializer: Name of the serializer used to encode the messages sent to the dispatcher
+        :param transport: Transport used by the sockets of the dispatcher (tcp or ipc)
+        :param formula_pool_size: Number of formula worker processes hosting the formulas, each formula id is always
+                                  mapped onto the same worker. 0 launch an actor per formula id, None size the pool to
+                                  the number of available cores
+        :param formula_idle_timeout: Time in millisecond without report after which a formula is soft-killed and
+                                     removed, None to keep the formulas until the dispatcher is stopped
+        :param max_formulas: Maximum number of live formulas, the least recently used formula is evicted when a new
+                             formula is needed beyond this limit. None for no limit
         """
-        Actor.__init__(self, name, level_logger, timeout)
+        # The idle formulas are evicted by the timeout handler when no report is received
+        if formula_idle_timeout is not None:
+            timeout = formula_idle_timeout if timeout is None else min(timeout, formula_idle_timeout)
+
+        Actor.__init__(self, name, level_logger, timeout, batch_size, batch_delay, serializer, transport)
 
         # (func): Function for creating Formula
         self.formula_init_function = formula_init_function
 
         # (powerapi.DispatcherState): Actor state
-        self.state = DispatcherState(self, pushers, route_table)
+        if formula_pool_size is None:
+            formula_pool_size = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+        self.state = DispatcherState(self, pushers, route_table, formula_pool_size, formula_idle_timeout,
+                                     max_formulas)
 
     def setup(self):
         """
@@ -113,6 +260,8 @@ class DispatcherActor(Actor):
         """
         super().setup()
 
-        self.add_handler(Report, FormulaDispatcherReportHandler(self.state))
+        report_handler = FormulaDispatcherReportHandler(self.state)
+        self.add_handler(Report, report_handler)
+        self.set_timeout_handler(report_handler)
         self.add_handler(PoisonPillMessage, DispatcherPoisonPillMessageHandler(self.state))
         self.add_handler(StartMessage, StartHandler(self.state))
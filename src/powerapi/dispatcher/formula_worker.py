@@ -0,0 +1,147 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+from collections.abc import Callable
+
+from powerapi.actor import Actor, State
+from powerapi.dispatcher.handlers import FormulaWorkerReportHandler, FormulaWorkerPoisonPillMessageHandler
+from powerapi.formula import FormulaActor
+from powerapi.handler import StartHandler
+from powerapi.message import FormulaReportMessage, PoisonPillMessage, StartMessage
+from powerapi.pusher import PusherActor
+
+
+class FormulaWorkerState(State):
+    """
+    Formula worker actor state.
+    """
+
+    def __init__(self, actor, formula_init_function: Callable, pushers: dict[str, PusherActor], dispatcher_name: str):
+        """
+        :param actor: Formula worker actor instance
+        :param formula_init_function: Factory function for creating Formula
+        :param pushers: Pusher actors given to the formulas
+        :param dispatcher_name: Name of the dispatcher, used to name the formulas
+        """
+        super().__init__(actor)
+
+        self.formula_init_function = formula_init_function
+        self.pushers = pushers
+        self.dispatcher_name = dispatcher_name
+
+        self.formulas = {}
+
+    def get_formula(self, formula_id: tuple) -> FormulaActor:
+        """
+        Get the formula instance corresponding to the given formula id.
+        The formula will be created and set up in the worker process if it does not exist.
+        :param formula_id: The formula id
+        :return: The formula instance
+        """
+        if formula_id not in self.formulas:
+            formula = self.formula_init_function(name=str((self.dispatcher_name, *formula_id)), pushers=self.pushers)
+            formula.setup()
+            self.formulas[formula_id] = formula
+
+        return self.formulas[formula_id]
+
+    def remove_formula(self, formula_id: tuple):
+        """
+        Remove the formula instance corresponding to the given formula id.
+        The formula teardown is not called as its pushers connections are shared with the other formulas.
+        :param formula_id: The formula id
+        """
+        self.formulas.pop(formula_id, None)
+
+
+class FormulaWorkerActor(Actor):
+    """
+    Formula worker actor.
+    This actor hosts many formula instances in its process. The formulas are not started as actors, the reports sent
+    by the dispatcher are directly given to the handlers of their formula.
+    """
+
+    def __init__(self, name: str, formula_init_function: Callable, pushers: dict[str, PusherActor],
+                 dispatcher_name: str, level_logger=logging.WARNING, timeout=None):
+        """
+        :param name: Actor name
+        :param formula_init_function: Factory function for creating Formula
+        :param pushers: Pusher actors given to the formulas
+        :param dispatcher_name: Name of the dispatcher, used to name the formulas
+        :param level_logger: Logging level
+        :param timeout: Time in millisecond to wait for a message before running the timeout handler
+        """
+        Actor.__init__(self, name, level_logger, timeout)
+
+        #: (powerapi.FormulaWorkerState): Actor state
+        self.state = FormulaWorkerState(self, formula_init_function, pushers, dispatcher_name)
+
+    def setup(self):
+        """
+        Setup Formula worker actor handlers.
+        """
+        self.add_handler(FormulaReportMessage, FormulaWorkerReportHandler(self.state))
+        self.add_handler(PoisonPillMessage, FormulaWorkerPoisonPillMessageHandler(self.state))
+        self.add_handler(StartMessage, StartHandler(self.state))
+
+
+class PooledFormula:
+    """
+    Formula hosted by a formula worker, used by the dispatcher like a formula actor.
+    """
+
+    def __init__(self, worker: FormulaWorkerActor, formula_id: tuple, dispatcher_name: str):
+        """
+        :param worker: Formula worker hosting the formula
+        :param formula_id: The formula id
+        :param dispatcher_name: Name of the dispatcher sending the reports
+        """
+        self.worker = worker
+        self.formula_id = formula_id
+        self.dispatcher_name = dispatcher_name
+
+    def is_alive(self) -> bool:
+        """
+        :return: True if the worker hosting the formula is alive
+        """
+        return self.worker.is_alive()
+
+    def send_data(self, msg):
+        """
+        Send a report to the formula through its worker
+        :param msg: The report to send
+        """
+        self.worker.send_data(FormulaReportMessage(self.dispatcher_name, self.formula_id, msg))
+
+    def soft_kill(self):
+        """
+        Ask the worker to remove the formula once the reports already sent to it are handled
+        """
+        self.send_data(PoisonPillMessage(soft=True, sender_name=self.dispatcher_name))
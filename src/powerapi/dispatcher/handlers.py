@@ -27,7 +27,8 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from powerapi.handler import InitHandler, PoisonPillMessageHandler
+from powerapi.handler import Handler, InitHandler, PoisonPillMessageHandler
+from powerapi.message import FormulaReportMessage, PoisonPillMessage
 from powerapi.report import Report
 
 
@@ -49,8 +50,48 @@ class FormulaDispatcherReportHandler(InitHandler):
         Send the report to its corresponding formula(s).
         :param msg: The report to process
         """
+        self.state.evict_idle_formulas()
+
         dispatch_rule = self.state.route_table.get_dispatch_rule(msg)
-        for formula_id in dispatch_rule.get_formula_id(msg):
-            formula = self.state.get_formula(formula_id)
+        for formula in self.state.get_report_formulas(dispatch_rule, msg):
             if formula.is_alive():
                 formula.send_data(msg)
+
+    def handle_timeout(self):
+        """
+        Evict the idle formulas while no report is received.
+        """
+        if not self.state.initialized:
+            return
+
+        self.state.evict_idle_formulas()
+
+
+class FormulaWorkerReportHandler(Handler):
+    """
+    Give the reports sent by the dispatcher to their formula hosted by the worker.
+    """
+
+    def handle(self, msg: FormulaReportMessage):
+        """
+        Handle the report with the handler of its formula, the formula is created if needed.
+        A PoisonPillMessage removes the formula from the worker.
+        :param msg: The message containing the report and its formula id
+        """
+        if isinstance(msg.report, PoisonPillMessage):
+            self.state.remove_formula(msg.formula_id)
+            return
+
+        formula = self.state.get_formula(msg.formula_id)
+        formula.state.get_corresponding_handler(msg.report).handle_message(msg.report)
+
+
+class FormulaWorkerPoisonPillMessageHandler(PoisonPillMessageHandler):
+    """
+    Formula worker Handler for PoisonPillMessage
+    """
+    def teardown(self, soft=False):
+        for formula in self.state.formulas.values():
+            handler = formula.state.handlers.get(PoisonPillMessage.__name__)
+            if isinstance(handler, PoisonPillMessageHandler):
+                handler.teardown(soft)
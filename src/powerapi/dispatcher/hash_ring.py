@@ -0,0 +1,59 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from bisect import bisect
+from zlib import crc32
+
+
+class FormulaHashRing:
+    """
+    Consistent hash ring mapping the formula ids onto a fixed set of workers.
+    A formula id is always mapped to the same worker.
+    """
+
+    def __init__(self, worker_count: int, virtual_nodes: int = 64):
+        """
+        :param worker_count: Number of workers on the ring
+        :param virtual_nodes: Number of points of each worker on the ring, used to spread the formula ids evenly
+        """
+        self.worker_count = worker_count
+
+        points = sorted((crc32(f'{worker}:{node}'.encode()), worker)
+                        for worker in range(worker_count) for node in range(virtual_nodes))
+        self._positions = [position for position, _ in points]
+        self._workers = [worker for _, worker in points]
+
+    def get_worker(self, formula_id: tuple) -> int:
+        """
+        Return the index of the worker in charge of the given formula id.
+        :param formula_id: The formula id
+        :return: The worker index, between 0 and worker_count - 1
+        """
+        index = bisect(self._positions, crc32(repr(formula_id).encode())) % len(self._positions)
+        return self._workers[index]
@@ -28,7 +28,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from powerapi.dispatch_rule import DispatchRule
-from powerapi.report import Report
+from powerapi.report import Report, get_report_type
 
 
 class RouteTable:
@@ -46,10 +46,11 @@ class RouteTable:
     def get_dispatch_rule(self, report: Report) -> DispatchRule | None:
         """
         Return the corresponding dispatch rule for the given report.
+        The dispatch rule of a raw report is the one of the report type contained in its payload.
         param msg: The report to get the dispatch rule for
         return: The corresponding dispatch rule or None if no dispatch rule exists for the report type.
         """
-        return self.route_table.get(report.__class__.__name__, None)
+        return self.route_table.get(get_report_type(report).__name__, None)
 
     def add_dispatch_rule(self, report_type: type[Report], dispatch_rule: DispatchRule):
         """
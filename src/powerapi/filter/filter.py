@@ -28,6 +28,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from powerapi.exception import PowerAPIException
+from powerapi.report import get_report_type
 
 
 class FilterUselessError(PowerAPIException):
@@ -42,11 +43,24 @@ class Filter:
 
     A filter allow the Puller to route Report of the database to Dispatchers
     by fixing some rules.
+
+    A rule is either a function or a report type. The rules are compiled in a
+    routing table giving, for each type of routed report, the dispatchers
+    selected by the report type rules and the functions left to evaluate.
+    A raw report is routed as a report of the type contained in its payload.
+    A dispatcher receives a report once, even if several of its rules accept
+    the report.
+
+    The filters must be modified with :meth:`filter` and :meth:`set_filter`,
+    which clear the routing table.
     """
 
     def __init__(self):
         self.filters = []
 
+        #: (dict): Routes of each report type, compiled from the filters
+        self.routing_table = {}
+
     def filter(self, rule, dispatcher):
         """
         Define a rule for a kind of report, and send it to the dispatcher
@@ -54,25 +68,107 @@ class Filter:
 
         :param (func(report) -> bool) rule:      Function which return if
                                                  the report has to be send to
-                                                 this dispatcher
+                                                 this dispatcher, or type of the
+                                                 reports (subclasses included) to
+                                                 send to this dispatcher
         :param powerapi.Dispatcher dispatcher: Dispatcher we want to send the
                                                  report
         """
         self.filters.append((rule, dispatcher))
+        self.routing_table.clear()
 
-    def route(self, report):
+    def set_filter(self, index: int, rule, dispatcher):
         """
-        Get the list of dispatchers to whom send the report, or None
+        Replace the filter at the given index
 
-        :param powerapi.Report report: Message to send
+        :param int index: Index of the filter in the filters list
+        :param rule: Function or report type, see :meth:`filter`
+        :param powerapi.Dispatcher dispatcher: Dispatcher we want to send the report
+        """
+        self.filters[index] = (rule, dispatcher)
+        self.routing_table.clear()
+
+    def _check_routing_table(self):
+        """
+        Check that the filters can route reports
         """
         # Error if filters is empty
         if not self.filters:
             raise FilterUselessError()
 
-        dispatchers = []
+    def _compile_routes(self, report_type: type) -> tuple[list, bool]:
+        """
+        Compile the routes of a report type, the rules of a dispatcher are merged in one rule
+        :return: the dispatchers of the report type and False if all its rules are report types, else the rule (None
+                 if a report type rule selects the dispatcher) and the dispatchers and True
+        """
+        dispatchers_rules = {}
         for rule, dispatcher in self.filters:
-            if rule(report):
-                dispatchers.append(dispatcher)
+            if isinstance(rule, type):
+                if issubclass(report_type, rule):
+                    dispatchers_rules[dispatcher] = None
+            elif dispatchers_rules.get(dispatcher, []) is not None:
+                dispatchers_rules.setdefault(dispatcher, []).append(rule)
+
+        if all(rules is None for rules in dispatchers_rules.values()):
+            return list(dispatchers_rules), False
+        return [(None if rules is None else _merge_rules(rules), dispatcher)
+                for dispatcher, rules in dispatchers_rules.items()], True
+
+    def _get_routes(self, report_type: type) -> tuple[list, bool]:
+        routes = self.routing_table.get(report_type)
+        if routes is None:
+            routes = self.routing_table[report_type] = self._compile_routes(report_type)
+        return routes
+
+    def _route(self, report) -> list:
+        routes, dynamic = self._get_routes(get_report_type(report))
+        if not dynamic:
+            return routes
+        return [dispatcher for rule, dispatcher in routes if rule is None or rule(report)]
+
+    def route(self, report):
+        """
+        Get the list of dispatchers to whom send the report, or None
+
+        :param powerapi.Report report: Message to send
+        :return: the dispatchers in the order of their filters, the list must not be modified
+        """
+        self._check_routing_table()
+        return self._route(report)
+
+    def route_batch(self, reports: list) -> dict:
+        """
+        Group the reports by dispatcher to whom send them
 
-        return dispatchers
+        :param list reports: Reports to send
+        :return: the reports to send to each dispatcher, in the order of the given list, the lists must not be modified
+        """
+        self._check_routing_table()
+        if not reports:
+            return {}
+
+        # Common case: reports of the same type routed by report type rules only, sent to each of their dispatchers
+        report_type = get_report_type(reports[0])
+        routes, dynamic = self._get_routes(report_type)
+        if not dynamic and all(get_report_type(report) is report_type for report in reports):
+            return dict.fromkeys(routes, reports)
+
+        dispatchers_reports = {}
+        for report in reports:
+            for dispatcher in self._route(report):
+                dispatcher_reports = dispatchers_reports.get(dispatcher)
+                if dispatcher_reports is None:
+                    dispatchers_reports[dispatcher] = [report]
+                else:
+                    dispatcher_reports.append(report)
+        return dispatchers_reports
+
+
+def _merge_rules(rules: list):
+    """
+    :return: a rule accepting the reports accepted by one of the given rules
+    """
+    if len(rules) == 1:
+        return rules[0]
+    return lambda report: any(rule(report) for rule in rules)
@@ -53,6 +53,6 @@ class AbstractCpuDramFormula(FormulaActor):
     """
 
     def __init__(self, name, pushers: dict[str, PusherActor], socket: str, core: str, level_logger=logging.WARNING,
-                 timeout=None):
-        FormulaActor.__init__(self, name, pushers, level_logger, timeout)
+                 timeout=None, execution_mode='process'):
+        FormulaActor.__init__(self, name, pushers, level_logger, timeout, execution_mode=execution_mode)
         self.state = AbstractCpuDramFormulaState(self, pushers, self.formula_metadata, socket, core)
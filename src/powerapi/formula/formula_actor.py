@@ -31,7 +31,11 @@ import logging
 import re
 
 from powerapi.actor import Actor, State
+from powerapi.formula.handlers import RawReportHandler
+from powerapi.handler import Handler
+from powerapi.message import Message
 from powerapi.pusher import PusherActor
+from powerapi.report import RawReport
 
 
 class FormulaState(State):
@@ -47,21 +51,42 @@ class FormulaState(State):
         self.pushers = pushers
         self.metadata = metadata
 
+        #: (RawReportHandler): Handler parsing the raw reports before handling them
+        self.raw_report_handler = RawReportHandler(self)
+
+    def get_corresponding_handler(self, msg: Message) -> Handler:
+        """
+        Return the corresponding handler for the given message type.
+        The raw reports are always given to the handler parsing them, whatever the handlers defined by the formula.
+        """
+        if isinstance(msg, RawReport):
+            return self.raw_report_handler
+        return super().get_corresponding_handler(msg)
+
 
 class FormulaActor(Actor):
     """
     Abstract actor class used to implement formula actor that compute power consumption of a device from Reports
     """
 
-    def __init__(self, name, pushers: dict[str, PusherActor], level_logger=logging.WARNING, timeout=None):
+    def __init__(self, name, pushers: dict[str, PusherActor], level_logger=logging.WARNING, timeout=None,
+                 batch_size=1, batch_delay=10, serializer='pickle', transport='tcp',
+                 execution_mode='process'):
         """
         Initialize a new Formula actor.
         :param name: Actor name
         :param pushers: Pusher actors
         :param level_logger: Level of the logger
         :param timeout: Time in millisecond to wait for a message before calling the timeout handler
+        :param batch_size: Maximum number of reports sent to the formula in one batch (1 disable batching)
+        :param batch_delay: Maximum time in millisecond a report sent to the formula can wait in a batch
+        :param serializer: Name of the serializer used to encode the messages sent to the formula
+        :param transport: Transport used by the sockets of the formula (tcp or ipc)
+        :param execution_mode: Execute the formula in its own process (process) or in a thread of the dispatcher
+                               process (thread)
         """
-        Actor.__init__(self, name, level_logger, timeout)
+        Actor.__init__(self, name, level_logger, timeout, batch_size, batch_delay, serializer, transport,
+                       execution_mode=execution_mode)
 
         self.formula_metadata = self._extract_formula_metadata(name)
         self.state = FormulaState(self, pushers, self.formula_metadata)
@@ -27,7 +27,10 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from powerapi.handler import PoisonPillMessageHandler
+from itertools import groupby
+
+from powerapi.handler import Handler, PoisonPillMessageHandler
+from powerapi.report import BadInputData, RawReport
 
 
 class FormulaPoisonPillMessageHandler(PoisonPillMessageHandler):
@@ -37,3 +40,36 @@ class FormulaPoisonPillMessageHandler(PoisonPillMessageHandler):
     def teardown(self, soft=False):
         for _, pusher in self.state.pushers.items():
             pusher.socket_interface.close()
+
+
+class RawReportHandler(Handler):
+    """
+    Parse the raw reports and give them to the handler of their report type
+    """
+
+    def _parse(self, msg: RawReport):
+        try:
+            return msg.parse()
+        except BadInputData as exn:
+            self.state.actor.logger.warning('Received malformed raw report: %s', exn.msg)
+            self.state.actor.logger.debug('Raw report value: %s', exn.input_data)
+            return None
+
+    def handle(self, msg: RawReport):
+        """
+        Parse the raw report and handle the parsed report
+        :param msg: The raw report
+        """
+        report = self._parse(msg)
+        if report is not None:
+            self.state.get_corresponding_handler(report).handle_message(report)
+
+    def handle_batch(self, msgs: list[RawReport]):
+        """
+        Parse the raw reports and give the parsed reports of the same type together to their handler
+        :param msgs: The raw reports
+        """
+        reports = [report for report in map(self._parse, msgs) if report is not None]
+        for _, group in groupby(reports, key=lambda report: report.__class__.__name__):
+            group = list(group)
+            self.state.get_corresponding_handler(group[0]).handle_batch(group)
@@ -65,6 +65,18 @@ class Handler:
         """
         self.handle(msg)
 
+    def handle_batch(self, msgs: list[Message]):
+        """
+        Handle a batch of messages of the same type
+
+        Override this method to process the whole batch in one pass, the
+        default behaviour handle each message one after the other
+
+        :param list msgs: the messages received by the actor
+        """
+        for msg in msgs:
+            self.handle_message(msg)
+
     def handle(self, msg: Message):
         """
         Handle a message and return a new state value of the actor
@@ -75,18 +87,28 @@ class Handler:
         """
         raise NotImplementedError()
 
+    def handle_timeout(self):
+        """
+        Called when the actor did not receive any message during its timeout
+
+        Override this method to implement a periodic behaviour, the default
+        behaviour do nothing
+        """
+
     def delegate_message_handling(self, msg: Message):
         """
         Deletage the message handling to a suitable handler
-        :param msg: The message to handle
-        """
-        try:
-            handler = self.state.get_corresponding_handler(msg)
-            handler.handle_message(msg)
-        except UnknownMessageTypeException:
-            self.state.actor.logger.warning("UnknownMessageTypeException: %s", msg)
-        except HandlerException:
-            self.state.actor.logger.warning("HandlerException: %s", msg)
+        :param msg: The message to handle, or a batch of messages
+        """
+        messages = msg if isinstance(msg, list) else [msg]
+        for message in messages:
+            try:
+                handler = self.state.get_corresponding_handler(message)
+                handler.handle_message(message)
+            except UnknownMessageTypeException:
+                self.state.actor.logger.warning("UnknownMessageTypeException: %s", message)
+            except HandlerException:
+                self.state.actor.logger.warning("HandlerException: %s", message)
 
 
 class InitHandler(Handler):
@@ -109,3 +109,21 @@ class PoisonPillMessage(Message):
         if isinstance(other, PoisonPillMessage):
             return other.is_soft == self.is_soft and other.is_hard == self.is_hard
         return False
+
+
+class FormulaReportMessage(Message):
+    """
+    Message used by the dispatcher to send a report to a formula hosted by a formula worker
+    """
+
+    def __init__(self, sender_name: str, formula_id: tuple, report):
+        """
+        :param formula_id: Identifier of the formula that must handle the report
+        :param report: The report to handle, or a PoisonPillMessage to remove the formula from the worker
+        """
+        Message.__init__(self, sender_name)
+        self.formula_id = formula_id
+        self.report = report
+
+    def __str__(self):
+        return f'FormulaReportMessage : {self.formula_id} {self.report}'
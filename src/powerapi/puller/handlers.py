@@ -27,18 +27,17 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import logging
-import time
+from collections.abc import Iterator
 from threading import Thread
 
 from powerapi.actor import State
-from powerapi.database import DBError
+from powerapi.database import DBError, IterDB
+from powerapi.database.base_db import next_reports, iter_report_batches
 from powerapi.exception import PowerAPIException
 from powerapi.filter import FilterUselessError
 from powerapi.handler import StartHandler, PoisonPillMessageHandler
 from powerapi.message import ErrorMessage, PoisonPillMessage
 from powerapi.message import Message
-from powerapi.report import BadInputData
 
 
 class NoReportExtractedException(PowerAPIException):
@@ -59,36 +58,64 @@ class DBPullerThread(Thread):
         self.state = state
         self.handler = handler
 
+    def _iter_batches(self) -> Iterator[list]:
+        """
+        Iterate on the reports available in the database by batch
+        """
+        database_it = self.state.database_it
+        if isinstance(database_it, IterDB):
+            return database_it.iter_batches(self.state.read_batch_size)
+        return iter_report_batches(database_it, self.state.read_batch_size)
+
+    def _next_batch(self) -> list:
+        """
+        Read the next reports of the database, waiting at most timeout_puller ms for the first one
+        """
+        database_it = self.state.database_it
+        if isinstance(database_it, IterDB):
+            return database_it.next_batch(self.state.read_batch_size, self.state.timeout_puller)
+        return next_reports(database_it, self.state.read_batch_size, self.state.timeout_puller)
+
+    def _send_reports(self, reports: list):
+        """
+        Send the reports to the dispatchers selected by the filter, each dispatcher receives its reports in one batch
+        """
+        for dispatcher, dispatcher_reports in self.state.report_filter.route_batch(reports).items():
+            dispatcher.send_data_many(dispatcher_reports)
+
     def run(self):
         """
         Read data from Database and send it to the dispatchers.
+        The available reports are read by batch, then the next reports are
+        waited for and sent as soon as they are available.
         If there is no more data, send a kill message to every
         dispatcher.
         If stream mode is disabled, kill the actor.
 
         :param None msg: None.
         """
-        while self.state.alive:
-            try:
-                raw_report = next(self.state.database_it)
-                dispatchers = self.state.report_filter.route(raw_report)
-                for dispatcher in dispatchers:
-                    dispatcher.send_data(raw_report)
-
-            except FilterUselessError:
-                self.handler.handle_internal_msg(PoisonPillMessage(False, self.name))
-                return
-
-            except BadInputData as exn:
-                logging.error('Received malformed report from database: %s', exn.msg)
-                logging.debug('Raw report value: %s', exn.input_data)
-
-            except StopIteration:
-                time.sleep(self.state.timeout_puller / 1000)
+        try:
+            while self.state.alive:
+                for reports in self._iter_batches():
+                    self._send_reports(reports)
+                    if not self.state.alive:
+                        return
+
+                # Do not keep reports in the batches while waiting for new data
+                for _, dispatcher in self.state.report_filter.filters:
+                    dispatcher.flush_data()
+
                 if not self.state.stream_mode:
                     self.handler.handle_internal_msg(PoisonPillMessage(False, self.name))
                     return
 
+                reports = self._next_batch()
+                if reports:
+                    self._send_reports(reports)
+
+        except FilterUselessError:
+            self.handler.handle_internal_msg(PoisonPillMessage(False, self.name))
+
 
 class PullerPoisonPillMessageHandler(PoisonPillMessageHandler):
     """
@@ -43,7 +43,8 @@ class PullerState(State):
       - the Filter class
     """
 
-    def __init__(self, actor: Actor, database, report_filter, report_model, stream_mode, timeout_puller):
+    def __init__(self, actor: Actor, database, report_filter, report_model, stream_mode, timeout_puller,
+                 read_batch_size=64):
         """
         :param BaseDB database: Allow to interact with a Database
         :param Filter report_filter: Filter of the Puller
@@ -65,9 +66,12 @@ class PullerState(State):
         #: (bool): Stream mode
         self.stream_mode = stream_mode
 
-        #: (require stream mode = True) time (in ms) between two database reading
+        #: (require stream mode = True) maximum time (in ms) waited for new reports between two database reading
         self.timeout_puller = timeout_puller
 
+        #: (int): Maximum number of reports read from the database at once
+        self.read_batch_size = read_batch_size
+
         #: (int): Counter for "sleeping mode"
         self.counter = 0
 
@@ -83,19 +87,21 @@ class PullerActor(Actor):
     """
 
     def __init__(self, name, database, report_filter, report_model, stream_mode=False, level_logger=logging.WARNING,
-                 timeout=5000, timeout_puller=100):
+                 timeout=5000, timeout_puller=100, read_batch_size=64):
         """
         :param str name: Actor name.
         :param BaseDB database: Allow to interact with a Database.
         :param Filter report_filter: Filter of the Puller.
         :param int level_logger: Define the level of the logger
         :param int tiemout_puller: (require stream mode) time (in ms) between two database reading
+        :param int read_batch_size: maximum number of reports read from the database at once
         """
 
         Actor.__init__(self, name, level_logger, timeout)
 
         #: (State): Actor State.
-        self.state = PullerState(self, database, report_filter, report_model, stream_mode, timeout_puller)
+        self.state = PullerState(self, database, report_filter, report_model, stream_mode, timeout_puller,
+                                 read_batch_size)
 
         self.low_exception += database.exceptions
 
@@ -29,3 +29,5 @@
 
 from powerapi.pusher.handlers import ReportHandler, PusherStartHandler, PusherPoisonPillMessageHandler
 from powerapi.pusher.pusher_actor import PusherActor, PusherState
+from powerapi.pusher.report_buffer import ReportBuffer, UnknownLateReportPolicyException
+from powerapi.pusher.report_writer import ReportWriter, UnknownFullQueuePolicyException
@@ -32,6 +32,7 @@ import time
 from powerapi.handler import InitHandler, StartHandler, PoisonPillMessageHandler
 from powerapi.message import ErrorMessage
 from powerapi.database import DBError
+from powerapi.pusher.report_writer import ReportWriter
 from powerapi.report import BadInputData
 
 
@@ -42,13 +43,20 @@ class PusherStartHandler(StartHandler):
 
     def initialization(self):
         """
-        Initialize the output database
+        Initialize the output database and start the report writer in write-behind mode
         """
         try:
             self.state.database.connect()
         except DBError as error:
             self.state.actor.send_control(ErrorMessage(self.state.actor.name, error.msg))
             self.state.alive = False
+            return
+
+        actor = self.state.actor
+        if actor.write_behind:
+            self.state.writer = ReportWriter(self.state.database, actor.logger, actor.write_queue_size,
+                                             actor.write_queue_policy, actor.spill_dir, actor.write_timeout)
+            self.state.writer.start()
 
 
 class PusherPoisonPillMessageHandler(PoisonPillMessageHandler):
@@ -56,26 +64,46 @@ class PusherPoisonPillMessageHandler(PoisonPillMessageHandler):
     Handler for PoisonPillMessage
     """
     def teardown(self, soft=False):
-        if len(self.state.buffer) > 0:
-            self.state.database.save_many(self.state.buffer)
+        if self.state.writer is not None:
+            if len(self.state.buffer) > 0:
+                self.state.writer.write(self.state.buffer.drain())
+            self.state.writer.close()
+        elif len(self.state.buffer) > 0:
+            self.state.database.save_many(self.state.buffer.drain())
+
+        if self.state.initialized:
+            self.state.database.disconnect()
 
 
 class ReportHandler(InitHandler):
     """
     Put the received report in a buffer
 
-    the buffer is empty every *delay* ms or if its size exceed *max_size*
+    the buffer is empty every *delay* ms or if its size exceed *max_size*, the
+    drained reports are ordered by timestamp and, in write-behind mode, given
+    to the report writer thread. The delay is also checked when the pusher does not
+    receive any report during its timeout, a report is thus written at most
+    *delay* ms after the end of its receiving window even if no other report
+    follows it.
+
+    if *max_size_limit* is defined, *max_size* is doubled (up to this limit)
+    each time the buffer is written because it is full and halved (down to its
+    initial value) each time the delay expire with a buffer filled at less than
+    half
 
     :param int delay: number of ms before message containing in the buffer will be writen in database
     :param int max_size: maximum of message that the buffer can store before write them in database
+    :param int max_size_limit: maximum value that *max_size* can reach under load, None keep *max_size* fixed
     """
 
-    def __init__(self, state, delay=100, max_size=50):
+    def __init__(self, state, delay=100, max_size=50, max_size_limit=None):
         InitHandler.__init__(self, state)
 
         self.last_database_write_time = time.time()
         self.delay = delay / 1000
+        self.initial_max_size = max_size
         self.max_size = max_size
+        self.max_size_limit = max_size_limit
 
     def handle(self, msg):
         """
@@ -84,14 +112,65 @@ class ReportHandler(InitHandler):
         :param powerapi.PowerReport msg: PowerReport to save.
         """
         self.state.buffer.append(msg)
-        if (time.time() - self.last_database_write_time > self.delay) or (len(self.state.buffer) > self.max_size):
-            self.last_database_write_time = time.time()
+        self._flush_buffer()
+
+    def handle_batch(self, msgs):
+        """
+        Save a batch of msg in the database
+
+        :param list msgs: PowerReports to save.
+        """
+        if not self.state.initialized:
+            return
+
+        self.state.buffer.extend(msgs)
+        self._flush_buffer()
+
+    def handle_timeout(self):
+        """
+        Write the buffer in the database if the delay expired while no report was received
+        """
+        if not self.state.initialized:
+            return
 
-            self.state.buffer.sort(key=lambda x: x.timestamp)
+        self._flush_buffer()
 
-            try:
-                self.state.database.save_many(self.state.buffer)
-                self.state.actor.logger.debug('Saved %d reports in the database', len(self.state.buffer))
-                self.state.buffer = []
-            except BadInputData as ex:
-                self.state.actor.logger.warning('The report cannot be saved: %s', ex.msg)
+    def _adapt_max_size(self, full):
+        """
+        Grow *max_size* if the buffer was written because it was full, shrink it if the buffer was written because
+        the delay expired before it was half filled
+
+        :param bool full: True if the buffer size exceed *max_size*
+        """
+        if self.max_size_limit is None:
+            return
+
+        if full:
+            self.max_size = min(max(self.max_size * 2, 1), self.max_size_limit)
+        elif len(self.state.buffer) < self.max_size / 2:
+            self.max_size = max(self.max_size // 2, self.initial_max_size)
+
+    def _flush_buffer(self):
+        """
+        Write the buffer in the database if the delay is expired or if its size exceed *max_size*
+        """
+        full = len(self.state.buffer) > self.max_size
+        if not full and time.time() - self.last_database_write_time <= self.delay:
+            return
+
+        self._adapt_max_size(full)
+        self.last_database_write_time = time.time()
+        if len(self.state.buffer) == 0:
+            return
+
+        reports = self.state.buffer.drain()
+        if self.state.writer is not None:
+            self.state.writer.write(reports)
+            return
+
+        try:
+            self.state.database.save_many(reports)
+            self.state.actor.logger.debug('Saved %d reports in the database', len(reports))
+        except BadInputData as ex:
+            self.state.actor.logger.warning('The report cannot be saved: %s', ex.msg)
+            self.state.buffer.requeue(reports)
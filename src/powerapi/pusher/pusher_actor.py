@@ -32,6 +32,8 @@ from powerapi.actor import Actor, State
 from powerapi.message import PoisonPillMessage, StartMessage
 
 from powerapi.pusher.handlers import ReportHandler, PusherStartHandler, PusherPoisonPillMessageHandler
+from powerapi.pusher.report_buffer import ReportBuffer
+from powerapi.pusher.report_writer import FULL_QUEUE_POLICIES, UnknownFullQueuePolicyException
 
 
 class PusherState(State):
@@ -42,9 +44,11 @@ class PusherState(State):
       - The database interface
     """
 
-    def __init__(self, actor, database, report_model):
+    def __init__(self, actor, database, report_model, reorder_window=None, late_report_policy='write'):
         """
         :param BaseDB database: Database for saving data.
+        :param int reorder_window: Maximum lateness (in ms) of a report reordered in the buffer
+        :param str late_report_policy: Policy applied to the reports late by more than the reorder window
         """
         State.__init__(self, actor)
 
@@ -54,8 +58,11 @@ class PusherState(State):
         #: (Report): Type of the report that the pusher handle.
         self.report_model = report_model
 
-        #: (Dict): Buffer data.
-        self.buffer = []
+        #: (ReportBuffer): Buffer data.
+        self.buffer = ReportBuffer(reorder_window, late_report_policy)
+
+        #: (ReportWriter): Thread writing the buffers in write-behind mode
+        self.writer = None
 
 
 class PusherActor(Actor):
@@ -66,21 +73,56 @@ class PusherActor(Actor):
     """
 
     def __init__(self, name, report_model, database, level_logger=logging.WARNING, timeout=1000, delay=100,
-                 max_size=50):
+                 max_size=50, batch_size=1, batch_delay=10, serializer='pickle', transport='tcp', write_behind=False,
+                 write_queue_size=8, write_queue_policy='block', spill_dir=None, max_size_limit=None,
+                 reorder_window=None, late_report_policy='write', write_timeout=10000):
         """
         :param str name: Pusher name.
         :param Report report_model: ReportModel
         :param BaseDB database: Database use for saving data.
         :param int level_logger: Define the level of the logger
+        :param int timeout: maximum time (in ms) the pusher wait for a report before checking if its buffer must be
+                            written, bounded by the delay
         :param int delay: number of ms before message containing in the buffer will be writen in database
         :param int max_size: maximum of message that the buffer can store before write them in database
+        :param int batch_size: maximum number of reports sent to the pusher in one batch (1 disable batching)
+        :param int batch_delay: maximum time (in ms) a report sent to the pusher can wait in a batch
+        :param str serializer: name of the serializer used to encode the messages sent to the pusher
+        :param str transport: transport used by the sockets of the pusher (tcp or ipc)
+        :param bool write_behind: write the buffers in the database from a background thread, the pusher keeps
+                                  receiving reports while a buffer is written
+        :param int write_queue_size: maximum number of buffers waiting to be written in write-behind mode
+        :param str write_queue_policy: policy applied when the write queue is full (block, drop-oldest or spill)
+        :param str spill_dir: directory where the buffers are spilled with the spill policy
+        :param int max_size_limit: maximum value that max_size can reach when the buffer is often full, None keep
+                                   max_size fixed
+        :param int reorder_window: maximum lateness (in ms) of a report reordered with the reports of its source
+                                   (sensor and target) in the buffer, None reorder all the reports
+        :param str late_report_policy: policy applied to the reports late by more than the reorder window, written
+                                       without being reordered (write) or dropped (drop)
+        :param int write_timeout: maximum time (in ms) the pusher waits for the report writer to queue a buffer with
+                                  the block policy or to write its remaining buffers when it is stopped, None to wait
+                                  forever
         """
-        Actor.__init__(self, name, level_logger, timeout)
+        if write_queue_policy not in FULL_QUEUE_POLICIES:
+            raise UnknownFullQueuePolicyException(write_queue_policy)
+
+        if timeout is not None and delay > 0:
+            timeout = min(timeout, delay)
+
+        Actor.__init__(self, name, level_logger, timeout, batch_size, batch_delay, serializer, transport)
 
         #: (State): State of the actor.
-        self.state = PusherState(self, database, report_model)
+        self.state = PusherState(self, database, report_model, reorder_window, late_report_policy)
         self.delay = delay
         self.max_size = max_size
+        self.max_size_limit = max_size_limit
+
+        self.write_behind = write_behind
+        self.write_queue_size = write_queue_size
+        self.write_queue_policy = write_queue_policy
+        self.spill_dir = spill_dir
+        self.write_timeout = write_timeout
 
     def setup(self):
         """
@@ -88,5 +130,7 @@ class PusherActor(Actor):
         each report type
         """
         self.add_handler(PoisonPillMessage, PusherPoisonPillMessageHandler(self.state))
-        self.add_handler(self.state.report_model, ReportHandler(self.state, self.delay, self.max_size))
+        report_handler = ReportHandler(self.state, self.delay, self.max_size, self.max_size_limit)
+        self.add_handler(self.state.report_model, report_handler)
+        self.set_timeout_handler(report_handler)
         self.add_handler(StartMessage, PusherStartHandler(self.state))
@@ -0,0 +1,176 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import heapq
+from bisect import insort
+from datetime import timedelta
+from operator import attrgetter
+
+from powerapi.exception import PowerAPIException
+from powerapi.report import Report
+
+#: (tuple): Policies applied to the reports arriving later than the reorder window
+LATE_REPORT_POLICIES = ('write', 'drop')
+
+_timestamp = attrgetter('timestamp')
+
+
+class UnknownLateReportPolicyException(PowerAPIException):
+    """
+    Exception raised when a report buffer is created with a policy that is not
+    in :data:`LATE_REPORT_POLICIES`
+    """
+
+    def __init__(self, policy: str):
+        PowerAPIException.__init__(self)
+        self.policy = policy
+
+
+class ReportBuffer:
+    """
+    Buffer of the reports received by a pusher, drained in timestamp order
+
+    The reports of each source (sensor and target) arrive almost in order, they
+    are kept in one sorted run per source and the runs are merged when the
+    buffer is drained instead of sorting the whole buffer.
+
+    A report older than the last report received from its source is inserted
+    at its place in the run of the source if it is late by at most
+    *reorder_window* ms. Past this window, the report is written at the end of
+    the drained reports without being reordered with the `write` policy or is
+    dropped with the `drop` policy. The last timestamp of a source is
+    forgotten once it is older than the window compared to the most recent
+    report of the buffer.
+    """
+
+    def __init__(self, reorder_window: int | None = None, late_report_policy: str = 'write'):
+        """
+        :param reorder_window: Maximum lateness (in ms) of a reordered report, None reorder all the reports
+        :param late_report_policy: Policy applied to the reports late by more than the window (write or drop)
+        """
+        if late_report_policy not in LATE_REPORT_POLICIES:
+            raise UnknownLateReportPolicyException(late_report_policy)
+
+        self.reorder_window = None if reorder_window is None else timedelta(milliseconds=reorder_window)
+        self.late_report_policy = late_report_policy
+
+        #: (dict): Sorted run of buffered reports of each source
+        self.runs = {}
+
+        #: (dict): Timestamp of the most recent report received from each source, only kept with a reorder window
+        self.last_timestamps = {}
+
+        #: (list): Reports late by more than the reorder window
+        self.late_reports = []
+
+        #: (int): Number of reports dropped because they were late by more than the reorder window
+        self.dropped_reports_count = 0
+
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, report: Report):
+        """
+        Add a report to the buffer
+        :param report: The report to add
+        """
+        source = (report.sensor, report.target)
+
+        # Without window, a report is only reordered with the buffered reports of its source
+        if self.reorder_window is None:
+            _insert(self.runs.setdefault(source, []), report)
+            self._size += 1
+            return
+
+        last_timestamp = self.last_timestamps.get(source)
+
+        if last_timestamp is None or last_timestamp <= report.timestamp:
+            self.last_timestamps[source] = report.timestamp
+            self.runs.setdefault(source, []).append(report)
+        elif last_timestamp - report.timestamp <= self.reorder_window:
+            insort(self.runs.setdefault(source, []), report, key=_timestamp)
+        elif self.late_report_policy == 'drop':
+            self.dropped_reports_count += 1
+            return
+        else:
+            self.late_reports.append(report)
+
+        self._size += 1
+
+    def extend(self, reports: list[Report]):
+        """
+        Add reports to the buffer
+        :param reports: The reports to add
+        """
+        for report in reports:
+            self.append(report)
+
+    def requeue(self, reports: list[Report]):
+        """
+        Put drained reports back in the buffer, they are reordered with the buffered reports of their source without
+        applying the late report policy again
+        :param reports: The drained reports
+        """
+        for report in reports:
+            _insert(self.runs.setdefault((report.sensor, report.target), []), report)
+        self._size += len(reports)
+
+    def drain(self) -> list[Report]:
+        """
+        Empty the buffer
+        :return: The buffered reports sorted by timestamp, followed by the reports late by more than the window
+        """
+        runs = list(self.runs.values())
+        if len(runs) == 1:
+            reports = runs[0]
+        else:
+            reports = list(heapq.merge(*runs, key=_timestamp))
+        reports.extend(self.late_reports)
+
+        self.runs = {}
+        self.late_reports = []
+        self._size = 0
+
+        if self.last_timestamps:
+            deadline = max(self.last_timestamps.values()) - self.reorder_window
+            self.last_timestamps = {source: timestamp for source, timestamp in self.last_timestamps.items()
+                                    if timestamp >= deadline}
+
+        return reports
+
+
+def _insert(run: list[Report], report: Report):
+    """
+    Insert a report at its place in a sorted run, the report is most often the most recent one
+    """
+    if run and report.timestamp < run[-1].timestamp:
+        insort(run, report, key=_timestamp)
+    else:
+        run.append(report)
@@ -0,0 +1,225 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import os
+import pickle
+import queue
+import shutil
+import tempfile
+import threading
+from collections import deque
+
+from powerapi.exception import PowerAPIException
+from powerapi.report import BadInputData
+
+#: (tuple): Policies applied when a buffer is written while the writer queue is full
+FULL_QUEUE_POLICIES = ('block', 'drop-oldest', 'spill')
+
+
+class UnknownFullQueuePolicyException(PowerAPIException):
+    """
+    Exception raised when a report writer is created with a policy that is not
+    in :data:`FULL_QUEUE_POLICIES`
+    """
+
+    def __init__(self, policy: str):
+        PowerAPIException.__init__(self)
+        self.policy = policy
+
+
+class ReportWriter(threading.Thread):
+    """
+    Background thread writing the report buffers of a pusher in its database
+
+    The pusher gives its full buffer to the writer and keeps filling a new one
+    while the previous buffer is written. The buffers waiting to be written are
+    kept in a bounded queue, when it is full:
+
+    - `block`: the pusher waits for a buffer to be written
+    - `drop-oldest`: the oldest waiting buffer is dropped
+    - `spill`: the buffer is written in a file of the spill directory, the
+      spilled buffers are written in the database once the queue is empty
+    """
+
+    def __init__(self, database, logger: logging.Logger, queue_size: int = 8, policy: str = 'block',
+                 spill_dir: str | None = None, timeout: int | None = 10000):
+        """
+        :param database: Database where the reports are written
+        :param logger: Logger of the pusher
+        :param queue_size: Maximum number of buffers waiting to be written
+        :param policy: Policy applied when the queue is full (block, drop-oldest or spill)
+        :param spill_dir: Directory where the buffers are spilled, a temporary directory is created if None
+        :param timeout: Maximum time in millisecond to wait for a place in the queue with the block policy, or for the
+                        remaining buffers to be written when the writer is closed. None to wait forever
+        """
+        if policy not in FULL_QUEUE_POLICIES:
+            raise UnknownFullQueuePolicyException(policy)
+
+        threading.Thread.__init__(self, name='report_writer', daemon=True)
+
+        self.database = database
+        self.logger = logger
+        self.policy = policy
+        self.spill_dir = spill_dir
+        self.timeout = None if timeout is None else timeout / 1000
+
+        # Temporary spill directory created by the writer, removed when the writer is closed
+        self._temporary_spill_dir = None
+
+        self.buffers = queue.Queue(maxsize=queue_size)
+
+        self.dropped_buffers_count = 0
+
+        # Files of the spilled buffers, from the oldest to the newest
+        self._spilled_files = deque()
+        self._spilled_files_count = 0
+        self._spill_lock = threading.Lock()
+
+    def write(self, buffer: list):
+        """
+        Give a buffer of reports to write in the database, the full queue policy is applied if needed
+        :param buffer: The reports to write
+        """
+        if self.policy == 'block':
+            try:
+                self.buffers.put(buffer, timeout=self.timeout)
+            except queue.Full:
+                self.dropped_buffers_count += 1
+                self.logger.error('The report writer queue is still full after %ss, dropped %d reports', self.timeout,
+                                  len(buffer))
+            return
+
+        # Once a buffer is spilled, the next ones are spilled too to keep them in order
+        with self._spill_lock:
+            if self.policy == 'spill' and self._spilled_files:
+                self._spill(buffer)
+                return
+
+        while True:
+            try:
+                self.buffers.put_nowait(buffer)
+                return
+            except queue.Full:
+                if self.policy == 'spill':
+                    with self._spill_lock:
+                        self._spill(buffer)
+                    return
+
+            try:
+                self.buffers.get_nowait()
+                self.dropped_buffers_count += 1
+                self.logger.warning('The report writer queue is full, dropped the oldest buffer')
+            except queue.Empty:
+                pass
+
+    def close(self):
+        """
+        Write the remaining buffers and stop the writer, the temporary spill directory is removed
+        """
+        try:
+            self.buffers.put(None, timeout=self.timeout)
+            self.join(self.timeout)
+        except queue.Full:
+            pass
+
+        if self.is_alive():
+            self.logger.error('The report writer did not write its remaining buffers after %ss', self.timeout)
+            return
+
+        if self._temporary_spill_dir is not None:
+            shutil.rmtree(self._temporary_spill_dir, ignore_errors=True)
+
+    def run(self):
+        """
+        Write the buffers given by the pusher until it is closed
+        """
+        while True:
+            buffer = self.buffers.get()
+            if buffer is None:
+                self._write_spilled_buffers()
+                return
+
+            self._save(buffer)
+
+            if self.buffers.empty():
+                self._write_spilled_buffers()
+
+    def _save(self, buffer: list):
+        """
+        Save the reports of a buffer in the database, the buffers drained by the pusher are already sorted
+        :param buffer: The reports to save
+        """
+        try:
+            self.database.save_many(buffer)
+            self.logger.debug('Saved %d reports in the database', len(buffer))
+        except BadInputData as ex:
+            self.logger.warning('The report cannot be saved: %s', ex.msg)
+        except Exception as ex:
+            # The writer must keep running, otherwise the pusher waits forever for it
+            self.logger.error('Failed to save %d reports in the database: %r', len(buffer), ex)
+
+    def _spill(self, buffer: list):
+        """
+        Write a buffer in a new file of the spill directory
+        :param buffer: The reports to spill
+        """
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix='powerapi-spill-')
+            self._temporary_spill_dir = self.spill_dir
+        os.makedirs(self.spill_dir, exist_ok=True)
+
+        path = os.path.join(self.spill_dir, f'{os.getpid()}-{self._spilled_files_count:08d}.pickle')
+        with open(path, 'wb') as spill_file:
+            pickle.dump(buffer, spill_file)
+
+        self._spilled_files.append(path)
+        self._spilled_files_count += 1
+        self.logger.warning('The report writer queue is full, spilled %d reports in %s', len(buffer), path)
+
+    def _write_spilled_buffers(self):
+        """
+        Save the spilled buffers in the database, from the oldest to the newest
+        """
+        while True:
+            with self._spill_lock:
+                if not self._spilled_files:
+                    return
+                path = self._spilled_files[0]
+
+            try:
+                with open(path, 'rb') as spill_file:
+                    buffer = pickle.load(spill_file)
+                self._save(buffer)
+                os.remove(path)
+            except (OSError, pickle.UnpicklingError) as ex:
+                self.logger.error('The spilled reports of %s cannot be read: %s', path, ex)
+
+            with self._spill_lock:
+                self._spilled_files.popleft()
@@ -30,12 +30,31 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from powerapi.report.report import Report, CSV_HEADER_COMMON, BadInputData, CsvLines
 
 CSV_HEADER_POWER = [*CSV_HEADER_COMMON, 'power', 'socket']
 
+#: (int): Maximum number of flattened metadata key sets whose sanitized tags name are kept in cache
+TAGS_NAME_CACHE_SIZE = 1024
+
+
+def _sanitize_selected_tags_name(keys: tuple[str, ...], selected_tags: tuple[str, ...] | None) -> tuple[tuple[str, str], ...]:
+    """
+    Sanitize the name of the flattened metadata keys and keep the selected ones
+    :param keys: Flattened metadata keys of a report
+    :param selected_tags: Sanitized name of the tags to keep, None to keep every tag
+    :return: The kept metadata keys with their sanitized name
+    """
+    sanitized_tags_name = Report.sanitize_tags_name(keys)
+    return tuple((key, sanitized_tags_name[key]) for key in keys
+                 if selected_tags is None or sanitized_tags_name[key] in selected_tags)
+
+
+_select_tags_name = lru_cache(maxsize=TAGS_NAME_CACHE_SIZE)(_sanitize_selected_tags_name)
+
 
 class PowerReport(Report):
     """
@@ -157,15 +176,28 @@ class PowerReport(Report):
         :return: a single level dictionary containing the tags of the report
         """
         flattened_tags = self.flatten_tags(self.metadata)
-        sanitized_tags_name = self.sanitize_tags_name(flattened_tags)
-        sanitized_tags = {sanitized_tags_name[k]: v for k, v in flattened_tags.items()}
+        tags_name = _select_tags_name(tuple(flattened_tags), tuple(selected_tags) if selected_tags else None)
 
-        if selected_tags:
-            tags = {k: v for k, v in sanitized_tags.items() if k in selected_tags}
-        else:
-            tags = sanitized_tags
+        return {'sensor': self.sensor, 'target': self.target} | {name: flattened_tags[key] for key, name in tags_name}
 
-        return {'sensor': self.sensor, 'target': self.target} | tags
+    @staticmethod
+    def select_tags_name(keys: tuple[str, ...], selected_tags: tuple[str, ...] | None) -> tuple[tuple[str, str], ...]:
+        """
+        Sanitize the name of the flattened metadata keys and keep the selected ones, the result is cached for each
+        set of keys
+        :param keys: Flattened metadata keys of a report
+        :param selected_tags: Sanitized name of the tags to keep, None to keep every tag
+        :return: The kept metadata keys with their sanitized name
+        """
+        return _select_tags_name(keys, selected_tags)
+
+    @staticmethod
+    def get_tags_name_cache_info():
+        """
+        Return the statistics of the cache of sanitized tags name used by :meth:`generate_tags`
+        :return: a named tuple containing the hits, misses, maxsize and currsize of the cache
+        """
+        return _select_tags_name.cache_info()
 
     @staticmethod
     def to_influxdb(report: PowerReport, tags: None | list[str]) -> dict[str, Any]:
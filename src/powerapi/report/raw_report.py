@@ -0,0 +1,148 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any
+
+try:
+    import bson
+    from bson.raw_bson import RawBSONDocument
+except ImportError:
+    logging.getLogger().info("PyMongo is not installed.")
+
+from powerapi.report.report import Report, BadInputData, SENSOR_KEY, TARGET_KEY, TIMESTAMP_KEY, METADATA_KEY, \
+    GROUPS_KEY
+
+
+class RawReport(Report):
+    """
+    Report kept in the BSON document it was read from.
+
+    Only the top level fields of the document are decoded to route the
+    report: its timestamp, sensor, target and metadata. The socket and core
+    identifiers of its groups are decoded on first use, by the dispatch rules
+    that need them. The puller and the dispatcher send the BSON bytes as is,
+    they are parsed into a report of *report_type* by the formula receiving
+    the report.
+    """
+
+    def __init__(self, timestamp: datetime, sensor: str, target: str, report_type: type[Report], payload: bytes,
+                 metadata: dict[str, Any] = {}):
+        """
+        Initialize a raw report using the given parameters.
+        :param datetime timestamp: Timestamp of the report
+        :param str sensor: Sensor name
+        :param str target: Target name
+        :param report_type: Type of the report contained in the payload
+        :param payload: BSON document of the report, as read from the database
+        """
+        Report.__init__(self, timestamp, sensor, target, metadata)
+
+        #: (type): Type of the report contained in the payload
+        self.report_type = report_type
+
+        #: (bytes): BSON document of the report
+        self.payload = payload
+
+        self._groups = None
+
+    def __eq__(self, other) -> bool:
+        return super().__eq__(other) and self.report_type == other.report_type and self.payload == other.payload
+
+    def __getstate__(self) -> dict:
+        # The groups are decoded again by the actor receiving the report if it needs them
+        state = dict(self.__dict__)
+        state['_groups'] = None
+        return state
+
+    @property
+    def groups(self) -> dict[str, dict]:
+        """
+        Socket and core identifiers of each group, without their events (empty if the report has no groups)
+        """
+        if self._groups is None:
+            groups = bson.decode(self.payload).get(GROUPS_KEY, {})
+            self._groups = {group_name: {socket_id: dict.fromkeys(cores) for socket_id, cores in group.items()}
+                            for group_name, group in groups.items()}
+        return self._groups
+
+    @staticmethod
+    def from_document(report_type: type[Report], document: RawBSONDocument) -> RawReport:
+        """
+        Create a raw report from a raw BSON document, its nested documents are not decoded.
+        :param report_type: Type of the report contained in the document
+        :param document: BSON document of the report
+        :return: The raw report with the routing fields of the document
+        """
+        try:
+            ts = Report._extract_timestamp(document[TIMESTAMP_KEY])
+            metadata = document.get(METADATA_KEY, {})
+            if isinstance(metadata, RawBSONDocument):
+                metadata = bson.decode(metadata.raw)
+            return RawReport(ts, document[SENSOR_KEY], document[TARGET_KEY], report_type, document.raw, metadata)
+        except TypeError as exn:
+            raise BadInputData(f'Invalid input document: {exn.args[0]}', document) from exn
+        except KeyError as exn:
+            raise BadInputData(f'Missing required field "{exn.args[0]}" from input document', document) from exn
+        except ValueError as exn:
+            raise BadInputData(f'Unexpected field value in input document: {exn.args}', document) from exn
+
+    def parse(self) -> Report:
+        """
+        Parse the payload into a report of the report type.
+        The metadata of the raw report, that can be updated on its way to the formula, replace the ones of the payload.
+        :return: The parsed report
+        :raise: BadInputData if the payload can't be decoded
+        """
+        try:
+            document = bson.decode(self.payload)
+        except bson.errors.InvalidBSON as exn:
+            raise BadInputData(f'Invalid BSON document: {exn.args}', self.payload) from exn
+
+        # The timestamp was already decoded to route the report
+        document[TIMESTAMP_KEY] = self.timestamp
+        report = self.report_type.from_mongodb(document)
+        report.metadata = self.metadata
+        report.sender_name = self.sender_name
+        report.dispatcher_report_id = self.dispatcher_report_id
+        return report
+
+
+def get_report_type(report: Report) -> type[Report]:
+    """
+    Return the type of the given report, the type of the report contained in the payload for a raw report
+    :param report: The report
+    :return: Type used to route the report
+    """
+    if isinstance(report, RawReport):
+        return report.report_type
+    return type(report)
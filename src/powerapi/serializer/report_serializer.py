@@ -0,0 +1,146 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import marshal
+import struct
+from datetime import datetime, timedelta
+
+from powerapi.report import HWPCReport, PowerReport, ProcfsReport
+from powerapi.serializer.serializer import PickleSerializer
+
+# Pickled data always start with the PROTO opcode (0x80), the tags can't be mistaken for a pickled message
+HWPC_REPORT_TAG = 1
+POWER_REPORT_TAG = 2
+PROCFS_REPORT_TAG = 3
+
+#: Tag, timestamp (in µs since epoch) and dispatcher report id (-1 if not defined)
+REPORT_HEADER = struct.Struct('<Bqq')
+NO_DISPATCHER_REPORT_ID = -1
+
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+#: Number of attributes of the supported reports, a report with additional attributes is serialized with pickle
+REPORT_ATTRIBUTES_COUNT = {
+    HWPCReport: 7,
+    PowerReport: 7,
+    ProcfsReport: 8,
+}
+
+
+class UnsupportedReportContent(Exception):
+    """
+    Exception raised when a report can't be represented by the compact layout
+    """
+
+
+def _pack_header(tag: int, report) -> bytes:
+    """
+    Pack the common fields of a report that can't be serialized by marshal.
+    :param tag: Tag of the report type
+    :param report: Report to serialize
+    :return: The packed header
+    """
+    if len(report.__dict__) != REPORT_ATTRIBUTES_COUNT[type(report)]:
+        raise UnsupportedReportContent()
+
+    timestamp = report.timestamp
+    if timestamp.__class__ is not datetime or timestamp.tzinfo is not None:
+        raise UnsupportedReportContent()
+
+    dispatcher_report_id = report.dispatcher_report_id
+    if dispatcher_report_id is None:
+        dispatcher_report_id = NO_DISPATCHER_REPORT_ID
+    elif dispatcher_report_id.__class__ is not int or dispatcher_report_id < 0:
+        raise UnsupportedReportContent()
+
+    return REPORT_HEADER.pack(tag, (timestamp - EPOCH) // ONE_MICROSECOND, dispatcher_report_id)
+
+
+def _restore_common_fields(report, data: bytes, sender_name: str, metadata: dict):
+    """
+    Restore the report fields that are not given to its constructor.
+    :param report: Deserialized report
+    :param data: Serialized report
+    :param sender_name: Sender name of the report
+    :param metadata: Metadata of the report
+    :return: The report
+    """
+    _, timestamp, dispatcher_report_id = REPORT_HEADER.unpack_from(data)
+    report.timestamp = EPOCH + timedelta(microseconds=timestamp)
+    report.dispatcher_report_id = None if dispatcher_report_id == NO_DISPATCHER_REPORT_ID else dispatcher_report_id
+    report.sender_name = sender_name
+    report.metadata = metadata
+    return report
+
+
+class ReportSerializer(PickleSerializer):
+    """
+    Serializer using a compact binary layout for the HWPC, Power and Procfs reports.
+
+    The report timestamp is stored as an integer in a fixed size header, followed by the remaining fields encoded with
+    marshal. Marshal only supports the builtin types and writes the objects shared by a report (such as the event
+    names of an HWPC report, that are the same objects for every core when decoded from json) only once.
+    Other messages, and reports with content that can't be represented this way, are serialized with pickle.
+    """
+
+    def dumps(self, msg) -> bytes:
+        msg_type = type(msg)
+        try:
+            if msg_type is HWPCReport:
+                return _pack_header(HWPC_REPORT_TAG, msg) + \
+                    marshal.dumps((msg.sensor, msg.target, msg.sender_name, msg.groups, msg.metadata))
+            if msg_type is PowerReport:
+                return _pack_header(POWER_REPORT_TAG, msg) + \
+                    marshal.dumps((msg.sensor, msg.target, msg.sender_name, msg.power, msg.metadata))
+            if msg_type is ProcfsReport:
+                return _pack_header(PROCFS_REPORT_TAG, msg) + \
+                    marshal.dumps((msg.sensor, msg.target, msg.sender_name, msg.usage, msg.global_cpu_usage,
+                                   msg.metadata))
+        except (UnsupportedReportContent, ValueError):
+            pass
+
+        return PickleSerializer.dumps(self, msg)
+
+    def loads(self, data: bytes):
+        tag = data[0]
+        if tag == HWPC_REPORT_TAG:
+            sensor, target, sender_name, groups, metadata = marshal.loads(data[REPORT_HEADER.size:])
+            return _restore_common_fields(HWPCReport(None, sensor, target, groups), data, sender_name, metadata)
+
+        if tag == POWER_REPORT_TAG:
+            sensor, target, sender_name, power, metadata = marshal.loads(data[REPORT_HEADER.size:])
+            return _restore_common_fields(PowerReport(None, sensor, target, power), data, sender_name, metadata)
+
+        if tag == PROCFS_REPORT_TAG:
+            sensor, target, sender_name, usage, global_cpu_usage, metadata = marshal.loads(data[REPORT_HEADER.size:])
+            return _restore_common_fields(ProcfsReport(None, sensor, target, usage, global_cpu_usage), data,
+                                          sender_name, metadata)
+
+        return PickleSerializer.loads(self, data)
@@ -0,0 +1,104 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pickle
+
+from powerapi.exception import PowerAPIException
+
+
+class UnknownSerializerException(PowerAPIException):
+    """
+    Exception raised when trying to use a serializer that is not registered
+    """
+
+    def __init__(self, serializer_name: str):
+        PowerAPIException.__init__(self)
+        self.serializer_name = serializer_name
+
+
+class Serializer:
+    """
+    Convert the messages exchanged by the actors to/from bytes
+    """
+
+    def dumps(self, msg) -> bytes:
+        """
+        Serialize the given message
+        :param msg: Message to serialize
+        :return: The serialized message
+        """
+        raise NotImplementedError()
+
+    def loads(self, data: bytes):
+        """
+        Deserialize a message
+        :param data: Serialized message
+        :return: The deserialized message
+        """
+        raise NotImplementedError()
+
+
+class PickleSerializer(Serializer):
+    """
+    Serializer that use pickle, it supports every picklable object
+    """
+
+    def dumps(self, msg) -> bytes:
+        return pickle.dumps(msg, pickle.DEFAULT_PROTOCOL)
+
+    def loads(self, data: bytes):
+        return pickle.loads(data)
+
+
+#: (dict): Serializers that can be used by the actors, indexed by name
+SERIALIZERS: dict[str, type[Serializer]] = {
+    'pickle': PickleSerializer,
+}
+
+
+def register_serializer(name: str, serializer_class: type[Serializer]):
+    """
+    Register a serializer to make it available to the actors
+    :param name: Name of the serializer
+    :param serializer_class: Class of the serializer
+    """
+    SERIALIZERS[name] = serializer_class
+
+
+def get_serializer(name: str) -> Serializer:
+    """
+    Create the serializer registered with the given name
+    :param name: Name of the serializer
+    :return: A new instance of the serializer
+    :raise UnknownSerializerException: If no serializer is registered with the given name
+    """
+    try:
+        return SERIALIZERS[name]()
+    except KeyError as exn:
+        raise UnknownSerializerException(name) from exn
@@ -0,0 +1,142 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the throughput of the database iterators read report by report and by batch
+
+Run with ``python -m tests.benchmark.iterdb_throughput`` from the root of the
+repository. For each backend, the same reports are read once with ``__next__``
+and once with ``iter_batches``. The MongoDB backend is measured only when the
+URI of a server is given, its collection is filled before each read.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from powerapi.database import CsvDB, FileDB, SocketDB, MongoDB
+from powerapi.database.socket.socket_db import DocumentQueue
+from powerapi.report import HWPCReport, PowerReport
+
+
+def write_csv_files(directory: str, report_count: int) -> list[str]:
+    """
+    Write two csv files containing report_count hwpc reports with two cpus
+    :return: the names of the files
+    """
+    filenames = ['rapl.csv', 'core.csv']
+    for filename in filenames:
+        with open(os.path.join(directory, filename), 'w', encoding='utf-8') as csv_file:
+            csv_file.write('timestamp,sensor,target,socket,cpu,counter\n')
+            for timestamp in range(report_count):
+                for cpu in range(2):
+                    csv_file.write(f'{timestamp},sensor,system,0,{cpu},{timestamp}\n')
+    return filenames
+
+
+def power_documents(report_count: int) -> list[dict]:
+    """
+    Return the json documents of report_count power reports
+    """
+    return [{'timestamp': timestamp, 'sensor': 'sensor', 'target': 'target', 'power': 42.0}
+            for timestamp in range(report_count)]
+
+
+def measure(create_iterator: Callable, batch_size: int) -> tuple[float, float]:
+    """
+    Read all the reports of two iterators, the first one report by report and the second one by batch
+    :return: the number of reports read per second with each method
+    """
+    iterator = create_iterator()
+    start = time.perf_counter()
+    count = sum(1 for _ in iterator)
+    by_report = count / (time.perf_counter() - start)
+
+    iterator = create_iterator()
+    start = time.perf_counter()
+    count = sum(len(batch) for batch in iterator.iter_batches(batch_size))
+    by_batch = count / (time.perf_counter() - start)
+    return by_report, by_batch
+
+
+def main():
+    """
+    Run the benchmark for each backend and print the results
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--reports', type=int, default=100000, help='number of reports read per backend')
+    parser.add_argument('--batch-size', type=int, default=64, help='size of the batches')
+    parser.add_argument('--mongodb-uri', help='uri of a mongodb server used to measure the MongoDB backend')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_files = write_csv_files(directory, args.reports)
+        csv_db = CsvDB(HWPCReport, [], directory, files=csv_files)
+
+        json_path = os.path.join(directory, 'reports.json')
+        with open(json_path, 'w', encoding='utf-8') as json_file:
+            json_file.writelines(json.dumps(document) + '\n' for document in power_documents(args.reports))
+        file_db = FileDB(PowerReport, json_path, follow=True)
+
+        socket_db = SocketDB(PowerReport, '127.0.0.1', 0)
+
+        def create_socket_iterator():
+            socket_db.received_data_queue = DocumentQueue()
+            socket_db.received_data_queue.put_many(power_documents(args.reports))
+            return socket_db.iter(stream_mode=True)
+
+        backends = {
+            'csv': csv_db.iter,
+            'file': lambda: file_db.iter(stream_mode=True),
+            'socket': create_socket_iterator,
+        }
+
+        if args.mongodb_uri:
+            mongo_db = MongoDB(PowerReport, args.mongodb_uri, 'powerapi_benchmark', 'reports')
+            mongo_db.connect()
+
+            def create_mongodb_iterator():
+                mongo_db.collection.delete_many({})
+                mongo_db.save_many([PowerReport(datetime.fromtimestamp(document['timestamp'] / 1000), 'sensor',
+                                                'target', 42.0) for document in power_documents(args.reports)])
+                return mongo_db.iter(stream_mode=False)
+
+            backends['mongodb'] = create_mongodb_iterator
+
+        for backend, create_iterator in backends.items():
+            by_report, by_batch = measure(create_iterator, args.batch_size)
+            print(f'{backend:>8}: {by_report:12.0f} reports/s by report, {by_batch:12.0f} reports/s by batch')
+
+
+if __name__ == '__main__':
+    main()
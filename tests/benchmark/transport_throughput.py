@@ -0,0 +1,96 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compare the throughput of the transports that can be used by the actor sockets
+
+Run with ``python -m tests.benchmark.transport_throughput`` from the root of the
+repository. A sender thread pushes power reports to a socket interface that is
+read by the main thread, the same context is used for the three transports so
+that `inproc` can be measured alongside `tcp` and `ipc`.
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from powerapi.actor import SocketInterface
+from powerapi.actor.socket_interface import TRANSPORTS
+from powerapi.report import PowerReport
+
+
+def measure_throughput(transport: str, message_count: int, runtime_dir: str, batch_size: int) -> float:
+    """
+    Send message_count reports through a socket interface using the given transport
+    :return: the number of reports received per second
+    """
+    socket_interface = SocketInterface('benchmark', 1000, batch_size=batch_size, transport=transport,
+                                       runtime_dir=runtime_dir)
+    socket_interface.setup()
+    report = PowerReport(datetime.now(), 'benchmark', 'target', 42.0)
+
+    def send_reports():
+        socket_interface.connect_data()
+        for _ in range(message_count):
+            socket_interface.send_data(report)
+        socket_interface.flush_data()
+
+    sender = threading.Thread(target=send_reports)
+    start = time.perf_counter()
+    sender.start()
+    received = 0
+    while received < message_count:
+        msg = socket_interface.receive()
+        received += len(msg) if isinstance(msg, list) else 1
+    duration = time.perf_counter() - start
+    sender.join()
+
+    socket_interface.close()
+    return message_count / duration
+
+
+def main():
+    """
+    Run the benchmark for each transport and print the results
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--messages', type=int, default=100000, help='number of reports sent per transport')
+    parser.add_argument('--batch-size', type=int, default=1, help='batch size of the data canal')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as runtime_dir:
+        for transport in TRANSPORTS:
+            throughput = measure_throughput(transport, args.messages, runtime_dir, args.batch_size)
+            print(f'{transport:>8}: {throughput:12.0f} reports/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -27,10 +27,14 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import threading
+from datetime import datetime
+
 import pytest
 import zmq
 
-from powerapi.actor import SocketInterface
+from powerapi.actor import SocketInterface, UnknownTransportException
+from powerapi.report import PowerReport
 
 ACTOR_NAME = 'dummy_actor'
 PULL_SOCKET_ADDRESS = 'ipc://@' + ACTOR_NAME
@@ -190,3 +194,175 @@ def test_multiple_receive(fully_connected_interface):
 
     fully_connected_interface.send_control(push_msg)
     assert fully_connected_interface.receive() == push_msg
+
+
+@pytest.fixture()
+def batched_interface():
+    """ Return an initialized socket interface that batch the data messages by
+    groups of 3 with an open connection to the push socket
+
+    """
+    socket_interface = SocketInterface(ACTOR_NAME, 100, batch_size=3, batch_delay=1000)
+    socket_interface.setup()
+    socket_interface.connect_data()
+    yield socket_interface
+    socket_interface.close()
+
+
+def test_batched_send_data_is_not_sent_before_batch_is_full(batched_interface):
+    """test that the data messages are kept in the batch until it reach the
+    batch size
+
+    """
+    batched_interface.send_data('msg1')
+    batched_interface.send_data('msg2')
+    assert batched_interface.receive() is None
+
+
+def test_batched_send_data_receive_the_whole_batch(batched_interface):
+    """test that a full batch is received in one call as a list of messages
+
+    """
+    for msg in ['msg1', 'msg2', 'msg3']:
+        batched_interface.send_data(msg)
+    assert batched_interface.receive() == ['msg1', 'msg2', 'msg3']
+
+
+def test_flush_data_send_the_pending_batch(batched_interface):
+    """test that flushing the data canal send the messages waiting in the batch
+
+    """
+    batched_interface.send_data('msg1')
+    batched_interface.send_data('msg2')
+    batched_interface.flush_data()
+    assert batched_interface.receive() == ['msg1', 'msg2']
+
+
+def test_send_data_many_receive_the_messages_in_one_batch(fully_connected_interface):
+    """test that the messages sent together are received in one call as a list
+    of messages
+
+    """
+    fully_connected_interface.send_data_many(['msg1', 'msg2'])
+    assert fully_connected_interface.receive() == ['msg1', 'msg2']
+
+
+def test_batched_send_data_many_add_the_messages_to_the_batch(batched_interface):
+    """test that the messages sent together are added to the pending batch
+    when batching is enabled
+
+    """
+    batched_interface.send_data('msg1')
+    batched_interface.send_data_many(['msg2', 'msg3', 'msg4'])
+    assert batched_interface.receive() == ['msg1', 'msg2', 'msg3']
+
+
+def test_pending_batch_is_sent_when_batch_delay_expire():
+    """test that a batch that is not full is sent when its delay expire
+
+    """
+    socket_interface = SocketInterface(ACTOR_NAME, 500, batch_size=10, batch_delay=50)
+    socket_interface.setup()
+    socket_interface.connect_data()
+
+    socket_interface.send_data('msg1')
+    assert socket_interface.receive() == 'msg1'
+
+    socket_interface.close()
+
+
+def test_send_data_with_report_serializer():
+    """test to send and receive a message using the report serializer
+
+    """
+    socket_interface = SocketInterface(ACTOR_NAME, 100, serializer='report')
+    socket_interface.setup()
+    socket_interface.connect_data()
+
+    report = PowerReport(datetime(2020, 1, 1), 'pytest', 'test', 42)
+    socket_interface.send_data(report)
+    assert socket_interface.receive() == report
+
+    socket_interface.close()
+
+
+@pytest.mark.parametrize('transport', ['ipc', 'inproc'])
+def test_send_data_with_transport(transport, tmp_path):
+    """test that the sockets are bound to named endpoints of the given
+    transport and that the data and control canals work on them
+
+    """
+    socket_interface = SocketInterface(ACTOR_NAME, 100, transport=transport, runtime_dir=str(tmp_path))
+    socket_interface.setup()
+    assert socket_interface.pull_socket_address.startswith(transport + '://')
+    check_socket(socket_interface.pull_socket, zmq.PULL, socket_interface.pull_socket_address)
+    check_socket(socket_interface.control_socket, zmq.PAIR, socket_interface.control_socket_address)
+
+    socket_interface.connect_data()
+    socket_interface.connect_control()
+    socket_interface.send_data('data_msg')
+    assert socket_interface.receive() == 'data_msg'
+    socket_interface.send_control('control_msg')
+    assert socket_interface.receive() == 'control_msg'
+
+    socket_interface.close()
+
+
+def test_ipc_endpoints_are_created_in_runtime_dir(tmp_path):
+    """test that the ipc endpoints are created in the runtime directory of the
+    interface
+
+    """
+    runtime_dir = tmp_path / 'runtime'
+    socket_interface = SocketInterface(ACTOR_NAME, 100, transport='ipc', runtime_dir=str(runtime_dir))
+    socket_interface.setup()
+    assert socket_interface.pull_socket_address.startswith('ipc://' + str(runtime_dir))
+    assert len(list(runtime_dir.iterdir())) == 2
+
+    socket_interface.close()
+
+
+def test_create_socket_interface_with_unknown_transport_raise_exception():
+    """test that an unknown transport is refused
+
+    """
+    with pytest.raises(UnknownTransportException):
+        SocketInterface(ACTOR_NAME, 100, transport='udp')
+
+
+def test_each_thread_connected_to_the_data_canal_use_its_own_push_socket(initialized_socket_interface):
+    """test that the threads connected to an actor don't share their push socket
+
+    """
+    thread_push_sockets = []
+
+    def send_from_thread():
+        initialized_socket_interface.connect_data()
+        thread_push_sockets.append(initialized_socket_interface.push_socket)
+        initialized_socket_interface.send_data('thread_msg')
+
+    initialized_socket_interface.connect_data()
+    thread = threading.Thread(target=send_from_thread)
+    thread.start()
+    thread.join()
+
+    assert thread_push_sockets[0] is not initialized_socket_interface.push_socket
+    assert initialized_socket_interface.receive() == 'thread_msg'
+    thread_push_sockets[0].close()
+
+
+def test_close_remove_the_ipc_endpoints_from_runtime_dir(tmp_path):
+    """test that the files of the ipc endpoints bound by the interface are
+    removed when it is closed
+
+    """
+    runtime_dir = tmp_path / 'runtime'
+    socket_interface = SocketInterface(ACTOR_NAME, 100, transport='ipc', runtime_dir=str(runtime_dir))
+    socket_interface.setup()
+    socket_interface.connect_data()
+    socket_interface.send_data('data_msg')
+    assert socket_interface.receive() == 'data_msg'
+
+    socket_interface.close()
+
+    assert not list(runtime_dir.iterdir())
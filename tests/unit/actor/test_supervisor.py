@@ -52,6 +52,12 @@ class FakeActor(Actor):
     def kill(self):
         self.alive = False
 
+    def soft_kill(self):
+        self.alive = False
+
+    def hard_kill(self):
+        self.alive = False
+
     def join(self):
         pass
 
@@ -156,3 +162,11 @@ def test_kill_actors_methods_all_actor_in_supervised_list_not_alive(supervisor):
     supervisor.kill_actors()
     for actor in supervisor.supervised_actors:
         assert not actor.is_alive()
+
+
+def test_kill_actor_remove_it_from_supervised_list(supervisor):
+    actor = FakeActor()
+    supervisor.launch_actor(actor, start_message=False)
+    supervisor.kill_actor(actor, soft=True)
+    assert actor not in supervisor.supervised_actors
+    assert not actor.is_alive()
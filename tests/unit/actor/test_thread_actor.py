@@ -0,0 +1,127 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+from multiprocessing import Pipe
+
+import pytest
+
+from powerapi.actor import Actor, QueueInterface, Supervisor, UnknownExecutionModeException, \
+    UnsupportedTransportException
+from powerapi.message import StartMessage, OKMessage, PoisonPillMessage
+from powerapi.report import Report
+from tests.utils.actor.dummy_actor import DummyActor
+
+ACTOR_NAME = 'dummy_thread_actor'
+
+
+@pytest.fixture
+def pipe():
+    """
+    Return a pipe used by the actor to forward the messages it handles
+    """
+    pipe_in, pipe_out = Pipe(duplex=False)
+    yield pipe_in, pipe_out
+    pipe_in.close()
+    pipe_out.close()
+
+
+@pytest.fixture
+def thread_actor(pipe):
+    """
+    Return a started actor executed in a thread of the test process
+    """
+    _, pipe_out = pipe
+    actor = DummyActor(ACTOR_NAME, pipe_out, Report, execution_mode='thread')
+    supervisor = Supervisor()
+    supervisor.launch_actor(actor)
+    yield actor
+    if actor.is_alive():
+        actor.hard_kill()
+        actor.join(1)
+
+
+def test_create_actor_with_unknown_execution_mode_raise_exception():
+    """
+    Test that an unknown execution mode is refused
+    """
+    with pytest.raises(UnknownExecutionModeException):
+        Actor(ACTOR_NAME, execution_mode='coroutine')
+
+
+def test_create_process_actor_with_inproc_transport_raise_exception():
+    """
+    Test that the inproc transport is refused for an actor executed in its own process
+    """
+    with pytest.raises(UnsupportedTransportException):
+        Actor(ACTOR_NAME, transport='inproc')
+
+
+def test_thread_actor_use_a_queue_interface(thread_actor):
+    """
+    Test that a thread actor is executed in a thread of the process that launched it
+    """
+    assert isinstance(thread_actor.socket_interface, QueueInterface)
+    assert thread_actor.is_alive()
+    assert thread_actor.pid is None
+    assert ACTOR_NAME in [thread.name for thread in threading.enumerate()]
+
+
+def test_thread_actor_answer_to_start_message(pipe):
+    """
+    Test that a thread actor answer to the StartMessage on the control canal
+    """
+    _, pipe_out = pipe
+    actor = DummyActor(ACTOR_NAME, pipe_out, Report, execution_mode='thread')
+    actor.start()
+    actor.connect_control()
+    actor.send_control(StartMessage('system'))
+    assert isinstance(actor.receive_control(2000), OKMessage)
+    actor.hard_kill()
+    actor.join(1)
+
+
+def test_thread_actor_handle_the_data_messages(thread_actor, pipe):
+    """
+    Test that the messages sent to a thread actor are given to its handler
+    """
+    pipe_in, _ = pipe
+    report = Report(0, 'sensor', 'target')
+    thread_actor.send_data(report)
+    assert pipe_in.poll(2)
+    assert pipe_in.recv() == (ACTOR_NAME, report)
+
+
+def test_send_PoisonPillMessage_terminate_the_thread_actor(thread_actor):
+    """
+    Test that a thread actor thread terminates when it is killed
+    """
+    thread_actor.send_control(PoisonPillMessage(sender_name='system'))
+    thread_actor.join(2)
+    assert not thread_actor.is_alive()
@@ -26,3 +26,25 @@
 # CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from tests.utils.db.opentsdb import FakeOpenTSDBRequestHandler
+
+
+@pytest.fixture
+def fake_opentsdb_server():
+    """
+    Start a local stand-in of the HTTP API of OpenTSDB, the payloads received are stored in its payloads attribute
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOpenTSDBRequestHandler)
+    server.payloads = []
+    server.failures_count = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
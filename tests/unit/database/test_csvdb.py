@@ -0,0 +1,256 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import os
+from datetime import datetime
+
+import pytest
+
+from powerapi.database.csv.csvdb import CsvDB, HeaderAreNotTheSameError, CsvBadCommonKeysError, ParallelCsvIterDB
+from powerapi.report import PowerReport, HWPCReport
+
+CSV_FILES_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'utils', 'db', 'csv_files')
+
+
+def create_report(second, target='target', metadata=None):
+    """
+    Create a power report of the given second and target
+    """
+    return PowerReport(datetime.fromtimestamp(second), 'sensor', target, 10, metadata or {'socket': 0})
+
+
+def read_lines(path):
+    """
+    Return the lines of a csv file
+    """
+    with open(path, encoding='utf-8') as csvfile:
+        return csvfile.read().splitlines()
+
+
+def test_save_many_write_the_rows_of_each_target_after_one_header(tmp_path):
+    """
+    Test that the rows of the reports are written in the file of their target with a single header
+    """
+    database = CsvDB(PowerReport, [], str(tmp_path))
+
+    database.save_many([create_report(1, 'a'), create_report(1, 'b'), create_report(2, 'a')])
+    database.save(create_report(3, 'a'))
+
+    assert read_lines(tmp_path / 'sensor-a' / 'PowerReport.csv') == [
+        'timestamp,sensor,target,power,socket', '1000,sensor,a,10,0', '2000,sensor,a,10,0', '3000,sensor,a,10,0']
+    assert read_lines(tmp_path / 'sensor-b' / 'PowerReport.csv') == [
+        'timestamp,sensor,target,power,socket', '1000,sensor,b,10,0']
+
+
+def test_save_many_keep_at_most_max_open_files(tmp_path):
+    """
+    Test that the least recently used files are closed when the maximum number of open files is reached
+    """
+    database = CsvDB(PowerReport, [], str(tmp_path), max_open_files=2)
+
+    database.save_many([create_report(1, target) for target in ('a', 'b', 'c', 'a')])
+
+    assert list(database.writer_pool.handles) == [str(tmp_path / 'sensor-c' / 'PowerReport.csv'),
+                                                  str(tmp_path / 'sensor-a' / 'PowerReport.csv')]
+    assert read_lines(tmp_path / 'sensor-a' / 'PowerReport.csv')[1:] == ['1000,sensor,a,10,0', '1000,sensor,a,10,0']
+
+
+def test_save_report_with_another_header_raise_exception(tmp_path):
+    """
+    Test that saving a report whose columns differ from the header of its file raise a HeaderAreNotTheSameError
+    """
+    CsvDB(PowerReport, [], str(tmp_path)).save(create_report(1))
+    database = CsvDB(PowerReport, [], str(tmp_path))
+
+    with pytest.raises(HeaderAreNotTheSameError):
+        database.save(create_report(2, metadata={'scope': 'cpu'}))
+
+    database.save(create_report(2))
+    with pytest.raises(HeaderAreNotTheSameError):
+        database.save(create_report(3, metadata={'scope': 'cpu'}))
+
+
+def test_rows_are_buffered_until_the_flush_interval_expire(tmp_path):
+    """
+    Test that the rows are kept in memory until the flush interval expire and written when disconnecting
+    """
+    database = CsvDB(PowerReport, [], str(tmp_path), flush_interval=60000)
+
+    database.save_many([create_report(1), create_report(2)])
+    assert read_lines(tmp_path / 'sensor-target' / 'PowerReport.csv')[1:] == []
+
+    database.disconnect()
+    assert read_lines(tmp_path / 'sensor-target' / 'PowerReport.csv')[1:] == ['1000,sensor,target,10,0',
+                                                                              '2000,sensor,target,10,0']
+
+
+def test_iterate_merge_the_rows_of_each_file_by_timestamp_and_target():
+    """
+    Test that the rows of the files with the same timestamp and target are grouped in one report
+    """
+    database = CsvDB(HWPCReport, [], CSV_FILES_PATH, files=['rapl2.csv', 'core2.csv', 'pcu2.csv'])
+
+    reports = list(database.iter())
+
+    assert [report.timestamp.timestamp() for report in reports] == [1539260664.189, 1539260665.189]
+    for report in reports:
+        assert report.target == 'system'
+        assert set(report.groups) == {'rapl2', 'core2', 'pcu2'}
+
+
+def test_iterate_files_with_missing_timestamp_return_report_without_the_missing_group():
+    """
+    Test that a report is created for a timestamp missing in one of the files, without the group of this file
+    """
+    database = CsvDB(HWPCReport, [], CSV_FILES_PATH, files=['rapl1_miss_first.csv', 'core2.csv'])
+
+    reports = list(database.iter())
+
+    assert [set(report.groups) for report in reports] == [{'core2'}, {'rapl1_miss_first', 'core2'}]
+
+
+def test_iterate_file_without_common_keys_raise_exception():
+    """
+    Test that reading a file without the timestamp, sensor and target columns raise a CsvBadCommonKeysError
+    """
+    database = CsvDB(HWPCReport, [], CSV_FILES_PATH, files=['rapl2.csv', 'bad_common_miss_target.csv'])
+
+    with pytest.raises(CsvBadCommonKeysError):
+        database.iter()
+
+
+def write_hwpc_file(path, timestamps, targets):
+    """
+    Write a csv file with one row per timestamp, target and cpu, the targets of each timestamp are not sorted
+    """
+    lines = ['timestamp,sensor,target,socket,cpu,counter']
+    for timestamp in timestamps:
+        for target in targets:
+            for cpu in range(2):
+                lines.append(f'{timestamp},sensor,{target},0,{cpu},{timestamp + cpu}')
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def test_iterate_group_the_rows_of_each_target_when_the_targets_are_not_sorted(tmp_path):
+    """
+    Test that the rows of a timestamp are grouped by target even if the targets are not sorted in the files
+    """
+    write_hwpc_file(tmp_path / 'rapl.csv', range(1000, 4000, 1000), ['system', 'all'])
+    write_hwpc_file(tmp_path / 'core.csv', range(1000, 4000, 1000), ['system', 'all'])
+    database = CsvDB(HWPCReport, [], str(tmp_path), files=['rapl.csv', 'core.csv'])
+
+    reports = list(database.iter())
+
+    assert [(report.timestamp.timestamp(), report.target) for report in reports] == [(1, 'system'), (1, 'all'),
+                                                                                     (2, 'system'), (2, 'all'),
+                                                                                     (3, 'system'), (3, 'all')]
+    for report in reports:
+        assert set(report.groups) == {'rapl', 'core'}
+
+
+def test_parallel_iterate_return_the_same_reports_than_the_sequential_iterate(tmp_path):
+    """
+    Test that the files split in small chunks and parsed by several workers give the same reports as the
+    sequential reader
+    """
+    write_hwpc_file(tmp_path / 'rapl.csv', range(1000, 51000, 1000), ['system', 'all'])
+    write_hwpc_file(tmp_path / 'core.csv', range(3000, 51000, 2000), ['system', 'all'])
+    files = ['rapl.csv', 'core.csv']
+    database = CsvDB(HWPCReport, [], str(tmp_path), files=files, parallel_workers=2, chunk_size=256)
+
+    iterator = database.iter()
+    assert isinstance(iterator, ParallelCsvIterDB)
+    reports = list(iterator)
+
+    assert reports == list(CsvDB(HWPCReport, [], str(tmp_path), files=files).iter())
+    assert len(reports) == 100
+
+
+def test_parallel_iterate_fixture_files_return_the_same_reports_than_the_sequential_iterate():
+    """
+    Test that the parallel reader handle the files with missing timestamps like the sequential reader
+    """
+    files = ['rapl1_miss_first.csv', 'core2.csv', 'pcu2.csv']
+
+    reports = list(CsvDB(HWPCReport, [], CSV_FILES_PATH, files=files, parallel_workers=2, chunk_size=64).iter())
+
+    assert reports == list(CsvDB(HWPCReport, [], CSV_FILES_PATH, files=files).iter())
+
+
+def test_iter_batches_return_the_reports_of_iterate_by_batch(tmp_path):
+    """
+    Test that the reports are returned by batch of at most the given size, in the order of the sequential reader
+    """
+    write_hwpc_file(tmp_path / 'rapl.csv', range(1000, 6000, 1000), ['system'])
+    database = CsvDB(HWPCReport, [], str(tmp_path), files=['rapl.csv'])
+
+    batches = list(database.iter().iter_batches(2))
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [report for batch in batches for report in batch] == list(database.iter())
+
+
+def test_parallel_iterate_skip_the_malformed_reports_like_the_sequential_iter_batches(tmp_path):
+    """
+    Test that a malformed report parsed by a worker is skipped without stopping the parallel reader
+    """
+    lines = ['timestamp,sensor,target,socket,cpu,counter']
+    for timestamp in range(1000, 6000, 1000):
+        lines.append(f'{timestamp},sensor,system,0,0,{timestamp}')
+        lines.append(f'{timestamp},{"other" if timestamp == 3000 else "sensor"},system,0,1,{timestamp}')
+    (tmp_path / 'rapl.csv').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    database = CsvDB(HWPCReport, [], str(tmp_path), files=['rapl.csv'], parallel_workers=2, chunk_size=64)
+
+    reports = list(database.iter())
+
+    sequential_batches = CsvDB(HWPCReport, [], str(tmp_path), files=['rapl.csv']).iter().iter_batches(10)
+    assert reports == [report for batch in sequential_batches for report in batch]
+    assert len(reports) == 4
+
+
+def test_parallel_workers_are_started_on_first_read_and_stopped_on_disconnect(tmp_path):
+    """
+    Test that the workers of a parallel iterator are only started to read the reports and stopped when the database
+    is disconnected
+    """
+    write_hwpc_file(tmp_path / 'rapl.csv', range(1000, 51000, 1000), ['system'])
+    database = CsvDB(HWPCReport, [], str(tmp_path), files=['rapl.csv'], parallel_workers=2, chunk_size=256)
+    database.connect()
+
+    iterator = database.iter()
+    assert iterator.pool is None
+
+    next(iterator)
+    assert iterator.pool is not None
+
+    database.disconnect()
+    assert iterator.pool is None
+
+    # Only the reports of the chunk already parsed are returned
+    remaining_reports = list(iterator.reports)
+    assert list(iterator) == remaining_reports
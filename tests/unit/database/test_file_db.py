@@ -0,0 +1,178 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import json
+import os
+
+from powerapi.database.file import FileDB
+from powerapi.database.file.file_db import FileTailIterDB
+from powerapi.report import PowerReport
+
+
+def json_line(timestamp, target='target'):
+    """
+    Return a json line describing a power report
+    """
+    return json.dumps({'timestamp': timestamp, 'sensor': 'sensor', 'target': target, 'power': 10}) + '\n'
+
+
+def append(path, content):
+    """
+    Append the given content to the file
+    """
+    with open(path, 'a', encoding='utf-8') as file_object:
+        file_object.write(content)
+
+
+def read_timestamps(iterator):
+    """
+    Return the timestamp (in ms) of the reports available in the iterator
+    """
+    return [int(report.timestamp.timestamp() * 1000) for report in iterator]
+
+
+def test_follow_file_return_each_appended_report_once(tmp_path):
+    """
+    Test that the reports appended to the file between two reads are returned once, even when they are identical
+    """
+    path = tmp_path / 'reports.json'
+    append(path, json_line(1000) + json_line(2000))
+    database = FileDB(PowerReport, str(path), follow=True)
+    database.connect()
+    iterator = database.iter(stream_mode=True)
+    assert isinstance(iterator, FileTailIterDB)
+
+    assert read_timestamps(iterator) == [1000, 2000]
+    assert read_timestamps(iterator) == []
+
+    append(path, json_line(3000) + json_line(3000))
+    assert read_timestamps(iterator) == [3000, 3000]
+    iterator.close()
+
+
+def test_follow_file_wait_the_end_of_a_partially_written_line(tmp_path):
+    """
+    Test that a line is parsed only once its newline is written
+    """
+    path = tmp_path / 'reports.json'
+    line = json_line(1000)
+    append(path, line[:10])
+    iterator = FileDB(PowerReport, str(path), follow=True).iter(stream_mode=True)
+
+    assert read_timestamps(iterator) == []
+    append(path, line[10:])
+    assert read_timestamps(iterator) == [1000]
+    iterator.close()
+
+
+def test_follow_file_read_the_new_file_after_a_rotation(tmp_path):
+    """
+    Test that the reports of the rotated file are read before the ones of the new file
+    """
+    path = tmp_path / 'reports.json'
+    append(path, json_line(1000))
+    iterator = FileDB(PowerReport, str(path), follow=True).iter(stream_mode=True)
+    assert read_timestamps(iterator) == [1000]
+
+    append(path, json_line(2000))
+    os.rename(path, tmp_path / 'reports.json.1')
+    assert read_timestamps(iterator) == [2000]
+
+    append(path, json_line(3000))
+    assert read_timestamps(iterator) == [3000]
+    iterator.close()
+
+
+def test_follow_file_read_a_truncated_file_from_its_beginning(tmp_path):
+    """
+    Test that the content of a truncated file is read from its beginning
+    """
+    path = tmp_path / 'reports.json'
+    append(path, json_line(1000) + json_line(2000))
+    iterator = FileDB(PowerReport, str(path), follow=True).iter(stream_mode=True)
+    assert read_timestamps(iterator) == [1000, 2000]
+
+    path.write_text(json_line(3000), encoding='utf-8')
+    assert read_timestamps(iterator) == [3000]
+    iterator.close()
+
+
+def test_follow_file_skip_malformed_lines(tmp_path):
+    """
+    Test that a line that is not a json document is skipped
+    """
+    path = tmp_path / 'reports.json'
+    append(path, json_line(1000) + '{"timestamp": \n' + json_line(2000))
+    iterator = FileDB(PowerReport, str(path), follow=True).iter(stream_mode=True)
+
+    assert read_timestamps(iterator) == [1000, 2000]
+    iterator.close()
+
+
+def test_follow_file_iter_batches_return_the_appended_reports_by_batch(tmp_path):
+    """
+    Test that the appended reports are returned by batch until no complete line is available
+    """
+    path = tmp_path / 'reports.json'
+    append(path, ''.join(json_line(timestamp) for timestamp in range(1000, 6000, 1000)))
+    iterator = FileDB(PowerReport, str(path), follow=True).iter(stream_mode=True)
+
+    batches = list(iterator.iter_batches(2))
+    assert [read_timestamps(batch) for batch in batches] == [[1000, 2000], [3000, 4000], [5000]]
+
+    append(path, json_line(6000))
+    assert [read_timestamps(batch) for batch in iterator.iter_batches(2)] == [[6000]]
+    iterator.close()
+
+
+def test_follow_file_is_closed_once_read_without_stream_mode(tmp_path):
+    """
+    Test that the followed file is closed once all its lines are read when the iterator is not in stream mode
+    """
+    path = tmp_path / 'reports.json'
+    append(path, json_line(1000) + json_line(2000))
+    iterator = FileDB(PowerReport, str(path), follow=True).iter()
+
+    assert read_timestamps(iterator) == [1000, 2000]
+    assert iterator.file_object is None
+
+
+def test_follow_file_is_closed_on_disconnect(tmp_path):
+    """
+    Test that the files followed by the iterators of the database are closed when it is disconnected
+    """
+    path = tmp_path / 'reports.json'
+    append(path, json_line(1000))
+    database = FileDB(PowerReport, str(path), follow=True)
+    database.connect()
+    iterator = database.iter(stream_mode=True)
+    assert read_timestamps(iterator) == [1000]
+
+    database.disconnect()
+
+    assert iterator.file_object is None
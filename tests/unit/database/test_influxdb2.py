@@ -0,0 +1,123 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from powerapi.database.influxdb2.influxdb2 import InfluxDB2, LineProtocolEncoder
+from powerapi.report import PowerReport
+
+
+def create_report(metadata=None, power=12.5):
+    """
+    Create a power report with the given metadata
+    """
+    return PowerReport(datetime(2024, 1, 1, 0, 0, 1, 500), 'sensor', 'target', power, metadata or {})
+
+
+def test_encode_report_without_metadata():
+    """
+    Test that a report without metadata is encoded with its sensor and target as tags and its timestamp in ns
+    """
+    encoder = LineProtocolEncoder(None)
+
+    assert encoder.encode(create_report()) == \
+        'power_consumption,sensor=sensor,target=target power=12.5 1704067201000500000'
+
+
+def test_encode_report_with_integer_power_and_aware_timestamp():
+    """
+    Test that an integer power is encoded as an integer field and that an aware timestamp is converted in UTC
+    """
+    report = PowerReport(datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc), 'sensor', 'target', 12)
+
+    assert LineProtocolEncoder(None).encode(report) == \
+        'power_consumption,sensor=sensor,target=target power=12i 1704067201000000000'
+
+
+def test_encode_report_with_metadata_use_sanitized_and_escaped_tags():
+    """
+    Test that the flattened metadata are encoded as tags with sanitized names and escaped values
+    """
+    report = create_report({'socket': 0, 'k8s': {'app.name': 'my app', 'pod-id': 'a=b,c'}, 'empty': ''})
+
+    assert LineProtocolEncoder(None).encode(report) == \
+        'power_consumption,sensor=sensor,target=target,k8s_app_name=my\\ app,k8s_pod_id=a\\=b\\,c,socket=0 ' \
+        'power=12.5 1704067201000500000'
+
+
+def test_encode_report_keep_only_selected_tags():
+    """
+    Test that only the selected metadata are used as tags
+    """
+    report = create_report({'socket': 0, 'scope': 'cpu'})
+
+    assert LineProtocolEncoder(['scope']).encode(report) == \
+        'power_consumption,sensor=sensor,target=target,scope=cpu power=12.5 1704067201000500000'
+
+
+def test_encode_report_with_non_finite_power_return_none():
+    """
+    Test that the reports whose power cannot be written in line protocol are not encoded
+    """
+    encoder = LineProtocolEncoder(None)
+
+    assert encoder.encode(create_report(power=float('nan'))) is None
+    assert encoder.encode(create_report(power=float('-inf'))) is None
+
+
+def test_encoder_use_the_cached_tag_names_of_each_metadata_key_set():
+    """
+    Test that the tag names are computed once for the reports having the same metadata keys
+    """
+    encoder = LineProtocolEncoder(None)
+    encoder.encode(create_report({'socket': 0, 'app.name': 'first'}))
+
+    cache_info = PowerReport.get_tags_name_cache_info()
+    line = encoder.encode(create_report({'socket': 1, 'app.name': 'second'}))
+
+    assert line == 'power_consumption,sensor=sensor,target=target,app_name=second,socket=1 power=12.5 ' \
+        '1704067201000500000'
+    assert PowerReport.get_tags_name_cache_info().misses == cache_info.misses
+    assert PowerReport.get_tags_name_cache_info().hits == cache_info.hits + 1
+
+
+def test_save_many_in_line_protocol_mode_write_the_encoded_lines():
+    """
+    Test that the reports are written as line protocol lines when the line protocol mode is enabled, the reports with
+    a non finite power being skipped
+    """
+    database = InfluxDB2(PowerReport, 'http://localhost:8086', 'org', 'bucket', 'token', [], batching=True,
+                         line_protocol=True)
+    database.write_api = Mock()
+
+    database.save_many([create_report(), create_report(power=float('inf')), create_report(power=13.5)])
+
+    database.write_api.write.assert_called_once_with(bucket='bucket', record=[
+        'power_consumption,sensor=sensor,target=target power=12.5 1704067201000500000',
+        'power_consumption,sensor=sensor,target=target power=13.5 1704067201000500000'])
@@ -0,0 +1,305 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+import bson
+import pymongo
+from bson.raw_bson import RawBSONDocument
+
+from powerapi.database.mongodb import MongoDB, UnknownStreamReaderException
+from powerapi.report import PowerReport, RawReport
+
+
+def create_report(second, target='target', power=10):
+    """
+    Create a power report of the given second and target
+    """
+    return PowerReport(datetime.fromtimestamp(second), 'sensor', target, power)
+
+
+def create_database(**kwargs):
+    """
+    Create a MongoDB saving the reports in a mock collection
+    """
+    database = MongoDB(PowerReport, 'mongodb://localhost', 'db', 'collection', **kwargs)
+    database.collection = Mock()
+    return database
+
+
+@pytest.fixture(name='update_one')
+def recorded_update_one(monkeypatch):
+    """
+    Replace the pymongo UpdateOne operation by a mock recording the filter and the update of each bucket
+    """
+    update_one = Mock()
+    monkeypatch.setattr(pymongo, 'UpdateOne', update_one)
+    return update_one
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_save_many_insert_the_reports_with_the_configured_order(ordered):
+    """
+    Test that the reports are inserted with an ordered or unordered bulk insert
+    """
+    database = create_database(ordered=ordered)
+
+    database.save_many([create_report(1), create_report(2)])
+
+    database.collection.insert_many.assert_called_once()
+    assert database.collection.insert_many.call_args.kwargs == {'ordered': ordered}
+    assert len(database.collection.insert_many.call_args.args[0]) == 2
+
+
+def test_save_many_pack_the_reports_of_a_sensor_target_and_window_in_one_bucket(update_one):
+    """
+    Test that the reports of the same sensor, target and time window are appended to the same bucket
+    """
+    database = create_database(ordered=False, bucket_size=10, bucket_window=60000)
+
+    database.save_many([create_report(60), create_report(61, power=11), create_report(62, target='other')])
+
+    assert database.collection.bulk_write.call_args.args[0] == [update_one.return_value] * 2
+    assert database.collection.bulk_write.call_args.kwargs == {'ordered': False}
+
+    bucket_filter, bucket_update = update_one.call_args_list[0].args
+    assert update_one.call_args_list[0].kwargs == {'upsert': True}
+    assert bucket_filter == {'sensor': 'sensor', 'target': 'target', 'timestamp': datetime.fromtimestamp(60),
+                             'fields': ['metadata', 'power', 'timestamp'], 'count': {'$lte': 8}}
+    assert bucket_update['$inc'] == {'count': 2}
+    assert bucket_update['$push']['reports.power'] == {'$each': [10, 11]}
+    assert bucket_update['$push']['reports.timestamp'] == {'$each': [datetime.fromtimestamp(60),
+                                                                     datetime.fromtimestamp(61)]}
+    assert 'reports.sensor' not in bucket_update['$push']
+
+
+def test_save_many_split_the_reports_exceeding_the_bucket_size(update_one):
+    """
+    Test that a bucket contains at most bucket_size reports
+    """
+    database = create_database(bucket_size=2)
+
+    database.save_many([create_report(second) for second in range(5)])
+
+    assert [call.args[1]['$inc']['count'] for call in update_one.call_args_list] == [2, 2, 1]
+
+
+def test_save_many_pack_the_reports_with_other_fields_in_another_bucket(update_one):
+    """
+    Test that the reports having different fields are not packed in the same bucket, so that every column of a
+    bucket has a value for each of its reports
+    """
+    database = create_database(bucket_size=10)
+    database.report_type = Mock()
+    database.report_type.to_mongodb.side_effect = lambda report: dict(PowerReport.to_mongodb(report),
+                                                                     **({'cpu': 1} if report.power > 10 else {}))
+
+    database.save_many([create_report(1), create_report(2, power=11), create_report(3)])
+
+    updates = [call.args for call in update_one.call_args_list]
+    assert [bucket_filter['fields'] for bucket_filter, _ in updates] == [['metadata', 'power', 'timestamp'],
+                                                                         ['cpu', 'metadata', 'power', 'timestamp']]
+    assert updates[0][1]['$push']['reports.power'] == {'$each': [10, 10]}
+    assert updates[1][1]['$push']['reports.cpu'] == {'$each': [1]}
+
+
+def test_save_many_start_the_buckets_on_utc_time_windows(update_one):
+    """
+    Test that the time windows of the buckets are aligned on the UTC time of the naive report timestamps
+    """
+    database = create_database(bucket_size=10, bucket_window=24 * 3600 * 1000)
+
+    database.save_many([PowerReport(datetime(2026, 1, 2, 5, 30), 'sensor', 'target', 10)])
+
+    assert update_one.call_args.args[0]['timestamp'] == datetime(2026, 1, 2)
+
+
+@pytest.mark.parametrize('bucket_size', [None, 10])
+def test_connect_index_the_buckets_on_their_upsert_filter(monkeypatch, bucket_size):
+    """
+    Test that the collection is indexed on the fields used to find the bucket of the reports, when they are bucketed
+    """
+    client = MagicMock()
+    monkeypatch.setattr(pymongo, 'MongoClient', Mock(return_value=client))
+    database = MongoDB(PowerReport, 'mongodb://localhost', 'db', 'collection', bucket_size=bucket_size)
+
+    database.connect()
+
+    collection = client['db']['collection']
+    if bucket_size is None:
+        collection.create_index.assert_not_called()
+    else:
+        collection.create_index.assert_called_once_with([('sensor', pymongo.ASCENDING), ('target', pymongo.ASCENDING),
+                                                         ('timestamp', pymongo.ASCENDING),
+                                                         ('fields', pymongo.ASCENDING)])
+
+
+def test_unpack_bucket_return_the_documents_of_its_reports():
+    """
+    Test that the documents of the reports packed in a bucket can be rebuilt
+    """
+    bucket = {'_id': 1, 'sensor': 'sensor', 'target': 'target', 'timestamp': datetime.fromtimestamp(0), 'count': 2,
+              'reports': {'timestamp': [datetime.fromtimestamp(1), datetime.fromtimestamp(2)], 'power': [10, 11]}}
+
+    reports = [PowerReport.from_mongodb(document) for document in MongoDB.unpack_bucket(bucket)]
+
+    assert reports == [create_report(1), create_report(2, power=11)]
+
+
+def test_iterate_on_bucketed_database_return_each_packed_report():
+    """
+    Test that a bucketed database iterator return the reports of each bucket one by one
+    """
+    database = create_database(bucket_size=10)
+    bucket = {'sensor': 'sensor', 'target': 'target', 'timestamp': datetime.fromtimestamp(0), 'count': 2,
+              'reports': {'timestamp': [datetime.fromtimestamp(1), datetime.fromtimestamp(2)], 'power': [10, 11]}}
+    database.collection.find_one_and_delete.side_effect = [bucket, None]
+
+    assert list(database.iter(stream_mode=True)) == [create_report(1), create_report(2, power=11)]
+
+
+def test_create_database_with_unknown_stream_reader_raise_exception():
+    """
+    Test that creating a database with an unknown stream reader raise an UnknownStreamReaderException
+    """
+    with pytest.raises(UnknownStreamReaderException):
+        MongoDB(PowerReport, 'mongodb://localhost', 'db', 'collection', stream_reader='unknown')
+
+
+def test_iterate_in_offline_mode_use_batch_size_and_projection():
+    """
+    Test that the offline iterator query the documents with a batch size hint and without their identifier
+    """
+    database = create_database(batch_size=500)
+    database.collection.find.return_value.next.side_effect = [PowerReport.to_mongodb(create_report(1)), StopIteration]
+
+    assert list(database.iter(stream_mode=False)) == [create_report(1)]
+    database.collection.find.assert_called_with({}, {'_id': False}, batch_size=500)
+
+
+def test_claim_documents_by_batch_delete_them_in_one_request():
+    """
+    Test that the claimed documents are fetched sorted by the sort key and deleted with one request
+    """
+    database = create_database(stream_batch_size=2, stream_sort_key='timestamp')
+    documents = [dict(PowerReport.to_mongodb(create_report(second)), _id=second) for second in range(3)]
+    database.collection.find.side_effect = [documents[:2], documents[2:], []]
+
+    iterator = database.iter(stream_mode=True)
+    assert [next(iterator), next(iterator)] == [create_report(0), create_report(1)]
+    database.collection.find.assert_called_with({}, sort=[('timestamp', pymongo.ASCENDING)], limit=2)
+    database.collection.delete_many.assert_called_once_with({'_id': {'$in': [0, 1]}})
+
+    assert list(iterator) == [create_report(2)]
+    assert database.collection.delete_many.call_count == 2
+
+
+def test_change_stream_reader_return_the_inserted_documents():
+    """
+    Test that the change stream reader return the documents of the insert events until no event is available
+    """
+    database = create_database(stream_reader='change-stream', stream_batch_size=10)
+    change_stream = database.collection.watch.return_value
+    change_stream.try_next.side_effect = [{'fullDocument': PowerReport.to_mongodb(create_report(1))},
+                                          {'fullDocument': PowerReport.to_mongodb(create_report(2))}, None, None]
+
+    assert list(database.iter(stream_mode=True)) == [create_report(1), create_report(2)]
+    database.collection.find_one_and_delete.assert_not_called()
+
+
+def test_tailable_reader_restart_its_cursor_after_the_last_read_document():
+    """
+    Test that a dead tailable cursor is recreated to read the documents following the last read one
+    """
+    database = create_database(stream_reader='tailable')
+    dead_cursor = Mock(alive=False)
+    dead_cursor.next.return_value = dict(PowerReport.to_mongodb(create_report(1)), _id=1)
+    database.collection.find.return_value = dead_cursor
+
+    iterator = database.iter(stream_mode=True)
+    assert next(iterator) == create_report(1)
+    next(iterator)
+
+    assert database.collection.find.call_args_list[0].args == ({},)
+    assert database.collection.find.call_args_list[1].args == ({'_id': {'$gt': 1}},)
+    assert database.collection.find.call_args.kwargs['cursor_type'] == pymongo.CursorType.TAILABLE
+
+
+def test_next_batch_wait_for_the_claimed_documents():
+    """
+    Test that next_batch polls the collection until documents are available and return them together
+    """
+    database = create_database()
+    database.collection.find_one_and_delete.side_effect = [None, PowerReport.to_mongodb(create_report(1)),
+                                                           PowerReport.to_mongodb(create_report(2)), None]
+
+    assert database.iter(stream_mode=True).next_batch(10, 1000) == [create_report(1), create_report(2)]
+    assert database.collection.find_one_and_delete.call_count == 4
+
+
+def test_next_batch_return_empty_list_when_the_timeout_expire():
+    """
+    Test that next_batch return an empty list when no document is available before the timeout
+    """
+    database = create_database()
+    database.collection.find_one_and_delete.return_value = None
+
+    assert not database.iter(stream_mode=True).next_batch(10, 30)
+    assert database.collection.find_one_and_delete.call_count > 1
+
+
+def test_iter_batches_in_offline_mode_return_the_documents_of_the_cursor_by_batch():
+    """
+    Test that the documents of the cursor are returned by batch until the cursor is exhausted
+    """
+    database = create_database()
+    documents = [PowerReport.to_mongodb(create_report(second)) for second in range(3)]
+    database.collection.find.return_value.next.side_effect = [*documents, StopIteration]
+
+    batches = list(database.iter(stream_mode=False).iter_batches(2))
+
+    assert batches == [[create_report(0), create_report(1)], [create_report(2)]]
+
+
+def test_iterate_in_pass_through_mode_return_raw_reports_of_the_bson_documents():
+    """
+    Test that the raw BSON documents are returned as raw reports keeping their bytes
+    """
+    database = create_database(pass_through=True)
+    document = RawBSONDocument(bson.encode(PowerReport.to_mongodb(create_report(1))))
+    database.collection.find.return_value.next.side_effect = [document, StopIteration]
+
+    reports = list(database.iter(stream_mode=False))
+
+    assert len(reports) == 1
+    assert isinstance(reports[0], RawReport)
+    assert reports[0].payload == document.raw
+    assert reports[0].parse() == create_report(1)
@@ -0,0 +1,162 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from powerapi.database.opentsdb.opentsdb import OpenTSDB, CantConnectToOpenTSDBException, to_epoch_seconds
+from powerapi.report import PowerReport
+
+
+def create_reports(count):
+    """
+    Create power reports with consecutive timestamps
+    """
+    return [PowerReport(datetime(2024, 1, 1, 0, 0, second), 'sensor', f'target{second}', 10.5) for second in
+            range(count)]
+
+
+def create_database(server, **kwargs):
+    """
+    Create an OpenTSDB database in batching mode connected to the given server
+    """
+    host, port = server.server_address
+    database = OpenTSDB(PowerReport, host, port, 'power', batching=True, retry_interval=10, **kwargs)
+    database.connect()
+    return database
+
+
+def test_to_epoch_seconds_consider_the_timestamp_in_utc():
+    """
+    Test that naive and aware timestamps are converted like the utc timestamps of the reports
+    """
+    assert to_epoch_seconds(datetime(2024, 1, 1, 0, 0, 1, 999)) == 1704067201
+    assert to_epoch_seconds(datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc)) == 1704067201
+
+
+def test_save_many_without_batching_send_each_report_with_the_client():
+    """
+    Test that each report is given to the client when the batching mode is disabled
+    """
+    database = OpenTSDB(PowerReport, 'localhost', 4242, 'power')
+    database.client = Mock()
+
+    database.save_many(create_reports(2))
+
+    database.client.send.assert_any_call('power', 10.5, timestamp=1704067200, host='target0')
+    database.client.send.assert_called_with('power', 10.5, timestamp=1704067201, host='target1')
+
+
+def test_save_many_send_the_data_points_by_batch(fake_opentsdb_server):
+    """
+    Test that the full batches are sent and that the last data points are sent when the database is disconnected
+    """
+    database = create_database(fake_opentsdb_server, batch_size=2, flush_interval=60000)
+
+    database.save_many(create_reports(5))
+    assert len(database.data_points) == 1
+
+    database.disconnect()
+    # The requests are sent concurrently, they can be received in any order
+    assert sorted(len(payload) for payload in fake_opentsdb_server.payloads) == [1, 2, 2]
+    data_points = sorted((point for payload in fake_opentsdb_server.payloads for point in payload),
+                         key=lambda point: point['timestamp'])
+    assert [point['timestamp'] for point in data_points] == list(range(1704067200, 1704067205))
+    assert data_points[0] == {'metric': 'power', 'timestamp': 1704067200, 'value': 10.5, 'tags': {'host': 'target0'}}
+
+
+def test_save_many_send_the_data_points_when_the_flush_interval_expire(fake_opentsdb_server):
+    """
+    Test that the buffered data points are sent when the flush interval expired, even if they don't fill a batch
+    """
+    database = create_database(fake_opentsdb_server, batch_size=100, flush_interval=0)
+
+    database.save_many(create_reports(3))
+
+    assert not database.data_points
+    database.disconnect()
+    assert [len(payload) for payload in fake_opentsdb_server.payloads] == [3]
+
+
+def test_partial_batch_is_sent_when_the_flush_interval_expire_without_other_report(fake_opentsdb_server):
+    """
+    Test that the buffered data points are sent by the flush timer when no report is saved after them
+    """
+    database = create_database(fake_opentsdb_server, batch_size=100, flush_interval=50)
+
+    database.save_many(create_reports(3))
+    assert len(database.data_points) == 3
+
+    deadline = time.monotonic() + 2
+    while not fake_opentsdb_server.payloads and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [len(payload) for payload in fake_opentsdb_server.payloads] == [3]
+    assert not database.data_points
+    database.disconnect()
+
+
+def test_failed_request_is_retried(fake_opentsdb_server):
+    """
+    Test that a request failing less than max_retries times is sent again
+    """
+    fake_opentsdb_server.failures_count = 2
+    database = create_database(fake_opentsdb_server, batch_size=3, max_retries=2)
+
+    database.save_many(create_reports(3))
+    database.disconnect()
+
+    assert [len(payload) for payload in fake_opentsdb_server.payloads] == [3]
+    assert database.dropped_data_points_count == 0
+
+
+def test_data_points_are_dropped_after_max_retries(fake_opentsdb_server):
+    """
+    Test that the data points of a request failing more than max_retries times are dropped
+    """
+    fake_opentsdb_server.failures_count = 2
+    database = create_database(fake_opentsdb_server, batch_size=3, max_retries=1)
+
+    database.save_many(create_reports(3))
+    database.disconnect()
+
+    assert not fake_opentsdb_server.payloads
+    assert database.dropped_data_points_count == 3
+
+
+def test_connect_without_server_raise_exception():
+    """
+    Test that connecting in batching mode to a port without server raise a CantConnectToOpenTSDBException
+    """
+    database = OpenTSDB(PowerReport, '127.0.0.1', 1, 'power', batching=True)
+
+    with pytest.raises(CantConnectToOpenTSDBException):
+        database.connect()
@@ -0,0 +1,146 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime
+
+from prometheus_client import CollectorRegistry, generate_latest
+
+from powerapi.database.prometheus.prometheus_db import PrometheusDB
+from powerapi.report import PowerReport
+
+
+def create_report(target, power, socket=0):
+    """
+    Create a power report of the given target
+    """
+    return PowerReport(datetime.now(), 'sensor', target, power, {'socket': socket})
+
+
+def create_database(registry, **kwargs):
+    """
+    Create a prometheus database exposing the energy metric in the given registry
+    """
+    return PrometheusDB(PowerReport, 0, '127.0.0.1', 'energy', 'energy consumption', ['socket'], registry=registry,
+                        **kwargs)
+
+
+def test_save_reports_of_the_same_series_reuse_the_gauge_child():
+    """
+    Test that the Gauge child of a series is resolved once and updated by the following reports
+    """
+    registry = CollectorRegistry()
+    database = create_database(registry)
+
+    database.save_many([create_report('a', 10), create_report('a', 12), create_report('b', 5)])
+
+    assert len(database.metric_children) == 2
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'a', 'socket': '0'}) == 12
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'b', 'socket': '0'}) == 5
+
+
+def test_collector_mode_render_the_last_value_of_each_series():
+    """
+    Test that the collector exposes the last value of each series when the metric is scraped
+    """
+    registry = CollectorRegistry()
+    database = create_database(registry, collector=True)
+
+    database.save_many([create_report('a', 10), create_report('a', 12), create_report('b', 5, socket=1)])
+
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'a', 'socket': '0'}) == 12
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'b', 'socket': '1'}) == 5
+    assert b'energy{sensor="sensor",socket="1",target="b"} 5.0' in generate_latest(registry)
+
+
+def test_save_reports_of_the_same_series_reuse_the_labels_values():
+    """
+    Test that the labels values of a series are computed once, the reports with nested metadata not being cached
+    """
+    registry = CollectorRegistry()
+    database = create_database(registry)
+    nested_report = PowerReport(datetime.now(), 'sensor', 'c', 3, {'socket': 0, 'k8s': {'pod': 'p'}})
+
+    database.save_many([create_report('a', 10), create_report('a', 12), create_report('a', 7, socket=1),
+                        nested_report])
+
+    assert database.reports_labels_values == {('sensor', 'a', ('socket',), (0,)): ('sensor', 'a', '0'),
+                                              ('sensor', 'a', ('socket',), (1,)): ('sensor', 'a', '1')}
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'a', 'socket': '0'}) == 12
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'a', 'socket': '1'}) == 7
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'c', 'socket': '0'}) == 3
+
+
+def test_save_reports_with_varying_metadata_values_keep_the_labels_values_cache_bounded():
+    """
+    Test that the values of the metadata that are not used as labels don't add entries to the labels values cache
+    """
+    registry = CollectorRegistry()
+    database = create_database(registry)
+
+    database.save_many([PowerReport(datetime.now(), 'sensor', 'a', power, {'socket': 0, 'ratio': power / 1000})
+                        for power in range(1000)])
+
+    assert len(database.reports_labels_values) == 1
+    assert len(database.metric_children) == 1
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'a', 'socket': '0'}) == 999
+
+
+def test_series_not_updated_during_stale_delay_are_removed():
+    """
+    Test that the series that were not updated during the given number of scrape intervals are removed
+    """
+    registry = CollectorRegistry()
+    database = create_database(registry, stale_scrape_count=2, scrape_interval=1000)
+    database.save(create_report('a', 10))
+    database.save(create_report('b', 5))
+
+    database.series_last_update[('sensor', 'a', '0')] -= 3
+    database.last_stale_series_check -= 1
+    database.save(create_report('b', 6))
+
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'a', 'socket': '0'}) is None
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'b', 'socket': '0'}) == 6
+    assert list(database.series_last_update) == [('sensor', 'b', '0')]
+    assert list(database.reports_labels_values.values()) == [('sensor', 'b', '0')]
+
+
+def test_collector_remove_the_stale_series_when_it_is_scraped():
+    """
+    Test that the collector removes the series that were not updated during the stale delay without waiting for
+    a report to be saved
+    """
+    registry = CollectorRegistry()
+    database = create_database(registry, collector=True, stale_scrape_count=2, scrape_interval=1000)
+    database.save(create_report('a', 10))
+    database.save(create_report('b', 5))
+
+    database.energy_metric.series_last_update[('sensor', 'a', '0')] -= 3
+
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'a', 'socket': '0'}) is None
+    assert registry.get_sample_value('energy', {'sensor': 'sensor', 'target': 'b', 'socket': '0'}) == 5
+    assert list(database.energy_metric.values) == [('sensor', 'b', '0')]
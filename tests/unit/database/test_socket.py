@@ -27,9 +27,17 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
+import socket
+import threading
+import time
+
 import pytest
 
-from powerapi.database.socket.socket_db import JsonRequestHandler
+from powerapi.database.socket import SocketDB, UnknownSocketServerModeException
+from powerapi.database.socket.socket_db import JsonRequestHandler, DocumentQueue, FramedDocumentReader, \
+    BufferOverflowException, decode_documents
+from powerapi.report import PowerReport
 
 
 def test_parse_json_empty_document():
@@ -82,6 +90,16 @@ def test_parse_multiple_json_documents():
     assert second_result == {"d": 4, "e": 5, "f": 6}
 
 
+def test_parse_more_than_two_json_documents():
+    """
+    Test parsing more than two JSON documents separated or not by a newline.
+    """
+    document = '''{"a": 1}{"b": 2}\n{"c": 3}{"d": 4}'''
+    results = JsonRequestHandler.parse_json_documents(document)
+
+    assert list(results) == [{"a": 1}, {"b": 2}, {"c": 3}, {"d": 4}]
+
+
 def test_parse_multiple_documents_first_valid_second_invalid():
     """
     Test parsing multiple JSON documents where the first document is valid and second is invalid.
@@ -94,3 +112,139 @@ def test_parse_multiple_documents_first_valid_second_invalid():
 
     with pytest.raises(StopIteration):
         next(results)
+
+
+def test_decode_documents_of_several_payloads():
+    """
+    Test decoding the documents of several payloads at once, the empty payloads are ignored.
+    """
+    assert decode_documents([b'{"a": 1}', b'', b' {"b": 2}']) == [{"a": 1}, {"b": 2}]
+
+
+def test_decode_documents_with_malformed_payload_keep_the_valid_documents():
+    """
+    Test decoding payloads where one is malformed and another contains two documents.
+    """
+    assert decode_documents([b'{"a": 1}', b'{"b":', b'{"c": 3}{"d": 4}']) == [{"a": 1}, {"c": 3}, {"d": 4}]
+
+
+def test_newline_framed_reader_keep_the_last_incomplete_line():
+    """
+    Test that the incomplete line is decoded once its end is received or when the connection is closed.
+    """
+    reader = FramedDocumentReader('newline', 1024)
+
+    assert reader.feed(b'{"a": 1}\n{"b": 2}\n{"c"') == [{"a": 1}, {"b": 2}]
+    assert reader.feed(b': 3}\n{"d": 4}') == [{"c": 3}]
+    assert reader.close() == [{"d": 4}]
+
+
+def test_length_prefixed_framed_reader_wait_for_the_complete_frame():
+    """
+    Test that a length-prefixed frame is decoded once all its bytes are received.
+    """
+    frames = b''.join(len(payload).to_bytes(4, 'big') + payload for payload in [b'{"a": 1}', b'{"b": 2}'])
+    reader = FramedDocumentReader('length-prefixed', 1024)
+
+    assert reader.feed(frames[:15]) == [{"a": 1}]
+    assert reader.feed(frames[15:]) == [{"b": 2}]
+    assert reader.close() == []
+
+
+def test_framed_reader_raise_exception_when_the_buffer_overflow():
+    """
+    Test that an incomplete document larger than the buffer raises a BufferOverflowException.
+    """
+    with pytest.raises(BufferOverflowException):
+        FramedDocumentReader('newline', 8).feed(b'{"a": 1, "b": 2')
+
+    with pytest.raises(BufferOverflowException):
+        FramedDocumentReader('length-prefixed', 8).feed((9).to_bytes(4, 'big'))
+
+
+def test_get_many_wait_for_the_documents():
+    """
+    Test that get_many waits for a document and returns at most max_n documents.
+    """
+    queue = DocumentQueue()
+    assert queue.get_many(10, timeout=0.01) == []
+
+    threading.Timer(0.05, queue.put_many, [[{"a": 1}, {"b": 2}, {"c": 3}]]).start()
+    assert queue.get_many(2, timeout=5) == [{"a": 1}, {"b": 2}]
+    assert queue.get_many(2, timeout=0) == [{"c": 3}]
+
+
+def test_create_socket_db_with_unknown_server_mode_raise_exception():
+    """
+    Test that creating a SocketDB with an unknown server mode raises an UnknownSocketServerModeException.
+    """
+    with pytest.raises(UnknownSocketServerModeException):
+        SocketDB(PowerReport, '127.0.0.1', 0, server_mode='forking')
+
+
+def test_next_batch_return_the_reports_of_the_received_documents():
+    """
+    Test that next_batch waits for the documents and returns their reports, the malformed documents are skipped.
+    """
+    database = SocketDB(PowerReport, '127.0.0.1', 0)
+    database.received_data_queue = DocumentQueue()
+    iterator = database.iter(stream_mode=True)
+    assert not iterator.next_batch(10, 10)
+
+    documents = [{'timestamp': 1000, 'sensor': 'sensor', 'target': 'target', 'power': 10}, {'timestamp': 2000},
+                 {'timestamp': 3000, 'sensor': 'sensor', 'target': 'target', 'power': 10}]
+    threading.Timer(0.05, database.received_data_queue.put_many, [documents]).start()
+
+    reports = iterator.next_batch(10, 5000)
+    assert [int(report.timestamp.timestamp()) for report in reports] == [1, 3]
+
+
+def test_iter_batches_return_the_received_reports_until_the_queue_is_empty():
+    """
+    Test that iter_batches returns the reports of the received documents by batch without waiting for new documents.
+    """
+    database = SocketDB(PowerReport, '127.0.0.1', 0)
+    database.received_data_queue = DocumentQueue()
+    database.received_data_queue.put_many([{'timestamp': timestamp, 'sensor': 'sensor', 'target': 'target',
+                                            'power': 10} for timestamp in range(3)])
+
+    batches = list(database.iter(stream_mode=True).iter_batches(2))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert database.received_data_queue.empty()
+
+
+@pytest.mark.parametrize('server_mode', ['threaded', 'asyncio'])
+def test_socket_db_receive_length_prefixed_documents_of_several_clients(server_mode):
+    """
+    Test that the documents sent by several clients with the length-prefixed framing are all received.
+    """
+    with socket.socket() as free_socket:
+        free_socket.bind(('127.0.0.1', 0))
+        port = free_socket.getsockname()[1]
+
+    database = SocketDB(PowerReport, '127.0.0.1', port, server_mode=server_mode, framing='length-prefixed')
+    database.connect()
+
+    for client_id in range(3):
+        for _ in range(50):
+            try:
+                client = socket.create_connection(('127.0.0.1', port))
+                break
+            except ConnectionRefusedError:
+                time.sleep(0.01)
+        with client:
+            for timestamp in range(10):
+                payload = json.dumps({'timestamp': timestamp, 'sensor': 'sensor', 'target': f'target{client_id}',
+                                      'power': 10}).encode()
+                client.sendall(len(payload).to_bytes(4, 'big') + payload)
+
+    documents = []
+    while len(documents) < 30:
+        received_documents = database.received_data_queue.get_many(30, timeout=5)
+        assert received_documents
+        documents += received_documents
+
+    assert sorted((document['target'], document['timestamp']) for document in documents) == \
+        [(f'target{client_id}', timestamp) for client_id in range(3) for timestamp in range(10)]
+    database.disconnect()
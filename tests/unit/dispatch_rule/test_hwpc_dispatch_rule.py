@@ -257,3 +257,44 @@ def test_get_formula_id_cpu_rule_report_3(report_3):
     ids = HWPCDispatchRule(HWPCDepthLevel.CORE).get_formula_id(report_3)
     validate_formula_id(ids, [('toto', '1', '1'), ('toto', '1', '2'),
                               ('toto', '2', '3'), ('toto', '2', '4')])
+
+
+##################
+# TEST SIGNATURE #
+##################
+@pytest.mark.parametrize('depth', [HWPCDepthLevel.TARGET, HWPCDepthLevel.ROOT])
+def test_get_signature_of_target_and_root_rule_is_none(depth, report):
+    """
+    the formula id of the target and root rules is not cached
+    """
+    assert HWPCDispatchRule(depth).get_signature(report) is None
+
+
+@pytest.mark.parametrize('depth', [HWPCDepthLevel.SOCKET, HWPCDepthLevel.CORE])
+def test_get_signature_is_the_same_for_reports_with_the_same_topology(depth):
+    """
+    reports of the same sensor with the same sockets and cores have the same signature
+    """
+    rule = HWPCDispatchRule(depth)
+    other_report = create_report_root([GROUP_3, RAPL], timestamp=datetime.fromtimestamp(1), target='other')
+    assert rule.get_signature(REPORT_3_RAPL) == rule.get_signature(other_report)
+
+
+@pytest.mark.parametrize('depth', [HWPCDepthLevel.SOCKET, HWPCDepthLevel.CORE])
+def test_get_signature_differs_for_reports_of_other_sensors(depth):
+    """
+    reports of different sensors have different signatures
+    """
+    rule = HWPCDispatchRule(depth)
+    assert rule.get_signature(REPORT_3) != rule.get_signature(create_report_root([GROUP_3], sensor='titi'))
+
+
+def test_get_signature_of_cpu_rule_differs_for_reports_with_other_cores():
+    """
+    reports with different cores in the same sockets have different signatures with a rule that dispatch by cpu
+    """
+    rule = HWPCDispatchRule(HWPCDepthLevel.CORE)
+    other_cores_report = create_report_root([create_group_report('1', [create_socket_report('1', [CPU_1, CPU_3])])])
+    assert rule.get_signature(REPORT_2) != rule.get_signature(other_cores_report)
+    assert HWPCDispatchRule(HWPCDepthLevel.SOCKET).get_signature(REPORT_2) == \
+        HWPCDispatchRule(HWPCDepthLevel.SOCKET).get_signature(other_cores_report)
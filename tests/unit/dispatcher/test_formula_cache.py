@@ -0,0 +1,109 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from unittest.mock import Mock
+
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel
+from powerapi.dispatcher import DispatcherActor, RouteTable
+from powerapi.report import HWPCReport
+
+
+def create_report(sensor='sensor', cores=('0', '1')):
+    """
+    Create a HWPC report with two sockets containing the given cores and a RAPL group
+    """
+    groups = {
+        'core': {socket: {core: {'cpu': {'e0': 0}} for core in cores} for socket in ('0', '1')},
+        'rapl': {'0': {'0': {'RAPL_ENERGY_PKG': 0}}}
+    }
+    return HWPCReport(0, sensor, 'target', groups)
+
+
+def create_dispatcher_state(**kwargs):
+    """
+    Create the state of a dispatcher creating mocked formulas with a mocked supervisor
+    """
+    dispatcher = DispatcherActor('test_dispatcher', lambda name, pushers: Mock(), {}, RouteTable(), **kwargs)
+    dispatcher.state.supervisor = Mock()
+    return dispatcher.state
+
+
+def test_reports_with_the_same_topology_use_the_cached_formulas():
+    """
+    Test that the formulas of a report are reused for a report with the same topology without computing its ids
+    """
+    state = create_dispatcher_state()
+    rule = HWPCDispatchRule(HWPCDepthLevel.CORE)
+    formulas = state.get_report_formulas(rule, create_report())
+    assert len(formulas) == 4
+
+    rule.get_formula_id = Mock()
+    assert state.get_report_formulas(rule, create_report()) == formulas
+    rule.get_formula_id.assert_not_called()
+
+
+def test_reports_with_another_topology_use_other_formulas():
+    """
+    Test that a report with other cores is sent to its own formulas
+    """
+    state = create_dispatcher_state()
+    rule = HWPCDispatchRule(HWPCDepthLevel.CORE)
+    formulas = state.get_report_formulas(rule, create_report())
+
+    other_formulas = state.get_report_formulas(rule, create_report(cores=('0', '2')))
+
+    assert other_formulas[0] is formulas[0]
+    assert other_formulas[1] is not formulas[1]
+    assert len(state.formula_dict) == 6
+
+
+def test_evicting_a_formula_invalidate_the_cache():
+    """
+    Test that an evicted formula is not used anymore by the cached entries
+    """
+    state = create_dispatcher_state()
+    rule = HWPCDispatchRule(HWPCDepthLevel.SOCKET)
+    formulas = state.get_report_formulas(rule, create_report())
+
+    state.remove_formula(('sensor', '0'))
+
+    assert state.get_report_formulas(rule, create_report())[0] is not formulas[0]
+
+
+def test_cached_formulas_are_marked_as_used():
+    """
+    Test that the formulas given from the cache are moved to the end of the least recently used order
+    """
+    state = create_dispatcher_state(max_formulas=4)
+    rule = HWPCDispatchRule(HWPCDepthLevel.SOCKET)
+    state.get_report_formulas(rule, create_report())
+    state.get_report_formulas(rule, create_report(sensor='other'))
+    state.get_report_formulas(rule, create_report())
+
+    assert list(state.formula_dict) == [('other', '0'), ('other', '1'), ('sensor', '0'), ('sensor', '1')]
@@ -0,0 +1,163 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from time import sleep
+from unittest.mock import Mock
+
+from powerapi.dispatcher import DispatcherActor, FormulaWorkerActor, PooledFormula, RouteTable
+from powerapi.message import FormulaReportMessage, PoisonPillMessage
+from powerapi.dispatcher.handlers import FormulaDispatcherReportHandler, FormulaWorkerReportHandler
+
+
+def create_dispatcher_state(**kwargs):
+    """
+    Create the state of a dispatcher creating mocked formulas with a mocked supervisor
+    """
+    dispatcher = DispatcherActor('test_dispatcher', lambda name, pushers: Mock(), {}, RouteTable(), **kwargs)
+    dispatcher.state.supervisor = Mock()
+    return dispatcher.state
+
+
+def test_formulas_are_kept_without_eviction_policy():
+    """
+    Test that the formulas are never evicted by default
+    """
+    state = create_dispatcher_state()
+    state.get_formula(('sensor', '0'))
+    state.evict_idle_formulas()
+    assert list(state.formula_dict) == [('sensor', '0')]
+
+
+def test_idle_formula_is_soft_killed_and_removed():
+    """
+    Test that a formula receiving no report for the idle timeout is evicted
+    """
+    state = create_dispatcher_state(formula_idle_timeout=50)
+    formula = state.get_formula(('sensor', '0'))
+    sleep(0.1)
+    state.get_formula(('sensor', '1'))
+
+    state.evict_idle_formulas()
+
+    assert list(state.formula_dict) == [('sensor', '1')]
+    state.supervisor.kill_actor.assert_called_once_with(formula, soft=True)
+
+
+def test_used_formula_is_not_evicted():
+    """
+    Test that getting a formula resets its idle time
+    """
+    state = create_dispatcher_state(formula_idle_timeout=100)
+    state.get_formula(('sensor', '0'))
+    state.get_formula(('sensor', '1'))
+    sleep(0.06)
+    state.get_formula(('sensor', '0'))
+    sleep(0.06)
+
+    state.evict_idle_formulas()
+
+    assert list(state.formula_dict) == [('sensor', '0')]
+
+
+def test_idle_formula_is_evicted_while_no_report_is_received():
+    """
+    Test that the dispatcher timeout handler evicts the idle formulas, the actor timeout being bounded by the idle
+    timeout
+    """
+    dispatcher = DispatcherActor('test_dispatcher', lambda name, pushers: Mock(), {}, RouteTable(), timeout=1000,
+                                 formula_idle_timeout=50)
+    dispatcher.state.supervisor = Mock()
+    dispatcher.state.initialized = True
+    dispatcher.state.get_formula(('sensor', '0'))
+    sleep(0.1)
+
+    FormulaDispatcherReportHandler(dispatcher.state).handle_timeout()
+
+    assert dispatcher.socket_interface.timeout == 50
+    assert not dispatcher.state.formula_dict
+
+
+def test_least_recently_used_formula_is_evicted_when_max_formulas_is_reached():
+    """
+    Test that the least recently used formula is evicted to create a new formula beyond the limit
+    """
+    state = create_dispatcher_state(max_formulas=2)
+    state.get_formula(('sensor', '0'))
+    state.get_formula(('sensor', '1'))
+    state.get_formula(('sensor', '0'))
+    state.get_formula(('sensor', '2'))
+
+    assert list(state.formula_dict) == [('sensor', '0'), ('sensor', '2')]
+
+
+def test_evicted_formula_is_created_again_on_demand():
+    """
+    Test that an evicted formula is recreated when a report is dispatched to it
+    """
+    state = create_dispatcher_state(max_formulas=1)
+    formula = state.get_formula(('sensor', '0'))
+    state.get_formula(('sensor', '1'))
+
+    assert state.get_formula(('sensor', '0')) is not formula
+
+
+def test_formula_counters():
+    """
+    Test the counters of live, created and evicted formulas
+    """
+    state = create_dispatcher_state(max_formulas=2)
+    for formula_id in [('sensor', '0'), ('sensor', '1'), ('sensor', '2'), ('sensor', '0')]:
+        state.get_formula(formula_id)
+
+    assert state.get_formula_counters() == {'live': 2, 'created': 4, 'evicted': 2}
+
+
+def test_pooled_formula_soft_kill_send_a_poison_pill_to_its_worker():
+    """
+    Test that an evicted pooled formula asks its worker to remove it
+    """
+    worker = Mock()
+    PooledFormula(worker, ('sensor', '0'), 'test_dispatcher').soft_kill()
+
+    msg = worker.send_data.call_args.args[0]
+    assert msg.formula_id == ('sensor', '0')
+    assert isinstance(msg.report, PoisonPillMessage)
+
+
+def test_formula_worker_remove_the_formula_receiving_a_poison_pill():
+    """
+    Test that a formula worker removes a formula when it is evicted by the dispatcher
+    """
+    worker = FormulaWorkerActor('test_worker', lambda name, pushers: Mock(), {}, 'test_dispatcher')
+    worker.state.get_formula(('sensor', '0'))
+    handler = FormulaWorkerReportHandler(worker.state)
+
+    handler.handle(FormulaReportMessage('test_dispatcher', ('sensor', '0'), PoisonPillMessage()))
+
+    assert not worker.state.formulas
@@ -0,0 +1,166 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from multiprocessing import Pipe
+from unittest.mock import Mock
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel
+from powerapi.dispatcher import DispatcherActor, FormulaWorkerActor, PooledFormula, RouteTable
+from powerapi.message import FormulaReportMessage, PoisonPillMessage
+from powerapi.report import HWPCReport, PowerReport, RawReport
+from tests.unit.actor.abstract_test_actor import recv_from_pipe, start_actor, join_actor, PUSHER_NAME_POWER_REPORT
+from tests.utils.actor.dummy_actor import DummyActor
+from tests.utils.formula.dummy import DummyFormulaActor
+from tests.utils.report.hwpc import extract_rapl_reports_with_2_sockets
+
+DISPATCHER_NAME = 'test_dispatcher'
+
+
+def formula_factory(name, pushers):
+    """
+    Create a dummy formula
+    """
+    return DummyFormulaActor(name, pushers, 0, 0)
+
+
+def test_formula_worker_create_one_formula_instance_per_formula_id():
+    """
+    Test that a formula worker creates and set up a formula the first time its id is used
+    """
+    formula_init_function = Mock(side_effect=lambda name, pushers: Mock())
+    worker = FormulaWorkerActor('test_worker', formula_init_function, {}, DISPATCHER_NAME)
+
+    formula = worker.state.get_formula(('sensor', '0'))
+    assert worker.state.get_formula(('sensor', '0')) is formula
+    formula_init_function.assert_called_once_with(name=str((DISPATCHER_NAME, 'sensor', '0')), pushers={})
+    formula.setup.assert_called_once()
+
+    assert worker.state.get_formula(('sensor', '1')) is not formula
+    assert len(worker.state.formulas) == 2
+
+
+def test_pooled_formula_send_the_report_to_its_worker_with_the_formula_id():
+    """
+    Test that a pooled formula wraps the reports it receives for its worker
+    """
+    worker = Mock()
+    pooled_formula = PooledFormula(worker, ('sensor', '0'), DISPATCHER_NAME)
+
+    pooled_formula.send_data('report')
+
+    msg = worker.send_data.call_args.args[0]
+    assert isinstance(msg, FormulaReportMessage)
+    assert msg.formula_id == ('sensor', '0')
+    assert msg.report == 'report'
+
+
+@pytest.fixture(name='pipe')
+def power_report_pipe():
+    """
+    Return a pipe used by the dummy pusher to forward the power reports
+    """
+    pipe_in, pipe_out = Pipe()
+    yield pipe_in, pipe_out
+    pipe_in.close()
+    pipe_out.close()
+
+
+@pytest.fixture(name='pusher')
+def dummy_pusher(pipe):
+    """
+    Return a started dummy pusher
+    """
+    actor = DummyActor(PUSHER_NAME_POWER_REPORT, pipe[0], PowerReport)
+    start_actor(actor)
+    yield actor
+    if actor.is_alive():
+        actor.terminate()
+    join_actor(actor)
+
+
+@pytest.fixture(name='pooled_dispatcher')
+def started_pooled_dispatcher(pusher):
+    """
+    Return a started dispatcher hosting its target formulas in a pool of two workers
+    """
+    route_table = RouteTable()
+    route_table.add_dispatch_rule(HWPCReport, HWPCDispatchRule(HWPCDepthLevel.TARGET, primary=True))
+    dispatcher = DispatcherActor(DISPATCHER_NAME, formula_factory, {PUSHER_NAME_POWER_REPORT: pusher}, route_table,
+                                 formula_pool_size=2)
+    start_actor(dispatcher)
+    yield dispatcher
+    if dispatcher.is_alive():
+        dispatcher.send_control(PoisonPillMessage(soft=False, sender_name='system'))
+    join_actor(dispatcher)
+
+
+def test_pooled_dispatcher_send_each_report_to_its_formula(pooled_dispatcher, pipe):
+    """
+    Test that the formulas hosted by the workers handle the reports dispatched to them
+    """
+    reports = [HWPCReport.from_json(report) for report in extract_rapl_reports_with_2_sockets(16)]
+    for index, report in enumerate(reports):
+        report.target = f'target_{index % 8}'
+
+    expected_formula_names = []
+    for report in reports:
+        for formula_id in HWPCDispatchRule(HWPCDepthLevel.TARGET).get_formula_id(report):
+            expected_formula_names.append(str((DISPATCHER_NAME, *formula_id)))
+        pooled_dispatcher.send_data(report)
+
+    formula_names = []
+    for _ in expected_formula_names:
+        _, power_report = recv_from_pipe(pipe[1], 2)
+        assert isinstance(power_report, PowerReport)
+        formula_names.append(power_report.metadata['formula_name'])
+
+    assert sorted(formula_names) == sorted(expected_formula_names)
+    assert len(set(formula_names)) == 8
+
+
+def test_pooled_dispatcher_send_raw_reports_parsed_by_their_formula(pooled_dispatcher, pipe):
+    """
+    Test that the raw reports are dispatched on their routing fields and parsed by the formulas hosted by the workers
+    """
+    documents = extract_rapl_reports_with_2_sockets(4)
+    for index, document in enumerate(documents):
+        document['target'] = f'target_{index % 2}'
+        pooled_dispatcher.send_data(RawReport.from_document(HWPCReport, RawBSONDocument(bson.encode(document))))
+
+    formula_names = []
+    for _ in documents:
+        _, power_report = recv_from_pipe(pipe[1], 2)
+        assert isinstance(power_report, PowerReport)
+        formula_names.append(power_report.metadata['formula_name'])
+
+    assert sorted(formula_names) == sorted(str((DISPATCHER_NAME, f'target_{index % 2}')) for index in range(4))
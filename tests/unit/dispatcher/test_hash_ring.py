@@ -0,0 +1,68 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from powerapi.dispatcher import FormulaHashRing
+
+FORMULA_IDS = [('sensor', str(socket), str(core)) for socket in range(2) for core in range(32)]
+
+
+def test_get_worker_return_a_worker_index_of_the_ring():
+    """
+    Test that the formula ids are mapped onto the workers of the ring
+    """
+    ring = FormulaHashRing(4)
+    assert {ring.get_worker(formula_id) for formula_id in FORMULA_IDS} <= {0, 1, 2, 3}
+
+
+def test_get_worker_always_map_a_formula_id_onto_the_same_worker():
+    """
+    Test that a formula id is mapped onto the same worker by each ring of the same size
+    """
+    ring = FormulaHashRing(4)
+    other_ring = FormulaHashRing(4)
+    for formula_id in FORMULA_IDS:
+        assert ring.get_worker(formula_id) == ring.get_worker(formula_id) == other_ring.get_worker(formula_id)
+
+
+def test_get_worker_spread_the_formula_ids_over_all_the_workers():
+    """
+    Test that each worker of the ring hosts formulas
+    """
+    ring = FormulaHashRing(4)
+    assert {ring.get_worker(formula_id) for formula_id in FORMULA_IDS} == {0, 1, 2, 3}
+
+
+def test_adding_a_worker_only_move_formula_ids_to_the_new_worker():
+    """
+    Test that growing the ring keeps the other formula ids on their worker
+    """
+    ring = FormulaHashRing(4)
+    bigger_ring = FormulaHashRing(5)
+    for formula_id in FORMULA_IDS:
+        assert bigger_ring.get_worker(formula_id) in (ring.get_worker(formula_id), 4)
@@ -0,0 +1,140 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime
+
+import pytest
+
+from powerapi.filter import Filter, FilterUselessError
+from powerapi.report import PowerReport, HWPCReport, Report, RawReport
+
+
+def create_power_report(target):
+    """
+    Create a power report of the given target
+    """
+    return PowerReport(datetime(2024, 1, 1), 'sensor', target, 42.0)
+
+
+def test_route_report_type_rule_select_the_dispatchers_of_the_report_type_and_its_subclasses():
+    """
+    Test that a report type rule selects the reports of this type or of a subclass
+    """
+    report_filter = Filter()
+    report_filter.filter(HWPCReport, 'hwpc_dispatcher')
+    report_filter.filter(PowerReport, 'power_dispatcher')
+    report_filter.filter(Report, 'report_dispatcher')
+
+    assert report_filter.route(create_power_report('target')) == ['power_dispatcher', 'report_dispatcher']
+
+
+def test_route_evaluate_the_function_rules_in_the_order_of_the_filters():
+    """
+    Test that the function rules are evaluated for each report alongside the report type rules
+    """
+    report_filter = Filter()
+    report_filter.filter(lambda report: report.target == 'even', 'even_dispatcher')
+    report_filter.filter(PowerReport, 'power_dispatcher')
+
+    assert report_filter.route(create_power_report('even')) == ['even_dispatcher', 'power_dispatcher']
+    assert report_filter.route(create_power_report('odd')) == ['power_dispatcher']
+
+
+def test_route_use_the_filters_modified_after_the_compilation():
+    """
+    Test that the routing table is compiled again when a dispatcher of the filters is replaced
+    """
+    report_filter = Filter()
+    report_filter.filter(PowerReport, 'dispatcher')
+    assert report_filter.route(create_power_report('target')) == ['dispatcher']
+
+    report_filter.set_filter(0, PowerReport, 'processor')
+    assert report_filter.route(create_power_report('target')) == ['processor']
+
+
+def test_route_batch_group_the_reports_by_dispatcher():
+    """
+    Test that the reports of a batch are grouped by dispatcher in their order
+    """
+    report_filter = Filter()
+    report_filter.filter(lambda report: report.target == 'even', 'even_dispatcher')
+    report_filter.filter(PowerReport, 'power_dispatcher')
+    reports = [create_power_report(target) for target in ['even', 'odd', 'even']]
+
+    assert report_filter.route_batch(reports) == {'even_dispatcher': [reports[0], reports[2]],
+                                                  'power_dispatcher': reports}
+
+
+def test_route_without_filters_raise_exception():
+    """
+    Test that routing a report without filters raises a FilterUselessError
+    """
+    with pytest.raises(FilterUselessError):
+        Filter().route_batch([create_power_report('target')])
+
+
+def test_route_batch_of_reports_of_the_same_type_send_the_whole_batch_to_each_dispatcher():
+    """
+    Test that a batch of reports of the same type routed by report type rules is sent whole to each dispatcher
+    """
+    report_filter = Filter()
+    report_filter.filter(PowerReport, 'power_dispatcher')
+    report_filter.filter(HWPCReport, 'hwpc_dispatcher')
+    report_filter.filter(Report, 'report_dispatcher')
+    reports = [create_power_report(target) for target in ['a', 'b']]
+
+    assert report_filter.route_batch(reports) == {'power_dispatcher': reports, 'report_dispatcher': reports}
+
+
+def test_route_raw_report_as_a_report_of_the_type_of_its_payload():
+    """
+    Test that the report type rules select the raw reports according to the type of the report of their payload
+    """
+    report_filter = Filter()
+    report_filter.filter(HWPCReport, 'hwpc_dispatcher')
+    report_filter.filter(PowerReport, 'power_dispatcher')
+    raw_report = RawReport(datetime(2024, 1, 1), 'sensor', 'target', PowerReport, b'')
+
+    assert report_filter.route(raw_report) == ['power_dispatcher']
+    assert report_filter.route_batch([raw_report]) == {'power_dispatcher': [raw_report]}
+
+
+def test_dispatcher_of_several_accepting_rules_receive_each_report_once():
+    """
+    Test that a dispatcher selected by several rules receives a report once, with report type and function rules
+    """
+    report_filter = Filter()
+    report_filter.filter(PowerReport, 'dispatcher')
+    report_filter.filter(Report, 'dispatcher')
+    reports = [create_power_report(target) for target in ['even', 'odd']]
+    assert report_filter.route_batch(reports) == {'dispatcher': reports}
+
+    report_filter.filter(lambda report: report.target == 'even', 'function_dispatcher')
+    report_filter.filter(lambda report: report.target != 'odd', 'function_dispatcher')
+    assert report_filter.route(reports[0]) == ['dispatcher', 'function_dispatcher']
+    assert report_filter.route_batch(reports) == {'dispatcher': reports, 'function_dispatcher': [reports[0]]}
@@ -28,7 +28,6 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import logging
-import time
 from queue import Empty
 
 import pytest
@@ -111,6 +110,7 @@ class TestPusher(AbstractTestActorWithDB):
 
     @staticmethod
     @define_buffer_size(1)
+    @define_delay(2000)
     def test_send_one_report_to_pusher_with_1_sized_buffer_make_it_not_save_the_report(started_actor_with_db, fake_db):
         """
         Check that the pusher actor does not save a report when the buffer size is 1.
@@ -151,14 +151,26 @@ class TestPusher(AbstractTestActorWithDB):
 
     @staticmethod
     @define_delay(2000)
-    def test_send_two_report__with_two_second_between_messages_to_pusher_with_2_seconds_delay_make_it_save_the_report(started_actor_with_db, fake_db):
+    def test_send_two_report_to_pusher_with_2_seconds_delay_make_it_save_each_report_when_the_delay_expire(started_actor_with_db, fake_db):
         """
-        Check that the pusher actor saves the 2 reports when delay is 2 seconds and there is a 2 second sleep time between the 2 reports.
+        Check that the pusher actor saves each report once the delay of 2 seconds expired, without waiting for the
+        next report.
         """
         started_actor_with_db.send_data(REPORT1)
-        time.sleep(2)
+        assert fake_db.q.get(timeout=4) == [REPORT1]
         started_actor_with_db.send_data(REPORT2)
-        assert fake_db.q.get(timeout=1) == [REPORT1, REPORT2]
+        assert fake_db.q.get(timeout=4) == [REPORT2]
+
+    @staticmethod
+    @define_delay(500)
+    def test_send_one_report_to_pusher_make_it_save_the_report_when_the_delay_expire_without_new_report(started_actor_with_db, fake_db):
+        """
+        Check that the pusher actor saves a buffered report once the delay expired even if no other report is received.
+        """
+        started_actor_with_db.send_data(REPORT1)
+        with pytest.raises(Empty):
+            fake_db.q.get(timeout=0.2)
+        assert fake_db.q.get(timeout=1) == [REPORT1]
 
     @staticmethod
     @define_buffer_size(1)
@@ -169,3 +181,14 @@ class TestPusher(AbstractTestActorWithDB):
         started_actor_with_db.send_data(REPORT2)
         started_actor_with_db.send_data(REPORT1)
         assert fake_db.q.get(timeout=1) == [REPORT1, REPORT2]
+
+
+class TestWriteBehindPusher(TestPusher):
+    """
+    Class for testing PusherActor writing its buffers from a background thread
+    """
+
+    @pytest.fixture
+    def actor_with_db(self, fake_db, delay, buffer_size):
+        return PusherActor('pusher_test', Report, fake_db, logging.DEBUG, delay=delay, max_size=buffer_size,
+                           write_behind=True)
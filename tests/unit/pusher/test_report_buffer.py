@@ -0,0 +1,146 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime
+
+import pytest
+
+from powerapi.pusher import ReportBuffer, UnknownLateReportPolicyException
+from powerapi.report import Report
+
+
+def create_report(second, target='target'):
+    """
+    Create a report of the given second and target
+    """
+    return Report(datetime.fromtimestamp(second), 'sensor', target)
+
+
+def test_create_buffer_with_unknown_policy_raise_exception():
+    """
+    Test that creating a buffer with an unknown late report policy raise an UnknownLateReportPolicyException
+    """
+    with pytest.raises(UnknownLateReportPolicyException):
+        ReportBuffer(late_report_policy='unknown')
+
+
+def test_drain_merge_the_reports_of_each_source_by_timestamp():
+    """
+    Test that the runs of reports of several sources are merged in timestamp order
+    """
+    buffer = ReportBuffer()
+    buffer.extend([create_report(1, 'a'), create_report(3, 'a'), create_report(0, 'b'), create_report(2, 'b'),
+                   create_report(4, 'a')])
+
+    assert len(buffer) == 5
+    assert buffer.drain() == [create_report(0, 'b'), create_report(1, 'a'), create_report(2, 'b'),
+                              create_report(3, 'a'), create_report(4, 'a')]
+    assert len(buffer) == 0
+    assert buffer.drain() == []
+
+
+def test_report_late_in_its_source_is_reordered_without_window():
+    """
+    Test that a report older than the last report of its source is put at its place when there is no window
+    """
+    buffer = ReportBuffer()
+    buffer.extend([create_report(1), create_report(100), create_report(50)])
+
+    assert buffer.drain() == [create_report(1), create_report(50), create_report(100)]
+
+
+def test_report_late_within_window_is_reordered():
+    """
+    Test that a report late by less than the reorder window is put at its place
+    """
+    buffer = ReportBuffer(reorder_window=2000)
+    buffer.extend([create_report(1), create_report(3), create_report(2)])
+
+    assert buffer.drain() == [create_report(1), create_report(2), create_report(3)]
+
+
+def test_report_late_past_window_is_written_after_the_ordered_reports():
+    """
+    Test that a report late by more than the reorder window is written without being reordered with the write
+    policy
+    """
+    buffer = ReportBuffer(reorder_window=2000, late_report_policy='write')
+    buffer.extend([create_report(1), create_report(10), create_report(2), create_report(11)])
+
+    assert buffer.drain() == [create_report(1), create_report(10), create_report(11), create_report(2)]
+
+
+def test_report_late_past_window_is_dropped_with_drop_policy():
+    """
+    Test that a report late by more than the reorder window is dropped with the drop policy
+    """
+    buffer = ReportBuffer(reorder_window=2000, late_report_policy='drop')
+    buffer.extend([create_report(1), create_report(10), create_report(2)])
+
+    assert len(buffer) == 2
+    assert buffer.dropped_reports_count == 1
+    assert buffer.drain() == [create_report(1), create_report(10)]
+
+
+def test_lateness_is_computed_from_the_reports_already_drained():
+    """
+    Test that a report is late compared to the last report of its source even if this report was already drained
+    """
+    buffer = ReportBuffer(reorder_window=2000, late_report_policy='drop')
+    buffer.append(create_report(10))
+    buffer.drain()
+
+    buffer.extend([create_report(2), create_report(9)])
+
+    assert buffer.drain() == [create_report(9)]
+
+
+def test_requeued_reports_are_not_checked_against_the_window():
+    """
+    Test that drained reports put back in the buffer are kept even if they are late compared to the last reports
+    """
+    buffer = ReportBuffer(reorder_window=2000, late_report_policy='drop')
+    buffer.extend([create_report(1), create_report(2)])
+    reports = buffer.drain()
+    buffer.append(create_report(10))
+
+    buffer.requeue(reports)
+
+    assert buffer.dropped_reports_count == 0
+    assert buffer.drain() == [create_report(1), create_report(2), create_report(10)]
+
+
+def test_last_timestamps_older_than_the_window_are_forgotten():
+    """
+    Test that the last timestamp of a source is forgotten once it is older than the window
+    """
+    buffer = ReportBuffer(reorder_window=2000)
+    buffer.extend([create_report(1, 'a'), create_report(2, 'b'), create_report(10, 'b')])
+    buffer.drain()
+
+    assert list(buffer.last_timestamps) == [('sensor', 'b')]
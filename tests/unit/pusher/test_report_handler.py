@@ -0,0 +1,143 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from powerapi.pusher.handlers import ReportHandler
+from powerapi.pusher.pusher_actor import PusherState
+from powerapi.report import Report
+
+
+def create_report(second):
+    """
+    Create a report of the given second
+    """
+    return Report(datetime.fromtimestamp(second), 'sensor', 'target')
+
+
+@pytest.fixture(name='state')
+def initialized_state():
+    """
+    Return an initialized pusher state saving its reports in a mock database
+    """
+    pusher_state = PusherState(Mock(), Mock(), Report)
+    pusher_state.initialized = True
+    return pusher_state
+
+
+def test_handle_timeout_with_expired_delay_save_the_buffered_reports(state):
+    """
+    Check that the buffer is written when the pusher timeout occurs after the delay expired
+    """
+    handler = ReportHandler(state, delay=0, max_size=50)
+    state.buffer.append(create_report(1))
+
+    handler.handle_timeout()
+
+    state.database.save_many.assert_called_once_with([create_report(1)])
+    assert len(state.buffer) == 0
+
+
+def test_handle_timeout_before_delay_expire_keep_the_buffered_reports(state):
+    """
+    Check that the buffer is kept when the pusher timeout occurs before the delay expired
+    """
+    handler = ReportHandler(state, delay=10000, max_size=50)
+    state.buffer.append(create_report(1))
+
+    handler.handle_timeout()
+
+    state.database.save_many.assert_not_called()
+    assert state.buffer.drain() == [create_report(1)]
+
+
+def test_handle_timeout_with_empty_buffer_does_not_save_anything(state):
+    """
+    Check that nothing is written when the delay expired with an empty buffer
+    """
+    handler = ReportHandler(state, delay=0, max_size=50)
+
+    handler.handle_timeout()
+
+    state.database.save_many.assert_not_called()
+
+
+def test_max_size_is_fixed_without_limit(state):
+    """
+    Check that max_size does not change when no limit is given
+    """
+    handler = ReportHandler(state, delay=10000, max_size=2)
+
+    handler.handle_batch([create_report(second) for second in range(3)])
+
+    assert handler.max_size == 2
+
+
+def test_full_buffer_double_max_size_up_to_its_limit(state):
+    """
+    Check that max_size is doubled each time the buffer is full without exceeding its limit
+    """
+    handler = ReportHandler(state, delay=10000, max_size=2, max_size_limit=6)
+
+    handler.handle_batch([create_report(second) for second in range(3)])
+    assert handler.max_size == 4
+
+    handler.handle_batch([create_report(second) for second in range(5)])
+    assert handler.max_size == 6
+
+
+def test_expired_delay_with_small_buffer_halve_max_size_down_to_its_initial_value(state):
+    """
+    Check that max_size is halved each time the delay expire with a buffer filled at less than half
+    """
+    handler = ReportHandler(state, delay=0, max_size=2, max_size_limit=16)
+    handler.max_size = 8
+
+    handler.handle_timeout()
+    assert handler.max_size == 4
+
+    handler.handle_batch([create_report(1)])
+    assert handler.max_size == 2
+
+    handler.handle_timeout()
+    assert handler.max_size == 2
+
+
+def test_expired_delay_with_half_filled_buffer_keep_max_size(state):
+    """
+    Check that max_size is kept when the delay expire with a buffer filled at least at half
+    """
+    handler = ReportHandler(state, delay=0, max_size=2, max_size_limit=16)
+    handler.max_size = 8
+
+    handler.handle_batch([create_report(second) for second in range(4)])
+
+    assert handler.max_size == 8
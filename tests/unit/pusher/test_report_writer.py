@@ -0,0 +1,191 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import logging
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+from powerapi.pusher import ReportWriter, UnknownFullQueuePolicyException
+from powerapi.report import Report
+
+
+class BlockingDB:
+    """
+    Database saving the reports only once it is unblocked
+    """
+
+    def __init__(self):
+        self.unblocked = threading.Event()
+        self.saved_buffers = []
+
+    def save_many(self, reports):
+        """
+        Wait for the database to be unblocked and save the reports
+        """
+        self.unblocked.wait()
+        self.saved_buffers.append(reports)
+
+
+class FailingDB(BlockingDB):
+    """
+    Database failing to save its first buffer, it is unblocked by this failure
+    """
+
+    def save_many(self, reports):
+        """
+        Raise a connection error on the first call, save the reports once unblocked on the next ones
+        """
+        if not self.saved_buffers and not self.unblocked.is_set():
+            self.unblocked.set()
+            raise ConnectionError('database unreachable')
+        super().save_many(reports)
+
+
+def create_buffer(second):
+    """
+    Create a buffer containing a report of the given second
+    """
+    return [Report(datetime.fromtimestamp(second), 'sensor', 'target')]
+
+
+@pytest.fixture(name='database')
+def blocked_database():
+    """
+    Return a blocked database
+    """
+    return BlockingDB()
+
+
+def fill_writer(writer, buffer_count):
+    """
+    Start the writer and give it buffer_count buffers while its database is blocked
+    """
+    writer.start()
+    for second in range(buffer_count):
+        writer.write(create_buffer(second))
+
+
+def test_create_writer_with_unknown_policy_raise_exception(database):
+    """
+    Test that an unknown full queue policy is refused
+    """
+    with pytest.raises(UnknownFullQueuePolicyException):
+        ReportWriter(database, logging.getLogger(), policy='ignore')
+
+
+def test_writer_save_the_buffers_in_order(database):
+    """
+    Test that the buffers are saved in the order they are given, with their reports in order
+    """
+    writer = ReportWriter(database, logging.getLogger())
+    writer.start()
+    writer.write(create_buffer(2) + create_buffer(1))
+    writer.write(create_buffer(0))
+    database.unblocked.set()
+    writer.close()
+
+    assert database.saved_buffers == [create_buffer(2) + create_buffer(1), create_buffer(0)]
+
+
+def test_drop_oldest_policy_drop_the_oldest_waiting_buffer(database):
+    """
+    Test that the oldest waiting buffer is dropped when the queue is full
+    """
+    writer = ReportWriter(database, logging.getLogger(), queue_size=2, policy='drop-oldest')
+    fill_writer(writer, 5)
+    database.unblocked.set()
+    writer.close()
+
+    assert writer.dropped_buffers_count > 0
+    assert database.saved_buffers[-2:] == [create_buffer(3), create_buffer(4)]
+    assert len(database.saved_buffers) == 5 - writer.dropped_buffers_count
+
+
+def test_spill_policy_write_all_the_buffers_in_order(database, tmp_path):
+    """
+    Test that the spilled buffers are saved after the waiting buffers, in order
+    """
+    writer = ReportWriter(database, logging.getLogger(), queue_size=2, policy='spill', spill_dir=str(tmp_path))
+    fill_writer(writer, 6)
+    assert len(list(tmp_path.iterdir())) > 0
+
+    database.unblocked.set()
+    writer.close()
+
+    assert database.saved_buffers == [create_buffer(second) for second in range(6)]
+    assert not list(tmp_path.iterdir())
+
+
+def test_block_policy_wait_for_a_free_place_in_the_queue(database):
+    """
+    Test that the block policy waits for the writer to free a place in the queue
+    """
+    writer = ReportWriter(database, logging.getLogger(), queue_size=1, policy='block')
+    fill_writer(writer, 2)
+
+    third_write = threading.Thread(target=writer.write, args=(create_buffer(2),))
+    third_write.start()
+    third_write.join(0.2)
+    assert third_write.is_alive()
+
+    database.unblocked.set()
+    third_write.join(1)
+    writer.close()
+
+    assert database.saved_buffers == [create_buffer(second) for second in range(3)]
+
+
+def test_writer_keeps_running_when_the_database_fails():
+    """
+    Test that a database error is logged and does not stop the writer
+    """
+    failing_database = FailingDB()
+    writer = ReportWriter(failing_database, logging.getLogger(), timeout=1000)
+    fill_writer(writer, 2)
+    writer.close()
+
+    assert not writer.is_alive()
+    assert failing_database.saved_buffers == [create_buffer(1)]
+
+
+def test_close_remove_the_temporary_spill_dir(database):
+    """
+    Test that the spill directory created by the writer is removed once the spilled buffers are saved
+    """
+    writer = ReportWriter(database, logging.getLogger(), queue_size=1, policy='spill')
+    fill_writer(writer, 4)
+    spill_dir = writer.spill_dir
+
+    database.unblocked.set()
+    writer.close()
+
+    assert not os.path.exists(spill_dir)
@@ -311,3 +311,20 @@ def test_to_prometheus_return_subset_metadata_as_tags_for_report_with_nested_met
 
     assert prometheus_document['tags']['sensor'] == power_report_with_nested_metadata.sensor
     assert prometheus_document['tags']['target'] == power_report_with_nested_metadata.target
+
+
+def test_generate_tags_of_reports_with_same_metadata_keys_use_cached_tags_name():
+    """
+    Test that the sanitized tags name of reports having the same metadata keys are computed only once.
+    """
+    first_report = PowerReport(datetime.now(), 'sensor', 'target', 10, {'app.name': 'first', 'socket': 0})
+    second_report = PowerReport(datetime.now(), 'sensor', 'target', 11, {'app.name': 'second', 'socket': 1})
+
+    cache_info = PowerReport.get_tags_name_cache_info()
+    first_tags = first_report.generate_tags(['app_name'])
+    second_tags = second_report.generate_tags(['app_name'])
+
+    assert first_tags == {'sensor': 'sensor', 'target': 'target', 'app_name': 'first'}
+    assert second_tags == {'sensor': 'sensor', 'target': 'target', 'app_name': 'second'}
+    assert PowerReport.get_tags_name_cache_info().misses <= cache_info.misses + 1
+    assert PowerReport.get_tags_name_cache_info().hits >= cache_info.hits + 1
@@ -0,0 +1,111 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import pickle
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+
+from powerapi.dispatch_rule import HWPCDispatchRule, HWPCDepthLevel
+from powerapi.report import HWPCReport, PowerReport, BadInputData, RawReport, get_report_type
+from tests.utils.report.hwpc import extract_rapl_reports_with_2_sockets
+
+
+def create_raw_report(document: dict, report_type=HWPCReport) -> RawReport:
+    """
+    Create the raw report of the BSON encoding of a document
+    """
+    return RawReport.from_document(report_type, RawBSONDocument(bson.encode(document)))
+
+
+def test_parse_raw_report_return_the_report_of_its_bson_payload():
+    document = extract_rapl_reports_with_2_sockets(1)[0]
+    raw_report = create_raw_report(document)
+
+    assert raw_report.sensor == document['sensor']
+    assert raw_report.target == document['target']
+    assert raw_report.payload == bson.encode(document)
+    assert raw_report.parse() == HWPCReport.from_mongodb(document)
+
+
+def test_parse_raw_report_keep_the_metadata_updated_after_its_creation():
+    document = {'timestamp': 1000, 'sensor': 'sensor', 'target': 'target', 'power': 42.0, 'metadata': {'scope': 'cpu'}}
+    raw_report = create_raw_report(document, PowerReport)
+    raw_report.metadata['k8s'] = 'pod'
+
+    assert raw_report.parse() == PowerReport.from_mongodb(dict(document, metadata={'scope': 'cpu', 'k8s': 'pod'}))
+
+
+def test_raw_report_groups_contain_the_sockets_and_cores_without_the_events():
+    document = extract_rapl_reports_with_2_sockets(1)[0]
+    raw_report = create_raw_report(document)
+
+    assert raw_report.groups == {group_name: {socket_id: dict.fromkeys(cores) for socket_id, cores in group.items()}
+                                 for group_name, group in document['groups'].items()}
+
+
+def test_pickled_raw_report_does_not_contain_its_decoded_groups():
+    raw_report = create_raw_report(extract_rapl_reports_with_2_sockets(1)[0])
+    groups = raw_report.groups
+
+    unpickled_report = pickle.loads(pickle.dumps(raw_report))
+
+    assert unpickled_report == raw_report
+    assert unpickled_report._groups is None
+    assert unpickled_report.groups == groups
+
+
+@pytest.mark.parametrize('depth', list(HWPCDepthLevel))
+def test_hwpc_dispatch_rule_return_the_same_formula_ids_for_the_raw_and_parsed_report(depth):
+    raw_report = create_raw_report(extract_rapl_reports_with_2_sockets(1)[0])
+    dispatch_rule = HWPCDispatchRule(depth)
+
+    assert dispatch_rule.get_formula_id(raw_report) == dispatch_rule.get_formula_id(raw_report.parse())
+    assert dispatch_rule.get_signature(raw_report) == dispatch_rule.get_signature(raw_report.parse())
+
+
+def test_create_raw_report_without_sensor_field_raise_BadInputData():
+    document = extract_rapl_reports_with_2_sockets(1)[0]
+    del document['sensor']
+    with pytest.raises(BadInputData):
+        create_raw_report(document)
+
+
+def test_parse_raw_report_with_malformed_payload_raise_BadInputData():
+    raw_report = create_raw_report(extract_rapl_reports_with_2_sockets(1)[0])
+    raw_report.payload = raw_report.payload[:-1]
+    with pytest.raises(BadInputData):
+        raw_report.parse()
+
+
+def test_get_report_type_of_raw_report_return_the_type_of_its_payload():
+    raw_report = create_raw_report(extract_rapl_reports_with_2_sockets(1)[0])
+
+    assert get_report_type(raw_report) is HWPCReport
+    assert get_report_type(raw_report.parse()) is HWPCReport
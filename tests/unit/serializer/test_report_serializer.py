@@ -0,0 +1,134 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from datetime import datetime
+
+import pytest
+
+from powerapi.report import HWPCReport, PowerReport, ProcfsReport
+from powerapi.serializer import ReportSerializer, PickleSerializer, UnknownSerializerException, get_serializer
+from tests.utils.report.hwpc import gen_HWPCReports
+
+
+@pytest.fixture(name='serializer')
+def report_serializer():
+    """
+    Return a report serializer
+    """
+    return ReportSerializer()
+
+
+def check_round_trip(serializer, msg):
+    """
+    Serialize and deserialize the given message and check that the result has the same attributes
+    """
+    result = serializer.loads(serializer.dumps(msg))
+    assert type(result) is type(msg)
+    assert result.__dict__ == msg.__dict__
+
+
+def test_get_serializer_return_registered_serializer():
+    """
+    Test that the serializers are retrieved by their registered name
+    """
+    assert isinstance(get_serializer('pickle'), PickleSerializer)
+    assert isinstance(get_serializer('report'), ReportSerializer)
+
+
+def test_get_unknown_serializer_raise_exception():
+    """
+    Test that retrieving a serializer that is not registered raise an exception
+    """
+    with pytest.raises(UnknownSerializerException):
+        get_serializer('unknown')
+
+
+def test_hwpc_report_round_trip(serializer):
+    """
+    Test that HWPC reports are restored with the same attributes
+    """
+    for report in gen_HWPCReports(5):
+        check_round_trip(serializer, report)
+
+
+def test_hwpc_report_is_not_pickled(serializer):
+    """
+    Test that HWPC reports are serialized with the compact layout
+    """
+    report = gen_HWPCReports(1)[0]
+    assert serializer.dumps(report)[0] != PickleSerializer().dumps(report)[0]
+
+
+def test_hwpc_report_with_dispatcher_report_id_round_trip(serializer):
+    """
+    Test that the dispatcher report id is restored
+    """
+    report = gen_HWPCReports(1)[0]
+    report.dispatcher_report_id = 42
+    check_round_trip(serializer, report)
+
+
+def test_power_report_round_trip(serializer):
+    """
+    Test that Power reports are restored with the same attributes
+    """
+    report = PowerReport(datetime(2020, 1, 1, 12, 30, 15, 123456), 'pytest', 'test', 42.5,
+                         {'socket': 0, 'k8s': {'app': 'test'}})
+    check_round_trip(serializer, report)
+
+
+def test_procfs_report_round_trip(serializer):
+    """
+    Test that Procfs reports are restored with the same attributes
+    """
+    report = ProcfsReport(datetime(2020, 1, 1), 'pytest', 'test', {'firefox_cgroup': 8.36}, 27.61)
+    check_round_trip(serializer, report)
+
+
+def test_report_with_unsupported_metadata_fallback_to_pickle(serializer):
+    """
+    Test that a report with metadata that can't be encoded by the compact layout is pickled
+    """
+    report = PowerReport(datetime(2020, 1, 1), 'pytest', 'test', 42, {'date': datetime(2020, 1, 1)})
+    assert serializer.dumps(report) == PickleSerializer().dumps(report)
+    check_round_trip(serializer, report)
+
+
+def test_report_without_timestamp_fallback_to_pickle(serializer):
+    """
+    Test that a report without timestamp is pickled
+    """
+    check_round_trip(serializer, HWPCReport.create_empty_report())
+
+
+def test_other_message_fallback_to_pickle(serializer):
+    """
+    Test that messages other than the supported reports are pickled
+    """
+    assert serializer.loads(serializer.dumps('toto')) == 'toto'
@@ -51,8 +51,8 @@ class DummyActor(Actor):
     Actor that forward all start message (except StartMessage) into a pipe to the test process
     """
 
-    def __init__(self, name: str, pipe, message_type):
-        Actor.__init__(self, name)
+    def __init__(self, name: str, pipe, message_type, execution_mode='process'):
+        Actor.__init__(self, name, execution_mode=execution_mode)
         self.state = DummyActorState(self, pipe)
         self.message_type = message_type
 
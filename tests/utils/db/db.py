@@ -67,6 +67,9 @@ class FakeDB(BaseDB):
     def connect(self):
         self.q.put('connected', block=False)
 
+    def disconnect(self):
+        pass
+
     def iter(self, stream_mode: bool = False):
         return iter(self._content)
 
@@ -92,6 +95,9 @@ class SilentFakeDB(BaseDB):
     def connect(self):
         pass
 
+    def disconnect(self):
+        pass
+
     def iter(self, stream_mode: bool = False):
         return iter(self._content)
 
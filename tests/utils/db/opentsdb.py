@@ -0,0 +1,63 @@
+# Copyright (c) 2026, Inria
+# Copyright (c) 2026, University of Lille
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+import json
+from http.server import BaseHTTPRequestHandler
+
+
+class FakeOpenTSDBRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answer the requests of the HTTP API used by the OpenTSDB database
+    """
+
+    def do_GET(self):
+        """
+        Answer the version requests
+        """
+        self.send_response(200 if self.path == '/api/version' else 404)
+        self.end_headers()
+
+    def do_POST(self):
+        """
+        Store the data points of the put requests, the first *failures_count* requests fail
+        """
+        payload = self.rfile.read(int(self.headers['Content-Length']))
+        server = self.server
+        with server.lock:
+            failed = server.failures_count > 0
+            if failed:
+                server.failures_count -= 1
+            else:
+                server.payloads.append(json.loads(payload))
+        self.send_response(500 if failed else 204)
+        self.end_headers()
+
+    def log_message(self, *args):
+        """
+        Don't log the requests
+        """
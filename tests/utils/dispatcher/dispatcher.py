@@ -82,6 +82,10 @@ class FakeDispatcher(DispatcherActor):
     def send_data(self, msg):
         self.data_mailbox.put(msg)
 
+    def send_data_many(self, msgs):
+        for msg in msgs:
+            self.data_mailbox.put(msg)
+
     def receive_data(self, timeout=None):
         """
         Remove and returns the last data message received by the dispatcher.